@@ -1,22 +1,55 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QMessageBox, QGridLayout, QTableWidget,
-    QTableWidgetItem, QHeaderView, QComboBox, QDialog, QDoubleSpinBox
+    QTableWidgetItem, QHeaderView, QComboBox, QDialog, QDoubleSpinBox, QDateEdit
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QDate, QTimer
 from PyQt5.QtGui import QFont, QColor
+from data_tasks import AsyncDataManager
+from order_table import ORDER_STATUSES, OrderTableModel, OrderTableView
 from ui_helpers import BaseDashboard, RegistrationDialog
+from user_table import UserTableModel, UserTableView
+
+SCHEDULE_STATUSES = ["Scheduled", "In Progress", "Completed", "Cancelled"]
+ANALYTICS_GROUPINGS = {
+    "Day": 'day',
+    "Week": 'week',
+    "Month": 'month',
+    "Item Type": 'item',
+    "Customer": 'customer',
+    "Year over Year": None
+}
 
 
 class AdminDashboard(BaseDashboard):
+    PAGE_SIZE = 50
+    SEARCH_DELAY = 200
+    SEARCH_LIMIT = 1000
+
     def __init__(self, data_manager, parent_app=None):
         super().__init__("Admin Dashboard", parent_app)
         self.dm = data_manager
+        self.tasks = AsyncDataManager(data_manager)
         self.user_table = None
+        self.user_model = None
+        self.user_query = ""
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY)
+        self.search_timer.timeout.connect(self.populate_user_table)
         self.order_table = None
+        self.order_model = None
+        self.order_page = []
+        self.order_cursors = [None]
+        self.order_next_cursor = None
+        self.pickup_table = None
+        self.pickup_page = []
+        self.pickup_cursors = [None]
+        self.pickup_next_cursor = None
+        self.report_fields = {}
+        self.analytics_table = None
         self.init_sidebar()
-        self.dm.user_data_changed.connect(lambda: self.refresh_active_view(['manage_users']))
-        self.dm.order_updated.connect(lambda: self.refresh_active_view(['view_orders', 'system_reports']))
+        self.watch_changes(data_manager)
         self.show_screen('manage_users', self.create_manage_users_screen)
 
     def init_sidebar(self):
@@ -46,6 +79,9 @@ class AdminDashboard(BaseDashboard):
         self.buttons['system_reports'] = self.create_nav_button("System Reports", 'system_reports',
                                                                 lambda: self.show_screen('system_reports',
                                                                                          self.create_system_reports_screen), icon="📈")
+        self.buttons['analytics'] = self.create_nav_button("Analytics", 'analytics',
+                                                           lambda: self.show_screen('analytics',
+                                                                                    self.create_analytics_screen), icon="📊")
 
         for btn in self.buttons.values():
             sidebar_layout.addWidget(btn)
@@ -61,21 +97,89 @@ class AdminDashboard(BaseDashboard):
 
         self.main_h_layout.addWidget(sidebar)
 
-    def refresh_active_view(self, keys):
+    def refresh_screen(self, screen_key):
+        if screen_key == 'manage_users':
+            self.populate_user_table()
+        elif screen_key == 'view_orders':
+            self.load_order_page()
+        elif screen_key == 'manage_pickup':
+            self.load_pickup_page()
+        elif screen_key == 'system_reports':
+            self.update_report_counts()
+            self.reload_report_totals()
+        elif screen_key == 'analytics':
+            self.load_analytics()
+
+    def apply_changes(self, batch):
         try:
-            current_key = next((k for k, btn in self.buttons.items() if 'ffcdd2' in btn.styleSheet()), None)
-            if current_key in keys:
-                if current_key == 'manage_users':
-                    self.populate_user_table()
-                elif current_key == 'view_orders':
-                    self.show_screen('view_orders', self.create_view_orders_screen)
-                elif current_key == 'manage_pickup':
-                    self.show_screen('manage_pickup', self.create_manage_pickup_screen)
-                elif current_key == 'system_reports':
-                    self.show_screen('system_reports', self.create_system_reports_screen)
+            screen = self.active_screen()
+            if screen == 'manage_users':
+                self.apply_user_changes(batch)
+            elif screen == 'view_orders':
+                self.apply_order_changes(batch)
+            elif screen == 'manage_pickup':
+                self.apply_pickup_changes(batch)
+            elif screen == 'system_reports':
+                self.apply_report_changes(batch)
+            elif screen == 'analytics' and ('orders' in batch.reloads or batch.touches('order')):
+                self.load_analytics()
+            self.mark_stale(self.affected_screens(batch))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh view: {str(e)}")
 
+    def affected_screens(self, batch):
+        keys = set()
+        if 'users' in batch.reloads or batch.touches('user'):
+            keys.update(['manage_users', 'system_reports'])
+        if 'orders' in batch.reloads or batch.touches('order'):
+            keys.update(['view_orders', 'system_reports', 'analytics'])
+        if 'orders' in batch.reloads or batch.touches('schedule'):
+            keys.update(['manage_pickup', 'system_reports'])
+        return keys
+
+    def apply_user_changes(self, batch):
+        if 'users' in batch.reloads:
+            self.refresh_active_view(['manage_users'])
+            return
+        for user_id in batch.removed['user']:
+            self.user_model.remove_user(user_id)
+        for user_id in list(batch.changed['user']) + list(batch.added['user']):
+            role, data = self.dm.users.get_by_id(user_id)
+            if data and self.dm.users.matches(data, self.user_query):
+                self.user_model.upsert_user(self.dm.users.flat_user(role, data))
+            else:
+                self.user_model.remove_user(user_id)
+
+    def apply_order_changes(self, batch):
+        if 'orders' in batch.reloads or (batch.added['order'] and len(self.order_cursors) == 1) or \
+                any(self.order_model.row_of(order_id) is not None for order_id in batch.removed['order']):
+            self.load_order_page()
+            return
+        for order_id in batch.changed['order']:
+            self.order_model.refresh_order(order_id)
+
+    def apply_pickup_changes(self, batch):
+        if 'orders' in batch.reloads or (batch.added['schedule'] and len(self.pickup_cursors) == 1) or \
+                any(schedule['ID'] in batch.removed['schedule'] for schedule in self.pickup_page):
+            self.load_pickup_page()
+            return
+        changed = batch.changed['schedule']
+        if changed:
+            for row, schedule in enumerate(self.pickup_page):
+                if schedule['ID'] in changed:
+                    self.set_pickup_row(self.pickup_table, row, schedule)
+
+    def apply_report_changes(self, batch):
+        if 'orders' in batch.reloads:
+            self.refresh_active_view(['system_reports'])
+            return
+        if 'users' in batch.reloads or batch.touches('user'):
+            self.update_report_counts()
+        if batch.added['order'] or batch.removed['order'] or batch.added['schedule'] or batch.removed['schedule'] or \
+                any(fields is None or 'Total' in fields for fields in batch.changed['order'].values()) or \
+                any(fields is None or 'Status' in fields for fields in batch.changed['schedule'].values()):
+            self.reload_report_totals()
+
     def create_manage_users_screen(self):
         container = QWidget()
         layout = QVBoxLayout(container)
@@ -87,10 +191,10 @@ class AdminDashboard(BaseDashboard):
         search_label = QLabel("Search:")
         search_label.setFont(QFont('Arial', 10))
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search by name or email")
+        self.search_input.setPlaceholderText("Search by name, email, contact or address")
         self.search_input.setFixedHeight(30)
         self.search_input.setStyleSheet("border: 1px solid #ccc; border-radius: 4px; padding: 5px;")
-        self.search_input.textChanged.connect(self.filter_user_table)
+        self.search_input.textChanged.connect(self.search_timer.start)
         add_btn = QPushButton("Add User")
         add_btn.setFixedSize(120, 30)
         add_btn.setStyleSheet(
@@ -101,69 +205,41 @@ class AdminDashboard(BaseDashboard):
         search_layout.addWidget(add_btn)
         layout.addLayout(search_layout)
 
-        self.user_table = QTableWidget()
-        headers = ["Name", "Contact", "Role", "Email", "Address", "Actions"]
-        self.user_table.setColumnCount(len(headers))
-        self.user_table.setHorizontalHeaderLabels(headers)
-        self.user_table.setFont(QFont('Arial', 9))
-        header = self.user_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)
+        self.search_status = QLabel("")
+        self.search_status.setFont(QFont('Arial', 9))
+        self.search_status.setStyleSheet("color: #666666;")
+        layout.addWidget(self.search_status)
+
+        self.user_model = UserTableModel()
+        self.user_table = UserTableView(self.user_model)
+        self.user_table.delete_requested.connect(self.delete_user_account)
         self.populate_user_table()
+        # Index the accounts in the background before the first keystroke.
+        self.tasks.prepare_user_search()
         layout.addWidget(self.user_table)
         layout.addStretch()
         return container
 
     def populate_user_table(self):
-        try:
-            self.user_table.setRowCount(0)
-            users = self.dm.get_all_users_flat()
-            self.user_table.setRowCount(len(users))
-            for row, user in enumerate(users):
-                name_item = QTableWidgetItem(user['name'])
-                name_item.setData(Qt.UserRole, user['id'])
-                name_item.setFont(QFont('Arial', 9))
-                name_item.setFlags(Qt.NoItemFlags)
-                self.user_table.setItem(row, 0, name_item)
-                item = QTableWidgetItem(user['contact'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                self.user_table.setItem(row, 1, item)
-                item = QTableWidgetItem(user['role'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                self.user_table.setItem(row, 2, item)
-                item = QTableWidgetItem(user['email'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                self.user_table.setItem(row, 3, item)
-                item = QTableWidgetItem(user['address'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                self.user_table.setItem(row, 4, item)
-                action_widget = QWidget()
-                action_layout = QHBoxLayout(action_widget)
-                delete_btn = QPushButton("Delete")
-                delete_btn.setFont(QFont('Arial', 8))
-                delete_btn.setFixedSize(100, 25)
-                delete_btn.setStyleSheet(
-                    "background-color: #ef5350; color: white; border-radius: 4px; border: none;")
-                delete_btn.clicked.connect(lambda checked, r=row: self.delete_user_account(r))
-                action_layout.addWidget(delete_btn)
-                self.user_table.setCellWidget(row, 5, action_widget)
-
-            self.filter_user_table(self.search_input.text())
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to populate user table: {str(e)}")
-
-    def filter_user_table(self, text):
-        try:
-            text = text.lower()
-            for row in range(self.user_table.rowCount()):
-                name = self.user_table.item(row, 0).text().lower()
-                email = self.user_table.item(row, 3).text().lower()
-                self.user_table.setRowHidden(row, text not in name and text not in email)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to filter users: {str(e)}")
+        self.search_timer.stop()
+        query = self.search_input.text().strip()
+        limit = self.SEARCH_LIMIT + 1 if query else None
+        self.search_status.setText("Searching..." if query else "")
+        request = self.tasks.search_users(query, limit)
+        self.start_request('manage_users', request).then(
+            lambda users: self.show_user_results(query, users),
+            lambda error: QMessageBox.critical(self, "Error", f"Failed to search users: {error}"))
+
+    def show_user_results(self, query, users):
+        self.user_query = query
+        if query and len(users) > self.SEARCH_LIMIT:
+            users = users[:self.SEARCH_LIMIT]
+            self.search_status.setText(f"Showing the first {self.SEARCH_LIMIT} matches. Refine the search to narrow them down.")
+        elif query:
+            self.search_status.setText(f"{len(users)} matching users")
+        else:
+            self.search_status.setText("")
+        self.user_model.set_users(users)
 
     def add_user(self):
         try:
@@ -172,9 +248,8 @@ class AdminDashboard(BaseDashboard):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open add user dialog: {str(e)}")
 
-    def delete_user_account(self, row):
+    def delete_user_account(self, user_id):
         try:
-            user_id = self.user_table.item(row, 0).data(Qt.UserRole)
             if user_id == 301:
                 QMessageBox.critical(self, "Error", "Cannot delete the primary Admin account.")
                 return
@@ -186,7 +261,6 @@ class AdminDashboard(BaseDashboard):
             if reply == QMessageBox.Yes:
                 if self.dm.delete_user(user_id):
                     QMessageBox.information(self, "Success", "User successfully deleted.")
-                    self.populate_user_table()
                 else:
                     QMessageBox.critical(self, "Error", "User not found.")
         except Exception as e:
@@ -200,25 +274,20 @@ class AdminDashboard(BaseDashboard):
         layout.addSpacing(15)
 
         try:
-            num_customers = len(self.dm.user_data['Customer'])
-            num_staffs = len(self.dm.user_data['Staff'])
-            num_admins = len(self.dm.user_data['Admin'])
-            total_orders = len(self.dm.orders)
-            total_revenue = sum(o['Total'] for o in self.dm.orders if o['Total'] is not None)
-            open_schedules = len(
-                [s for s in self.dm.schedules if s['Status'] != 'Completed' and s['Status'] != 'Cancelled'])
-
             report_data = {
-                "No. of Customers:": num_customers,
-                "No. of Staff:": num_staffs,
-                "No. of Admins:": num_admins,
-                "Total Orders:": total_orders,
-                "Total Revenue:": f"₱{total_revenue:.2f}",
-                "Open Schedules:": open_schedules
+                "No. of Customers:": self.dm.users.count('Customer'),
+                "No. of Staff:": self.dm.users.count('Staff'),
+                "No. of Admins:": self.dm.users.count('Admin'),
+                "Total Orders:": "Loading...",
+                "Total Revenue:": "Loading...",
+                "Open Schedules:": "Loading...",
+                "Revenue This Year:": "Loading...",
+                "Kg Washed This Year:": "Loading..."
             }
 
             form_layout = QGridLayout()
             form_layout.setVerticalSpacing(15)
+            self.report_fields = {}
 
             for row, (label_text, value) in enumerate(report_data.items()):
                 label = QLabel(label_text)
@@ -230,17 +299,136 @@ class AdminDashboard(BaseDashboard):
                 value_display.setFixedHeight(30)
                 value_display.setReadOnly(True)
                 value_display.setStyleSheet("background-color: #e0e0e0; border: 1px solid #ccc; border-radius: 4px;")
+                self.report_fields[label_text] = value_display
 
                 form_layout.addWidget(label, row, 0)
                 form_layout.addWidget(value_display, row, 1)
 
             layout.addLayout(form_layout)
             layout.addStretch()
+            self.reload_report_totals()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load reports: {str(e)}")
 
         return container
 
+    def update_report_counts(self):
+        self.report_fields["No. of Customers:"].setText(str(self.dm.users.count('Customer')))
+        self.report_fields["No. of Staff:"].setText(str(self.dm.users.count('Staff')))
+        self.report_fields["No. of Admins:"].setText(str(self.dm.users.count('Admin')))
+
+    def reload_report_totals(self):
+        self.start_request('system_reports', self.tasks.get_report_totals()).then(
+            self.show_report_totals,
+            lambda error: QMessageBox.critical(self, "Error", f"Failed to load reports: {error}"))
+        today = QDate.currentDate()
+        request = self.tasks.get_revenue_report(QDate(today.year(), 1, 1).toString("yyyy-MM-dd"),
+                                                today.toString("yyyy-MM-dd"))
+        self.start_request('yearly_revenue', request).then(
+            self.show_yearly_revenue,
+            lambda error: QMessageBox.critical(self, "Error", f"Failed to load revenue report: {error}"))
+
+    def show_report_totals(self, totals):
+        self.report_fields["Total Orders:"].setText(str(totals['orders']))
+        self.report_fields["Total Revenue:"].setText(f"₱{totals['revenue']:.2f}")
+        self.report_fields["Open Schedules:"].setText(str(totals['open_schedules']))
+
+    def show_yearly_revenue(self, report):
+        self.report_fields["Revenue This Year:"].setText(f"₱{report['revenue']:.2f}")
+        self.report_fields["Kg Washed This Year:"].setText(f"{report['kg']:.2f} kg")
+
+    def create_analytics_screen(self):
+        container = QWidget()
+        layout = QVBoxLayout(container)
+
+        layout.addWidget(self.create_title_bar("Revenue Analytics", "#ffcdd2", "#880e4f"))
+        layout.addSpacing(15)
+
+        filter_layout = QHBoxLayout()
+        group_label = QLabel("Group by:")
+        group_label.setFont(QFont('Arial', 10))
+        self.analytics_group_combo = QComboBox()
+        self.analytics_group_combo.setFixedHeight(30)
+        self.analytics_group_combo.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
+        self.analytics_group_combo.addItems(list(ANALYTICS_GROUPINGS))
+        self.analytics_group_combo.setCurrentText("Month")
+        self.analytics_group_combo.currentIndexChanged.connect(self.load_analytics)
+        filter_layout.addWidget(group_label)
+        filter_layout.addWidget(self.analytics_group_combo)
+
+        today = QDate.currentDate()
+        self.analytics_from = QDateEdit(QDate(today.year(), 1, 1))
+        self.analytics_to = QDateEdit(today)
+        for label_text, date_edit in (("From:", self.analytics_from), ("To:", self.analytics_to)):
+            label = QLabel(label_text)
+            label.setFont(QFont('Arial', 10))
+            date_edit.setCalendarPopup(True)
+            date_edit.setDisplayFormat("yyyy-MM-dd")
+            date_edit.setFixedHeight(30)
+            date_edit.dateChanged.connect(self.load_analytics)
+            filter_layout.addWidget(label)
+            filter_layout.addWidget(date_edit)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        self.analytics_status = QLabel("")
+        self.analytics_status.setFont(QFont('Arial', 9))
+        self.analytics_status.setStyleSheet("color: #666666;")
+        layout.addWidget(self.analytics_status)
+
+        self.analytics_table = QTableWidget()
+        self.analytics_table.setFont(QFont('Arial', 9))
+        self.analytics_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.analytics_table)
+        self.load_analytics()
+
+        return container
+
+    def load_analytics(self):
+        try:
+            by = ANALYTICS_GROUPINGS[self.analytics_group_combo.currentText()]
+            self.analytics_status.setText("Loading...")
+            if by is None:
+                year = self.analytics_to.date().year()
+                request = self.tasks.get_year_over_year(year)
+                self.start_request('analytics', request).then(
+                    lambda rows: self.show_year_over_year(year, rows),
+                    lambda error: QMessageBox.critical(self, "Error", f"Failed to load analytics: {error}"))
+                return
+            request = self.tasks.get_analytics(by, self.analytics_from.date().toString("yyyy-MM-dd"),
+                                               self.analytics_to.date().toString("yyyy-MM-dd"))
+            self.start_request('analytics', request).then(
+                self.show_analytics,
+                lambda error: QMessageBox.critical(self, "Error", f"Failed to load analytics: {error}"))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load analytics: {str(e)}")
+
+    def show_analytics(self, rows):
+        group = self.analytics_group_combo.currentText()
+        self.set_analytics_rows([group, "Orders", "Kg", "Revenue"], [
+            [label, str(orders), f"{kg:.2f}", f"₱{revenue:.2f}"] for label, orders, kg, revenue in rows
+        ])
+        self.analytics_status.setText(f"{len(rows)} rows")
+
+    def show_year_over_year(self, year, rows):
+        values = []
+        for month, previous, current in rows:
+            change = f"{(current[2] - previous[2]) / previous[2] * 100:+.1f}%" if previous[2] else "-"
+            values.append([month, f"₱{previous[2]:.2f}", f"₱{current[2]:.2f}", change])
+        self.set_analytics_rows(["Month", f"Revenue {year - 1}", f"Revenue {year}", "Change"], values)
+        self.analytics_status.setText(f"{year} compared with {year - 1}")
+
+    def set_analytics_rows(self, headers, rows):
+        self.analytics_table.setColumnCount(len(headers))
+        self.analytics_table.setHorizontalHeaderLabels(headers)
+        self.analytics_table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for col, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                item.setFont(QFont('Arial', 9))
+                item.setFlags(Qt.NoItemFlags)
+                self.analytics_table.setItem(row, col, item)
+
     def create_view_orders_screen(self):
         container = QWidget()
         layout = QVBoxLayout(container)
@@ -248,69 +436,106 @@ class AdminDashboard(BaseDashboard):
         layout.addWidget(self.create_title_bar("All Laundry Orders", "#ffcdd2", "#880e4f"))
         layout.addSpacing(15)
 
-        self.order_table = QTableWidget()
-        headers = ["Order ID", "User Email", "Items", "Total", "Status", "Actions"]
-        self.order_table.setColumnCount(len(headers))
-        self.order_table.setHorizontalHeaderLabels(headers)
-        self.order_table.setFont(QFont('Arial', 9))
-        header = self.order_table.horizontalHeader()
-        for i in range(len(headers) - 1):
-            header.setSectionResizeMode(i, QHeaderView.Stretch)
-        header.setSectionResizeMode(len(headers) - 1, QHeaderView.ResizeToContents)
-        self.populate_order_table(self.order_table)
+        filter_layout = QHBoxLayout()
+        status_label = QLabel("Status:")
+        status_label.setFont(QFont('Arial', 10))
+        self.order_status_filter = QComboBox()
+        self.order_status_filter.setFixedHeight(30)
+        self.order_status_filter.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
+        self.order_status_filter.addItems(["All"] + ORDER_STATUSES)
+        self.order_status_filter.currentIndexChanged.connect(self.reset_order_paging)
+        customer_label = QLabel("Customer:")
+        customer_label.setFont(QFont('Arial', 10))
+        self.order_customer_filter = QLineEdit()
+        self.order_customer_filter.setPlaceholderText("Customer email")
+        self.order_customer_filter.setFixedHeight(30)
+        self.order_customer_filter.setStyleSheet("border: 1px solid #ccc; border-radius: 4px; padding: 5px;")
+        self.order_customer_filter.editingFinished.connect(self.reset_order_paging)
+        self.order_sort_combo = QComboBox()
+        self.order_sort_combo.setFixedHeight(30)
+        self.order_sort_combo.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
+        self.order_sort_combo.addItems(["Newest First", "Oldest First"])
+        self.order_sort_combo.currentIndexChanged.connect(self.reset_order_paging)
+        filter_layout.addWidget(status_label)
+        filter_layout.addWidget(self.order_status_filter)
+        filter_layout.addWidget(customer_label)
+        filter_layout.addWidget(self.order_customer_filter)
+        filter_layout.addWidget(self.order_sort_combo)
+        layout.addLayout(filter_layout)
+
+        self.order_model = OrderTableModel()
+        self.order_model.status_change_requested.connect(self.on_status_changed)
+        self.order_table = OrderTableView(self.order_model)
+        self.order_table.billing_requested.connect(self.open_billing_dialog)
         layout.addWidget(self.order_table)
+
+        pager_layout, self.prev_orders_btn, self.order_page_label, self.next_orders_btn = self.create_pager(
+            self.previous_order_page, self.next_order_page)
+        layout.addLayout(pager_layout)
         layout.addStretch()
+        self.reset_order_paging()
         return container
 
+    def create_pager(self, on_previous, on_next):
+        pager_layout = QHBoxLayout()
+        pager_layout.addStretch()
+        prev_btn = QPushButton("◀ Previous")
+        next_btn = QPushButton("Next ▶")
+        page_label = QLabel("Page 1")
+        page_label.setFont(QFont('Arial', 10))
+        for btn, action in ((prev_btn, on_previous), (next_btn, on_next)):
+            btn.setFixedSize(110, 30)
+            btn.setStyleSheet(
+                "background-color: #f0f0f0; border: 1px solid #ccc; border-radius: 4px; color: #333333;")
+            btn.clicked.connect(action)
+        pager_layout.addWidget(prev_btn)
+        pager_layout.addWidget(page_label)
+        pager_layout.addWidget(next_btn)
+        pager_layout.addStretch()
+        return pager_layout, prev_btn, page_label, next_btn
+
+    def reset_order_paging(self):
+        self.order_cursors = [None]
+        self.load_order_page()
+
+    def next_order_page(self):
+        if self.order_next_cursor is not None:
+            self.order_cursors.append(self.order_next_cursor)
+            self.load_order_page()
+
+    def previous_order_page(self):
+        if len(self.order_cursors) > 1:
+            self.order_cursors.pop()
+            self.load_order_page()
+
+    def load_order_page(self):
+        try:
+            status = self.order_status_filter.currentText()
+            self.prev_orders_btn.setEnabled(False)
+            self.next_orders_btn.setEnabled(False)
+            self.order_page_label.setText(f"Page {len(self.order_cursors)} (loading...)")
+            request = self.tasks.query_orders(
+                status=None if status == "All" else status,
+                customer=self.order_customer_filter.text().strip() or None,
+                descending=self.order_sort_combo.currentIndex() == 0,
+                after=self.order_cursors[-1],
+                limit=self.PAGE_SIZE)
+            self.start_request('view_orders', request).then(
+                self.show_order_page,
+                lambda error: QMessageBox.critical(self, "Error", f"Failed to load orders: {error}"))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load orders: {str(e)}")
+
+    def show_order_page(self, result):
+        self.order_page, self.order_next_cursor = result
+        self.populate_order_table(self.order_table)
+        self.prev_orders_btn.setEnabled(len(self.order_cursors) > 1)
+        self.next_orders_btn.setEnabled(self.order_next_cursor is not None)
+        self.order_page_label.setText(f"Page {len(self.order_cursors)}")
+
     def populate_order_table(self, order_table):
         try:
-            order_table.setRowCount(0)
-            if not self.dm.orders:
-                return
-            order_table.setRowCount(len(self.dm.orders))
-            for row, order in enumerate(self.dm.orders):
-                item = QTableWidgetItem(order['Order ID'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                order_table.setItem(row, 0, item)
-                item = QTableWidgetItem(order['User Email'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                order_table.setItem(row, 1, item)
-                items_str = ", ".join([i['item'] for i in order['items']])
-                item = QTableWidgetItem(items_str)
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                order_table.setItem(row, 2, item)
-                item = QTableWidgetItem(f"₱{order['Total']:.2f}" if order['Total'] is not None else '-')
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                order_table.setItem(row, 3, item)
-                status_combo = QComboBox()
-                status_combo.setFont(QFont('Arial', 9))
-                status_combo.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
-                status_combo.addItems([
-                    "Pending Pick-up", "Washing", "Drying", "Completed",
-                    "Ready for Pickup", "Ready for Delivery", "Cancelled"
-                ])
-                current_status = order['Status']
-                index = status_combo.findText(current_status)
-                if index >= 0:
-                    status_combo.setCurrentIndex(index)
-                status_combo.currentTextChanged.connect(lambda text, r=row: self.on_status_changed(r, text))
-                order_table.setCellWidget(row, 4, status_combo)
-                action_widget = QWidget()
-                action_layout = QHBoxLayout(action_widget)
-                action_layout.setContentsMargins(2, 2, 2, 2)
-                action_layout.setSpacing(5)
-                edit_btn = QPushButton("Edit Billing")
-                edit_btn.setFont(QFont('Arial', 8))
-                edit_btn.setFixedSize(100, 25)
-                edit_btn.setStyleSheet(
-                    "background-color: #81d4fa; color: #01579b; border-radius: 4px; border: none;")
-                edit_btn.clicked.connect(lambda checked=False, r=row: self.open_billing_dialog(r))
-                action_layout.addWidget(edit_btn)
-                order_table.setCellWidget(row, 5, action_widget)
+            order_table.model().set_orders(self.order_page)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to populate orders: {str(e)}")
 
@@ -326,38 +551,29 @@ class AdminDashboard(BaseDashboard):
         }
         item.setBackground(colors.get(status, QColor(255, 255, 255)))
 
-    def on_status_changed(self, row, new_status):
+    def on_status_changed(self, order_id, new_status):
         try:
-            order = self.dm.orders[row]
-            order_id = order['Order ID']
             if self.dm.update_order(order_id, {'Status': new_status}):
-                self.update_order_row(row)
+                self.update_order_row(order_id)
             else:
                 QMessageBox.critical(self, "Error", "Failed to update status")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Status update failed: {str(e)}")
 
-    def update_order_row(self, row):
+    def update_order_row(self, order_id):
         try:
-            if not self.order_table or row >= len(self.dm.orders):
+            if not self.order_table:
                 return
-            order = self.dm.orders[row]
-            total_item = QTableWidgetItem(f"₱{order['Total']:.2f}" if order['Total'] is not None else '-')
-            total_item.setFont(QFont('Arial', 9))
-            total_item.setFlags(Qt.NoItemFlags)
-            self.order_table.setItem(row, 3, total_item)
-            status_combo = self.order_table.cellWidget(row, 4)
-            status_combo.blockSignals(True)
-            index = status_combo.findText(order['Status'])
-            if index >= 0:
-                status_combo.setCurrentIndex(index)
-            status_combo.blockSignals(False)
+            self.order_model.refresh_order(order_id)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update order row: {str(e)}")
 
-    def open_billing_dialog(self, row):
+    def open_billing_dialog(self, order_id):
         try:
-            order = self.dm.orders[row]
+            order = self.dm.get_order(order_id)
+            if order is None:
+                QMessageBox.critical(self, "Error", f"Order {order_id} no longer exists.")
+                return
             dialog = QDialog(self)
             dialog.setWindowTitle(f"Edit Billing for Order {order['Order ID']}")
             dialog.setModal(True)
@@ -390,7 +606,7 @@ class AdminDashboard(BaseDashboard):
             save_btn.setFixedSize(120, 30)
             save_btn.setStyleSheet(
                 "background-color: #4CAF50; color: white; border-radius: 4px; border: none;")
-            save_btn.clicked.connect(lambda: self.save_billing_dialog(row, item_table, dialog))
+            save_btn.clicked.connect(lambda: self.save_billing_dialog(order_id, item_table, dialog))
             layout.addWidget(save_btn)
 
             dialog.exec_()
@@ -405,22 +621,13 @@ class AdminDashboard(BaseDashboard):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to calculate subtotal: {str(e)}")
 
-    def save_billing_dialog(self, row, table, dialog):
+    def save_billing_dialog(self, order_id, table, dialog):
         try:
-            order = self.dm.orders[row]
-            total = 0.0
-            for i in range(table.rowCount()):
-                item = order['items'][i]
-                actual_kg_widget = table.cellWidget(i, 2)
-                actual_kg = actual_kg_widget.value()
-                subtotal = actual_kg * item['price_per_kg']
-                self.dm.update_order_item(item['id'], actual_kg, subtotal)
-                item['actual_kg'] = actual_kg
-                item['subtotal'] = subtotal
-                total += subtotal
-            self.dm.update_order(order['Order ID'], {'Total': total})
-            order['Total'] = total
-            self.update_order_row(row)
+            weights = [table.cellWidget(i, 2).value() for i in range(table.rowCount())]
+            if not self.dm.save_billing(order_id, weights):
+                QMessageBox.critical(self, "Error", "Failed to save billing.")
+                return
+            self.update_order_row(order_id)
             dialog.accept()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save billing: {str(e)}")
@@ -442,54 +649,92 @@ class AdminDashboard(BaseDashboard):
         filter_layout = QHBoxLayout()
         filter_label = QLabel("Filter by Status:")
         filter_label.setFont(QFont('Arial', 10))
-        pickup_filter_combo = QComboBox()
-        pickup_filter_combo.setFixedHeight(30)
-        pickup_filter_combo.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
-        pickup_filter_combo.addItems(["All", "Scheduled", "In Progress", "Completed", "Cancelled"])
-        pickup_filter_combo.currentIndexChanged.connect(
-            lambda: self.populate_pickup_table(pickup_table, pickup_filter_combo))
+        self.pickup_filter_combo = QComboBox()
+        self.pickup_filter_combo.setFixedHeight(30)
+        self.pickup_filter_combo.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
+        self.pickup_filter_combo.addItems(["All"] + SCHEDULE_STATUSES)
+        self.pickup_filter_combo.currentIndexChanged.connect(self.reset_pickup_paging)
 
         filter_layout.addWidget(filter_label)
-        filter_layout.addWidget(pickup_filter_combo)
+        filter_layout.addWidget(self.pickup_filter_combo)
         filter_layout.addStretch()
         layout.addLayout(filter_layout)
 
-        pickup_table = QTableWidget()
+        self.pickup_table = QTableWidget()
         headers = ["ID", "User Email", "Type", "Date", "Time", "Address", "Email", "Status"]
-        pickup_table.setColumnCount(len(headers))
-        pickup_table.setHorizontalHeaderLabels(headers)
-        pickup_table.setFont(QFont('Arial', 9))
-        header = pickup_table.horizontalHeader()
+        self.pickup_table.setColumnCount(len(headers))
+        self.pickup_table.setHorizontalHeaderLabels(headers)
+        self.pickup_table.setFont(QFont('Arial', 9))
+        header = self.pickup_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
-        self.populate_pickup_table(pickup_table, pickup_filter_combo)
-        layout.addWidget(pickup_table)
+        layout.addWidget(self.pickup_table)
+
+        pager_layout, self.prev_pickup_btn, self.pickup_page_label, self.next_pickup_btn = self.create_pager(
+            self.previous_pickup_page, self.next_pickup_page)
+        layout.addLayout(pager_layout)
         layout.addStretch()
+        self.reset_pickup_paging()
 
         return container
 
-    def populate_pickup_table(self, pickup_table, pickup_filter_combo):
+    def reset_pickup_paging(self):
+        self.pickup_cursors = [None]
+        self.load_pickup_page()
+
+    def next_pickup_page(self):
+        if self.pickup_next_cursor is not None:
+            self.pickup_cursors.append(self.pickup_next_cursor)
+            self.load_pickup_page()
+
+    def previous_pickup_page(self):
+        if len(self.pickup_cursors) > 1:
+            self.pickup_cursors.pop()
+            self.load_pickup_page()
+
+    def load_pickup_page(self):
+        try:
+            status = self.pickup_filter_combo.currentText()
+            self.prev_pickup_btn.setEnabled(False)
+            self.next_pickup_btn.setEnabled(False)
+            self.pickup_page_label.setText(f"Page {len(self.pickup_cursors)} (loading...)")
+            request = self.tasks.query_schedules(
+                status=None if status == "All" else status,
+                after=self.pickup_cursors[-1],
+                limit=self.PAGE_SIZE)
+            self.start_request('manage_pickup', request).then(
+                self.show_pickup_page,
+                lambda error: QMessageBox.critical(self, "Error", f"Failed to load schedules: {error}"))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load schedules: {str(e)}")
+
+    def show_pickup_page(self, result):
+        self.pickup_page, self.pickup_next_cursor = result
+        self.populate_pickup_table(self.pickup_table)
+        self.prev_pickup_btn.setEnabled(len(self.pickup_cursors) > 1)
+        self.next_pickup_btn.setEnabled(self.pickup_next_cursor is not None)
+        self.pickup_page_label.setText(f"Page {len(self.pickup_cursors)}")
+
+    def populate_pickup_table(self, pickup_table):
         try:
-            selected_filter = pickup_filter_combo.currentText()
-            filtered_schedules = [
-                s for s in self.dm.schedules
-                if selected_filter == "All" or s['Status'] == selected_filter
-            ]
-            pickup_table.setRowCount(len(filtered_schedules))
-            for row, schedule in enumerate(filtered_schedules):
-                items = [
-                    str(schedule['ID']),
-                    schedule['User Email'],
-                    schedule['Type'],
-                    schedule['Date'],
-                    schedule['Time'],
-                    schedule['Address'],
-                    schedule['Email'],
-                    schedule['Status']
-                ]
-                for col, item_text in enumerate(items):
-                    item = QTableWidgetItem(item_text)
-                    item.setFont(QFont('Arial', 9))
-                    item.setFlags(Qt.NoItemFlags)
-                    pickup_table.setItem(row, col, item)
+            pickup_table.setRowCount(len(self.pickup_page))
+            for row, schedule in enumerate(self.pickup_page):
+                self.set_pickup_row(pickup_table, row, schedule)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to populate pickup table: {str(e)}")
\ No newline at end of file
+            QMessageBox.critical(self, "Error", f"Failed to populate pickup table: {str(e)}")
+
+    def set_pickup_row(self, pickup_table, row, schedule):
+        items = [
+            str(schedule['ID']),
+            schedule['User Email'],
+            schedule['Type'],
+            schedule['Date'],
+            schedule['Time'],
+            schedule['Address'],
+            schedule['Email'],
+            schedule['Status']
+        ]
+        for col, item_text in enumerate(items):
+            item = QTableWidgetItem(item_text)
+            item.setFont(QFont('Arial', 9))
+            item.setFlags(Qt.NoItemFlags)
+            pickup_table.setItem(row, col, item)
\ No newline at end of file
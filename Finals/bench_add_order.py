@@ -0,0 +1,107 @@
+# bench_add_order.py - Statements and wall time of add_order per item-insert strategy
+#
+#   python bench_add_order.py [orders] [items per order]
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from seed_data import ITEM_PRICES, open_manager
+from storage import SQLiteCursor, SQLiteEngine
+
+# SQLite answers in-process; a LAN MySQL server costs about this much per
+# statement on top, which the last column adds back.
+ROUND_TRIP = 0.0005
+
+
+class PerItemEngine(SQLiteEngine):
+    # The loop this replaced: one INSERT and lastrowid per item.
+    def insert_rows(self, cursor, table, columns, rows):
+        ids = []
+        for row in rows:
+            cursor.execute(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})", row)
+            ids.append(cursor.lastrowid)
+        return ids
+
+
+class ReadBackEngine(SQLiteEngine):
+    # The first batched version: executemany, then a SELECT for the ids.
+    def insert_rows(self, cursor, table, columns, rows):
+        cursor.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})",
+                           rows)
+        return None
+
+
+def count_statements():
+    counter = [0]
+    execute, executemany = SQLiteCursor.execute, SQLiteCursor.executemany
+
+    def counting(cursor, sql, params=()):
+        counter[0] += 1
+        return execute(cursor, sql, params)
+
+    def counting_many(cursor, sql, seq_of_params):
+        counter[0] += 1
+        return executemany(cursor, sql, seq_of_params)
+
+    SQLiteCursor.execute, SQLiteCursor.executemany = counting, counting_many
+
+    def restore():
+        SQLiteCursor.execute, SQLiteCursor.executemany = execute, executemany
+    return counter, restore
+
+
+def new_order(number, item_count):
+    return {'Order ID': f"B{number:07d}", 'User Email': 'bench@mail.com', 'Total': None,
+            'Status': 'Pending Pick-up', 'Order Date': f"2026-01-{number % 28 + 1:02d}",
+            'items': [{'id': None, 'item': ITEM_PRICES[i % len(ITEM_PRICES)][0],
+                       'price_per_kg': ITEM_PRICES[i % len(ITEM_PRICES)][1], 'actual_kg': None, 'subtotal': None}
+                      for i in range(item_count)]}
+
+
+def measure(label, engine_class, count, item_count):
+    # The DataManager prints a line per step; keep it out of the report.
+    quiet = contextlib.redirect_stdout(io.StringIO())
+    with quiet:
+        dm = open_manager(engine_class(os.path.join(tempfile.mkdtemp(), 'bench.db')))
+        dm.register_user('Customer', {'fullname': 'Bench', 'email': 'bench@mail.com', 'password': 'x',
+                                      'contact_info': '0'})
+    orders = [new_order(number, item_count) for number in range(count)]
+    counter, restore = count_statements()
+    start = time.perf_counter()
+    try:
+        with quiet:
+            for order in orders:
+                dm.add_order(order)
+    finally:
+        restore()
+    elapsed = time.perf_counter() - start
+    statements = counter[0] / count
+    print(f"  {label:<12} {statements:>6.1f} statements {elapsed / count * 1000:>7.3f} ms/order  "
+          f"{elapsed / count * 1000 + statements * ROUND_TRIP * 1000:>7.3f} ms/order with "
+          f"{ROUND_TRIP * 1000:g} ms round trips")
+    ids = [[item['id'] for item in dm.get_order(order['Order ID'])['items']] for order in orders]
+    dm.close()
+    return ids
+
+
+def main(count, item_count):
+    print(f"\nAdding {count} orders of {item_count} items")
+    old = measure("per item", PerItemEngine, count, item_count)
+    read_back = measure("read back", ReadBackEngine, count, item_count)
+    new = measure("multi-row", SQLiteEngine, count, item_count)
+    same = old == read_back == new
+    print("✓ Every strategy assigns the same item ids" if same else "✗ The strategies assigned different item ids")
+    return same
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000,
+                       int(sys.argv[2]) if len(sys.argv) > 2 else 8) else 1)
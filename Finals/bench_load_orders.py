@@ -0,0 +1,76 @@
+# bench_load_orders.py - Query count and wall time of loading every order
+#
+#   python bench_load_orders.py [orders]
+
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database import DataManager
+from seed_data import seed_database
+from storage import SQLiteCursor
+
+# SQLite answers in-process; a LAN MySQL server costs about this much per
+# query on top, which the last column adds back.
+ROUND_TRIP = 0.0005
+
+
+def count_queries():
+    counter = [0]
+    execute = SQLiteCursor.execute
+
+    def counting(cursor, sql, params=()):
+        counter[0] += 1
+        return execute(cursor, sql, params)
+
+    SQLiteCursor.execute = counting
+    return counter, lambda: setattr(SQLiteCursor, 'execute', execute)
+
+
+def load_per_order(dm):
+    # The loop this replaced: one items query for every order.
+    with dm.engine.transaction() as cursor:
+        cursor.execute("SELECT * FROM orders")
+        orders = []
+        for order in cursor.fetchall():
+            cursor.execute("SELECT * FROM order_items WHERE order_id = %s", (order['order_id'],))
+            items = [dm._item_from_row(item) for item in cursor.fetchall()]
+            orders.append(dm._order_from_row(order, items))
+    return orders
+
+
+def measure(label, load):
+    counter, restore = count_queries()
+    start = time.perf_counter()
+    try:
+        orders = load()
+    finally:
+        restore()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<12} {counter[0]:>8} queries {elapsed:>8.2f} s  "
+          f"{elapsed + counter[0] * ROUND_TRIP:>8.2f} s with {ROUND_TRIP * 1000:g} ms round trips")
+    return orders
+
+
+def main(count):
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    seed_database(path, customers=500, orders=count, schedules=0)
+    dm = DataManager()
+    dm.open_offline_database(path)
+    print(f"\nLoading {count} orders")
+    old = measure("per order", lambda: load_per_order(dm))
+    new = measure("bulk", dm.fetch_orders)
+    key = lambda order: order['Order ID']
+    same = [dict(order) for order in sorted(old, key=key)] == [dict(order) for order in sorted(new, key=key)]
+    print("✓ Both paths build the same orders" if same else "✗ The two paths built different orders")
+    dm.close()
+    return same
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000) else 1)
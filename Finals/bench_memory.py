@@ -0,0 +1,89 @@
+# bench_memory.py - Memory held by the loaded orders, records against dicts
+#
+#   python bench_memory.py [orders]
+#
+# Each run starts a fresh interpreter and loads every seeded order through
+# DataManager.fetch_orders. "records" is the shipped OrderRecord and
+# ItemRecord. "dicts" swaps in the dict rows they replaced. The figure is
+# what tracemalloc still holds once the load has returned.
+
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def dict_manager():
+    from database import DataManager
+
+    class DictDataManager(DataManager):
+        # The row builders from before records.py.
+        def _item_from_row(self, item):
+            return {
+                'id': item['id'],
+                'item': item['item'],
+                'price_per_kg': float(item['price_per_kg']),
+                'actual_kg': float(item['actual_kg']) if item['actual_kg'] else None,
+                'subtotal': float(item['subtotal']) if item['subtotal'] else None
+            }
+
+        def _order_from_row(self, order, items):
+            return {
+                'Order ID': order['order_id'],
+                'User Email': order['user_email'],
+                'Total': float(order['total']) if order['total'] else None,
+                'Status': order['status'],
+                'Order Date': str(order['order_date']),
+                'items': items
+            }
+
+    return DictDataManager()
+
+
+def child(path, mode):
+    from database import DataManager
+    dm = dict_manager() if mode == 'dicts' else DataManager()
+    dm.open_offline_database(path)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    orders = dm.fetch_orders()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    items = sum(len(order['items']) for order in orders)
+    print(f"RESULT {len(orders)} {items} {held}")
+    dm.close()
+
+
+def run(path, mode):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', path, mode],
+                            capture_output=True, text=True, timeout=3600).stdout
+    line = next(line for line in output.splitlines() if line.startswith('RESULT'))
+    orders, items, held = (int(value) for value in line.split()[1:4])
+    print(f"  {mode:<8} {held / 2 ** 20:>8.0f} MiB  {held / orders:>6.0f} bytes/order  ({items} items)")
+    return held
+
+
+def main(count):
+    from seed_data import seed_database
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    seed_database(path, customers=20000, orders=count, schedules=0)
+    print(f"\nMemory held by {count} loaded orders")
+    records = run(path, 'records')
+    dicts = run(path, 'dicts')
+    ok = records < dicts
+    print(f"✓ Records hold {1 - records / dicts:.0%} less than dicts" if ok else "✗ Records were not smaller")
+    return ok
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000) else 1)
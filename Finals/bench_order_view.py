@@ -0,0 +1,124 @@
+# bench_order_view.py - Time and memory to open the order table
+#
+#   python bench_order_view.py [orders]
+#
+# Each run starts a fresh interpreter, loads the seeded orders and then
+# times building the table until its first paint. "model" is the shipped
+# OrderTableModel and OrderTableView. "widgets" is the QTableWidget that
+# held a combo box and a button widget per row; it is built for at most
+# WIDGET_ROWS orders and scaled up linearly.
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+WIDGET_ROWS = 5000
+
+
+def resident_mb():
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def widget_table(orders):
+    # The populate_order_table this replaced, minus its signal hookups.
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QFont
+    from PyQt5.QtWidgets import QComboBox, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QWidget
+    from order_table import ORDER_STATUSES, OrderTableModel
+
+    table = QTableWidget(len(orders), len(OrderTableModel.HEADERS))
+    table.setHorizontalHeaderLabels(OrderTableModel.HEADERS)
+    for row, order in enumerate(orders):
+        texts = (order['Order ID'], order['User Email'], ", ".join(i['item'] for i in order['items']),
+                 f"₱{order['Total']:.2f}" if order['Total'] is not None else '-')
+        for column, text in enumerate(texts):
+            item = QTableWidgetItem(text)
+            item.setFont(QFont('Arial', 9))
+            item.setFlags(Qt.NoItemFlags)
+            table.setItem(row, column, item)
+        status_combo = QComboBox()
+        status_combo.setFont(QFont('Arial', 9))
+        status_combo.addItems(ORDER_STATUSES)
+        status_combo.setCurrentIndex(max(0, status_combo.findText(order['Status'])))
+        table.setCellWidget(row, 4, status_combo)
+        action_widget = QWidget()
+        action_layout = QHBoxLayout(action_widget)
+        action_layout.setContentsMargins(2, 2, 2, 2)
+        edit_btn = QPushButton("Edit Billing")
+        edit_btn.setFixedSize(100, 25)
+        action_layout.addWidget(edit_btn)
+        table.setCellWidget(row, 5, action_widget)
+    return table
+
+
+def child(path, mode):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtCore import QEvent, QObject
+    from PyQt5.QtWidgets import QApplication
+    from database import DataManager
+    from order_table import OrderTableModel, OrderTableView
+
+    app = QApplication(sys.argv)
+    dm = DataManager()
+    dm.open_offline_database(path)
+    orders = dm.fetch_orders()
+    if mode == 'widgets':
+        orders = orders[:WIDGET_ROWS]
+
+    class FirstPaint(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint:
+                app.quit()
+            return False
+
+    painted = FirstPaint()
+    before = resident_mb()
+    start = time.perf_counter()
+    if mode == 'widgets':
+        view = widget_table(orders)
+    else:
+        view = OrderTableView(OrderTableModel(orders))
+    view.viewport().installEventFilter(painted)
+    view.resize(1000, 700)
+    view.show()
+    app.exec_()
+    elapsed = time.perf_counter() - start
+    print(f"RESULT {len(orders)} {elapsed} {resident_mb() - before}")
+    dm.close()
+
+
+def run(path, mode, count):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', path, mode],
+                            capture_output=True, text=True, timeout=1200).stdout
+    line = next(line for line in output.splitlines() if line.startswith('RESULT'))
+    rows, elapsed, memory = (float(value) for value in line.split()[1:4])
+    scale = count / rows
+    note = f"   (measured on {rows:.0f} rows)" if scale != 1 else ""
+    print(f"  {mode:<8} {elapsed * scale:>8.2f} s {memory * scale:>9.1f} MB{note}")
+    return elapsed * scale, memory * scale
+
+
+def main(count):
+    from seed_data import seed_database
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    seed_database(path, customers=2000, orders=count, schedules=0)
+    print(f"\nOpening the order table with {count} orders")
+    model = run(path, 'model', count)
+    widgets = run(path, 'widgets', count)
+    ok = model[0] < widgets[0] and model[1] < widgets[1]
+    print("✓ The model view opens faster and smaller" if ok else "✗ The model view was not faster and smaller")
+    return ok
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000) else 1)
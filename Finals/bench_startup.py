@@ -0,0 +1,86 @@
+# bench_startup.py - Time from process start to the first paint of the login screen
+#
+#   python bench_startup.py [orders]
+#
+# Each run starts a fresh interpreter against a seeded offline database.
+# "background" is the app as shipped: the window paints while users load
+# on a worker. "blocking" loads users, orders and schedules first, as the
+# app did when DATA_MANAGER connected at import.
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(path, mode):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+    from PyQt5.QtWidgets import QApplication
+    from main import DATA_MANAGER, WashDeskManager
+
+    app = QApplication(sys.argv)
+    times = {}
+
+    def mark(name):
+        times.setdefault(name, time.time())
+        if 'paint' in times and 'users' in times:
+            app.quit()
+
+    class FirstPaint(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint:
+                mark('paint')
+            return False
+
+    DATA_MANAGER.open_storage = lambda: DATA_MANAGER.open_offline_database(path)
+    DATA_MANAGER.users_loaded.connect(lambda: mark('users'))
+    if mode == 'blocking':
+        DATA_MANAGER.open_storage()
+        DATA_MANAGER.load_users()
+        DATA_MANAGER.fetch_orders()
+        DATA_MANAGER.fetch_schedules()
+        mark('users')
+    else:
+        QTimer.singleShot(0, DATA_MANAGER.start_loading)
+    painted = FirstPaint()
+    app.installEventFilter(painted)
+    manager = WashDeskManager()
+    app.exec_()
+    DATA_MANAGER.close()
+    print(f"RESULT {times['paint']} {times['users']} {manager is not None}")
+
+
+def run(path, mode):
+    start = time.time()
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', path, mode],
+                            capture_output=True, text=True, timeout=600).stdout
+    line = next(line for line in output.splitlines() if line.startswith('RESULT'))
+    paint, users = (float(value) for value in line.split()[1:3])
+    print(f"  {mode:<10} first paint {paint - start:>6.2f} s   users ready {users - start:>6.2f} s")
+    return paint - start
+
+
+def main(count):
+    from seed_data import seed_database
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    seed_database(path, customers=2000, orders=count, schedules=count // 10)
+    run(path, 'background')  # warm the file cache and apply migrations
+    print(f"\nStartup with {count} orders")
+    background = run(path, 'background')
+    blocking = run(path, 'blocking')
+    ok = background < blocking
+    print("✓ The login screen paints before the data loads" if ok else "✗ Background startup was not faster")
+    return ok
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000) else 1)
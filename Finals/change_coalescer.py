@@ -0,0 +1,145 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class ChangeBatch:
+    ENTITIES = ('order', 'schedule', 'user')
+
+    def __init__(self):
+        # Dicts keep arrival order and hold each id once.
+        self.added = {entity: {} for entity in self.ENTITIES}
+        self.changed = {entity: {} for entity in self.ENTITIES}
+        self.removed = {entity: {} for entity in self.ENTITIES}
+        # Dropped from memory by the bounded cache but still in the database.
+        self.evicted = {entity: {} for entity in self.ENTITIES}
+        self.reloads = set()
+
+    def __bool__(self):
+        return bool(self.reloads) or any(
+            self.added[e] or self.changed[e] or self.removed[e] or self.evicted[e] for e in self.ENTITIES)
+
+    def touches(self, entity):
+        return bool(self.added[entity] or self.changed[entity] or self.removed[entity])
+
+    def add(self, entity, key):
+        if self.removed[entity].pop(key, None):
+            # Removed and re-added inside one window: the row still exists.
+            self.changed[entity][key] = None
+        else:
+            self.added[entity][key] = True
+            self.changed[entity].pop(key, None)
+
+    def change(self, entity, key, fields):
+        if key in self.added[entity]:
+            return
+        merged = self.changed[entity].setdefault(key, set())
+        if merged is not None:
+            merged.update(fields)
+
+    def remove(self, entity, key):
+        self.changed[entity].pop(key, None)
+        if not self.added[entity].pop(key, None):
+            self.removed[entity][key] = True
+
+    def evict(self, entity, key):
+        self.evicted[entity][key] = True
+
+    def changed_fields(self, entity, key):
+        # None means the whole row should be treated as changed.
+        return self.changed[entity].get(key)
+
+
+class ChangeCoalescer(QObject):
+    # Collects DataManager change signals for `window` ms (0 = the next
+    # event-loop pass) and hands views one merged ChangeBatch.
+    DEFAULT_WINDOW = 50
+    changes_ready = pyqtSignal(object)
+
+    def __init__(self, data_manager, window=DEFAULT_WINDOW, parent=None):
+        super().__init__(parent)
+        self.batch = ChangeBatch()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(window)
+        self.timer.timeout.connect(self.flush)
+        self.subscriptions = [
+            (data_manager.order_updated, self.on_orders_reloaded),
+            (data_manager.user_data_changed, self.on_users_reloaded),
+            (data_manager.order_added, self.on_order_added),
+            (data_manager.order_changed, self.on_order_changed),
+            (data_manager.order_removed, self.on_order_removed),
+            (data_manager.orders_evicted, self.on_orders_evicted),
+            (data_manager.schedule_added, self.on_schedule_added),
+            (data_manager.schedule_changed, self.on_schedule_changed),
+            (data_manager.schedule_removed, self.on_schedule_removed),
+            (data_manager.user_added, self.on_user_added),
+            (data_manager.user_removed, self.on_user_removed),
+        ]
+        for signal, slot in self.subscriptions:
+            signal.connect(slot)
+
+    def close(self):
+        # Detaches from the DataManager; changes not yet flushed are dropped.
+        self.timer.stop()
+        for signal, slot in self.subscriptions:
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+        self.subscriptions = []
+        self.batch = ChangeBatch()
+
+    def schedule_flush(self):
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        self.timer.stop()
+        if not self.batch:
+            return
+        batch, self.batch = self.batch, ChangeBatch()
+        self.changes_ready.emit(batch)
+
+    def on_orders_reloaded(self):
+        self.batch.reloads.add('orders')
+        self.schedule_flush()
+
+    def on_users_reloaded(self):
+        self.batch.reloads.add('users')
+        self.schedule_flush()
+
+    def on_order_added(self, order_id):
+        self.batch.add('order', order_id)
+        self.schedule_flush()
+
+    def on_order_changed(self, order_id, fields):
+        self.batch.change('order', order_id, fields)
+        self.schedule_flush()
+
+    def on_order_removed(self, order_id):
+        self.batch.remove('order', order_id)
+        self.schedule_flush()
+
+    def on_orders_evicted(self, order_ids):
+        for order_id in order_ids:
+            self.batch.evict('order', order_id)
+        self.schedule_flush()
+
+    def on_schedule_added(self, schedule_id):
+        self.batch.add('schedule', schedule_id)
+        self.schedule_flush()
+
+    def on_schedule_changed(self, schedule_id, fields):
+        self.batch.change('schedule', schedule_id, fields)
+        self.schedule_flush()
+
+    def on_schedule_removed(self, schedule_id):
+        self.batch.remove('schedule', schedule_id)
+        self.schedule_flush()
+
+    def on_user_added(self, user_id):
+        self.batch.add('user', user_id)
+        self.schedule_flush()
+
+    def on_user_removed(self, user_id):
+        self.batch.remove('user', user_id)
+        self.schedule_flush()
@@ -0,0 +1,19 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from seed_data import ENGINES
+from storage import DB_ERRORS
+
+
+@pytest.fixture(params=sorted(ENGINES))
+def engine(request):
+    # Every engine in turn; one whose server is unreachable is skipped.
+    try:
+        engine = ENGINES[request.param]()
+    except DB_ERRORS as err:
+        pytest.skip(f"{request.param} unavailable: {err}")
+    yield engine
+    engine.close()
@@ -0,0 +1,107 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class DataRequest(QObject):
+    # Public signals fire on the GUI thread and never after cancel().
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    _result = pyqtSignal(object)
+    _error = pyqtSignal(str)
+
+    def __init__(self, fn, args, kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.done = False
+        self._result.connect(self._on_result)
+        self._error.connect(self._on_error)
+
+    def then(self, on_result, on_error=None):
+        self.finished.connect(on_result)
+        if on_error:
+            self.failed.connect(on_error)
+        return self
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        # Called on a pool thread.
+        if self.cancelled:
+            self._error.emit("Request cancelled")
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self._error.emit(str(e))
+        else:
+            self._result.emit(result)
+
+    def _on_result(self, result):
+        self.done = True
+        if not self.cancelled:
+            self.finished.emit(result)
+
+    def _on_error(self, error):
+        self.done = True
+        if not self.cancelled:
+            self.failed.emit(error)
+
+
+class DataJob(QRunnable):
+    def __init__(self, request):
+        super().__init__()
+        self.request = request
+
+    def run(self):
+        self.request.run()
+
+
+class AsyncDataManager(QObject):
+    def __init__(self, data_manager, pool=None):
+        super().__init__()
+        self.dm = data_manager
+        self.pool = pool or QThreadPool.globalInstance()
+        self._active = set()
+
+    def submit(self, fn, *args, **kwargs):
+        request = DataRequest(fn, args, kwargs)
+        # Held until delivery so the request is not collected mid-flight.
+        self._active.add(request)
+        request._result.connect(lambda result: self._active.discard(request))
+        request._error.connect(lambda error: self._active.discard(request))
+        self.pool.start(DataJob(request))
+        return request
+
+    def cancel_all(self):
+        for request in list(self._active):
+            request.cancel()
+
+    def query_orders(self, **filters):
+        return self.submit(self.dm.query_orders, **filters)
+
+    def query_schedules(self, **filters):
+        return self.submit(self.dm.query_schedules, **filters)
+
+    def search_users(self, query, limit=None):
+        return self.submit(self.dm.search_users, query, limit)
+
+    def prepare_user_search(self):
+        return self.submit(self.dm.prepare_user_search)
+
+    def get_report_totals(self):
+        return self.submit(self.dm.get_report_totals)
+
+    def get_daily_totals(self, order_date, schedule_date):
+        return self.submit(self.dm.get_daily_totals, order_date, schedule_date)
+
+    def get_revenue_report(self, date_from, date_to):
+        return self.submit(self.dm.get_revenue_report, date_from, date_to)
+
+    def get_analytics(self, by, date_from, date_to):
+        return self.submit(self.dm.get_analytics, by, date_from, date_to)
+
+    def get_year_over_year(self, year):
+        return self.submit(self.dm.get_year_over_year, year)
@@ -1,34 +1,170 @@
-from PyQt5.QtCore import QObject, pyqtSignal, QDate
+from PyQt5.QtCore import QObject, Qt, pyqtSignal, QDate
 import hashlib
+import threading
+import time
+import uuid
 import warnings
 import pymysql
+from analytics import OrderAnalytics
+from migrations import migrate
+from order_table import ORDER_STATUSES
+from records import ItemRecord, OrderRecord, ScheduleRecord, UserRecord
+from storage import DB_ERRORS, OFFLINE_DB_PATH, MySQLEngine, SQLiteEngine
+from stores import EntityCache, OrderStore, ReportCounters, ScheduleStore, UserRegistry, UserSearchIndex
+from write_queue import WriteBehindQueue
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 
 class DataManager(QObject):
+    # Bulk reloads (startup, hydration) emit order_updated/user_data_changed;
+    # single-entity writes and synced changes emit the typed signals below.
     order_updated = pyqtSignal()
     user_data_changed = pyqtSignal()
+    order_added = pyqtSignal(str)
+    order_changed = pyqtSignal(str, list)
+    order_removed = pyqtSignal(str)
+    # Dropped from memory by the bounded cache; the rows still exist.
+    orders_evicted = pyqtSignal(list)
+    schedule_added = pyqtSignal(int)
+    schedule_changed = pyqtSignal(int, list)
+    schedule_removed = pyqtSignal(int)
+    user_added = pyqtSignal(int)
+    user_removed = pyqtSignal(int)
+    loading_progress = pyqtSignal(str, int)
+    users_loaded = pyqtSignal()
+    data_loaded = pyqtSignal()
+    loading_failed = pyqtSignal(str)
+    write_failed = pyqtSignal(str, str)
+    _write_rejected = pyqtSignal(str, str, object)
+
+    ORDER_PAGE_SIZE = 200
+    SCHEDULE_PAGE_SIZE = 200
+    IN_CLAUSE_SIZE = 500
+    ORDER_SORT_FIELDS = {
+        'order_date': 'Order Date',
+        'order_id': 'Order ID',
+        'status': 'Status',
+        'user_email': 'User Email'
+    }
+    SCHEDULE_SORT_FIELDS = {
+        'id': 'ID',
+        'date': 'Date',
+        'status': 'Status',
+        'type': 'Type',
+        'user_email': 'User Email'
+    }
+    CLOSED_STATUSES = ('Completed', 'Cancelled')
+    # Matched with IN rather than NOT IN so idx_orders_status is used.
+    ACTIVE_STATUSES = tuple(sorted(set(ORDER_STATUSES) - set(CLOSED_STATUSES)))
+    SYNC_INTERVAL = 5.0
+    SYNC_BATCH_SIZE = 1000
+    # Seconds a skipped change_log id is re-read before it is taken to be
+    # a rolled-back transaction.
+    SYNC_GAP_TIMEOUT = 60.0
+    CHANGE_LOG_RETENTION = 100000
 
     def __init__(self):
         super().__init__()
+        # Queued, so a failed write is undone on this object's thread and
+        # after the in-memory change that went with it.
+        self._write_rejected.connect(self._reconcile_write, Qt.QueuedConnection)
         self.last_user_id = 301
-        self.db = None
-        self.cursor = None
-        self.user_data = {'Admin': {}, 'Staff': {}, 'Customer': {}}
-        self.orders = []
-        self.schedules = []
+        self.engine = None
+        self._lock = threading.RLock()
+        self.users = UserRegistry()
+        self.orders = OrderStore()
+        self.schedules = ScheduleStore()
+        self.reports = ReportCounters(self.CLOSED_STATUSES)
+        self.report_version = 0
+        self.analytics = OrderAnalytics()
+        self.users_ready = threading.Event()
+        self.ready = threading.Event()
+        self._cancel_loading = threading.Event()
+        self._loader = None
+        self.scope = (None, None)
+        self.scope_ready = threading.Event()
+        self._scope_generation = 0
+        self.origin = uuid.uuid4().hex
+        self.sync_token = 0
+        self._sync_gaps = {}
+        self.sync_interval = self.SYNC_INTERVAL
+        self._sync_thread = None
+        self._stop_sync = threading.Event()
+        self.write_behind = False
+        self.writer = None
+        # Budgets for the bounded order and schedule cache; None keeps
+        # everything loaded, as before.
+        self.cache_entries = None
+        self.cache_bytes = None
+
+    def start_loading(self):
+        with self._lock:
+            if self.ready.is_set() or (self._loader and self._loader.is_alive()):
+                return
+            self._cancel_loading.clear()
+            self._loader = threading.Thread(target=self._load_worker, name='DataManagerLoader', daemon=True)
+            self._loader.start()
+
+    def cancel_loading(self):
+        self._cancel_loading.set()
+        if self._loader and self._loader is not threading.current_thread():
+            self._loader.join()
+
+    def wait_for_users(self, timeout=None):
+        return self.users_ready.wait(timeout)
+
+    def wait_until_ready(self, timeout=None):
+        return self.ready.wait(timeout)
+
+    def wait_for_scope(self, timeout=None):
+        return self.scope_ready.wait(timeout)
+
+    def _load_worker(self):
+        # Orders and schedules are loaded per role by hydrate_for() after login.
+        try:
+            self.loading_progress.emit("Connecting to database", 0)
+            self.open_storage()
+            if self.write_behind:
+                self.enable_write_behind()
+            if self.cache_entries is not None or self.cache_bytes is not None:
+                self.enable_cache(self.cache_entries, self.cache_bytes)
+            if self._cancel_loading.is_set():
+                print("✗ Data loading cancelled")
+                return
+            self.loading_progress.emit("Loading users", 50)
+            if self.engine:
+                self.prune_change_log()
+                self.sync_token = self._current_sync_token()
+                self.load_users()
+            self.users_ready.set()
+            self.users_loaded.emit()
+            self.ready.set()
+            self.loading_progress.emit("Ready", 100)
+            self.user_data_changed.emit()
+            self.start_sync()
+        except Exception as e:
+            print(f"✗ Data loading failed: {e}")
+            self.users_ready.set()
+            self.loading_failed.emit(str(e))
 
+    def open_storage(self):
         try:
             self.connect_to_database()
             print("✓ Database connection established")
         except Exception as e:
             print(f"✗ Database connection failed: {str(e)}. Running in offline mode.")
-            self.load_mock_data()
+            try:
+                self.open_offline_database()
+            except Exception as e:
+                print(f"✗ Offline database unavailable: {str(e)}. Using mock data.")
+                self.engine = None
+                self.load_mock_data()
 
     def connect_to_database(self):
         try:
-            self.db = pymysql.connect(
+            self.engine = MySQLEngine(
+                pool_size=5,
                 host="localhost",
                 user="root",
                 password="",
@@ -36,207 +172,933 @@ class DataManager(QObject):
                 charset='utf8mb4',
                 cursorclass=pymysql.cursors.DictCursor
             )
-            self.cursor = self.db.cursor()
             self.create_tables()
-            self.load_data_from_db()
-        except pymysql.Error as err:
+        except DB_ERRORS as err:
             print(f"✗ Database connection error: {err}")
             raise
         except Exception as e:
             print(f"✗ Unexpected connection error: {e}")
             raise
 
+    def open_offline_database(self, path=OFFLINE_DB_PATH):
+        self.engine = SQLiteEngine(path)
+        self.create_tables()
+        print(f"✓ Offline database opened: {path}")
+
     def load_mock_data(self):
-        self.user_data['Admin']['admina@mail.com'] = {
+        self.users.add('Admin', UserRecord.from_dict({
             'id': 301,
             'fullname': 'Admin A',
             'password': self.hash_password('123'),
             'contact_info': '0900-000',
             'email_address': 'admina@mail.com',
             'home_address': 'HQ'
-        }
-        self.user_data['Staff']['staff@mail.com'] = {
+        }))
+        self.users.add('Staff', UserRecord.from_dict({
             'id': 201,
             'fullname': 'Staff 1',
             'password': self.hash_password('123'),
             'contact_info': '0911-111',
             'email_address': 'staff@mail.com',
             'home_address': 'Warehouse'
-        }
-        self.user_data['Customer']['john.doe@example.com'] = {
+        }))
+        self.users.add('Customer', UserRecord.from_dict({
             'id': 101,
             'fullname': 'John Doe',
             'password': self.hash_password('123'),
             'contact_info': '0912-222',
             'email_address': 'john.doe@example.com',
             'home_address': '123 Main St, Anytown'
-        }
+        }))
         print("✓ Mock data loaded (offline mode)")
 
+    def close(self):
+        self.cancel_loading()
+        self.stop_sync()
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+        if self.engine:
+            self.engine.close()
+
+    def enable_write_behind(self):
+        if self.engine and not self.writer:
+            self.writer = WriteBehindQueue(self.engine, self._on_write_failed)
+            print("✓ Write-behind queue started")
+
+    def enable_cache(self, max_entries=None, max_bytes=None):
+        # Orders and schedules each get the budget. Active orders, today's
+        # schedules and the logged-in customer's rows always stay resident;
+        # get_order/get_schedule fetch evicted rows back on demand.
+        with self._lock:
+            self.cache_entries = max_entries
+            self.cache_bytes = max_bytes
+            self.orders.attach_cache(EntityCache(max_entries, max_bytes, self._order_is_hot))
+            self.schedules.attach_cache(EntityCache(max_entries, max_bytes, self._schedule_is_hot))
+        print("✓ Bounded entity cache enabled")
+        self._evict_cold()
+
+    def _is_own(self, entity):
+        role, email = self.scope
+        return role == 'Customer' and UserRegistry.normalize(entity['User Email']) == UserRegistry.normalize(email)
+
+    def _order_is_hot(self, order):
+        return order['Status'] not in self.CLOSED_STATUSES or self._is_own(order)
+
+    def _schedule_is_hot(self, schedule):
+        return schedule['Date'] == QDate.currentDate().toString("MM/dd/yyyy") or self._is_own(schedule)
+
+    def _evict_cold(self, keep_orders=(), keep_schedules=()):
+        if self.orders.cache is None:
+            return
+        with self._lock:
+            evicted = self.orders.evict_cold(keep_orders)
+            self.schedules.evict_cold(keep_schedules)
+        if evicted:
+            self.orders_evicted.emit(evicted)
+
+    def cache_stats(self):
+        with self._lock:
+            if self.orders.cache is None:
+                return None
+            return {'orders': self.orders.cache.stats(), 'schedules': self.schedules.cache.stats()}
+
+    def get_order(self, order_id):
+        with self._lock:
+            order = self.orders.get(order_id)
+            cache = self.orders.cache
+            if cache is not None:
+                if order is not None:
+                    cache.hits += 1
+                else:
+                    cache.misses += 1
+        if order is not None or cache is None or not self.engine:
+            return order
+        try:
+            self._merge_orders(self.fetch_orders("WHERE order_id = %s", (order_id,)))
+        except DB_ERRORS as err:
+            print(f"✗ Error fetching order {order_id}: {err}")
+            return None
+        with self._lock:
+            order = self.orders.get(order_id)
+        self._evict_cold(keep_orders=[order_id])
+        return order
+
+    def get_schedule(self, schedule_id):
+        with self._lock:
+            schedule = self.schedules.get(schedule_id)
+            cache = self.schedules.cache
+            if cache is not None:
+                if schedule is not None:
+                    cache.hits += 1
+                else:
+                    cache.misses += 1
+        if schedule is not None or cache is None or not self.engine:
+            return schedule
+        try:
+            self._merge_schedules(self.fetch_schedules("WHERE id = %s", (schedule_id,)))
+        except DB_ERRORS as err:
+            print(f"✗ Error fetching schedule {schedule_id}: {err}")
+            return None
+        with self._lock:
+            schedule = self.schedules.get(schedule_id)
+        self._evict_cold(keep_schedules=[schedule_id])
+        return schedule
+
+    def flush_writes(self):
+        if self.writer:
+            self.writer.flush()
+
+    def _on_write_failed(self, description, error, reconcile):
+        self._write_rejected.emit(description, error, reconcile)
+
+    def _reconcile_write(self, description, error, reconcile):
+        # The counters already include the lost write; recount on next read.
+        self.invalidate_reports()
+        self.analytics.reset()
+        if reconcile:
+            try:
+                reconcile()
+            except DB_ERRORS as err:
+                print(f"✗ Error reloading after failed write ({description}): {err}")
+        self.write_failed.emit(description, error)
+
+    def _write(self, description, write, reconcile=None, committed=None):
+        # Runs write(cursor) now, or hands it to the write-behind queue; the
+        # caller updates the in-memory stores either way. If a queued write
+        # fails, reconcile() brings those stores back in line. committed()
+        # gets write's return value only after its transaction commits.
+        if not self.engine:
+            return
+        if self.writer:
+            self.writer.submit(description, write, reconcile, committed)
+        else:
+            with self.engine.transaction() as cursor:
+                result = write(cursor)
+            if committed:
+                committed(result)
+
     def hash_password(self, password):
         return hashlib.sha256(password.encode()).hexdigest()
 
     def create_tables(self):
-        if not self.cursor:
-            print("✗ No database cursor available")
+        if not self.engine:
+            print("✗ No database connection available")
             return
 
         try:
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    id INT PRIMARY KEY,
-                    fullname VARCHAR(255),
-                    password VARCHAR(255),
-                    contact_info VARCHAR(255),
-                    email_address VARCHAR(255) UNIQUE,
-                    home_address TEXT,
-                    role ENUM('Admin', 'Staff', 'Customer')
-                )
-            """)
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS orders (
-                    order_id VARCHAR(50) PRIMARY KEY,
-                    user_email VARCHAR(255),
-                    total DECIMAL(10, 2),
-                    status VARCHAR(50),
-                    order_date DATE
-                )
-            """)
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS order_items (
-                    id INT PRIMARY KEY AUTO_INCREMENT,
-                    order_id VARCHAR(50),
-                    item VARCHAR(255),
-                    price_per_kg DECIMAL(10, 2),
-                    actual_kg DECIMAL(10, 2),
-                    subtotal DECIMAL(10, 2)
-                )
-            """)
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS schedules (
-                    id INT PRIMARY KEY AUTO_INCREMENT,
-                    user_email VARCHAR(255),
-                    type VARCHAR(50),
-                    date VARCHAR(50),
-                    time VARCHAR(50),
-                    address TEXT,
-                    email VARCHAR(255),
-                    status VARCHAR(50)
-                )
-            """)
-            self.db.commit()
-
-            self.cursor.execute("SELECT * FROM users WHERE email_address = 'admina@mail.com'")
-            if not self.cursor.fetchone():
-                self.cursor.execute("""
-                    INSERT INTO users (id, fullname, password, contact_info, email_address, home_address, role)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """, (301, 'Admin A', self.hash_password('123'), '0900-000', 'admina@mail.com', 'HQ', 'Admin'))
-                self.db.commit()
-                print("✓ Default admin account created")
-        except pymysql.Error as err:
+            with self.engine.transaction() as cursor:
+                self.engine.create_schema(cursor)
+                cursor.execute("SELECT * FROM users WHERE email_address = 'admina@mail.com'")
+                if not cursor.fetchone():
+                    cursor.execute("""
+                        INSERT INTO users (id, fullname, password, contact_info, email_address, home_address, role)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    """, (301, 'Admin A', self.hash_password('123'), '0900-000', 'admina@mail.com', 'HQ', 'Admin'))
+                    print("✓ Default admin account created")
+            migrate(self.engine)
+        except DB_ERRORS as err:
             print(f"✗ Error creating tables: {err}")
-            self.db.rollback()
 
-    def load_data_from_db(self):
-        if not self.cursor:
-            print("✗ No database cursor available")
+    def load_users(self):
+        if not self.engine:
+            print("✗ No database connection available")
+            return
+
+        try:
+            users = self.fetch_users()
+            with self._lock:
+                for role, user in users:
+                    if user['email_address'] in self.users:
+                        continue
+                    self.users.add(role, user)
+                    if user['id'] > self.last_user_id:
+                        self.last_user_id = user['id']
+            print(f"✓ Loaded {len(users)} users")
+        except DB_ERRORS as err:
+            print(f"✗ Error loading users: {err}")
+
+    def _user_from_row(self, user):
+        return user['role'], UserRecord(
+            user['id'],
+            user['fullname'],
+            user['password'],
+            user['contact_info'],
+            user['email_address'],
+            user['home_address']
+        )
+
+    def _item_from_row(self, item):
+        return ItemRecord(
+            item['id'],
+            item['item'],
+            float(item['price_per_kg']),
+            float(item['actual_kg']) if item['actual_kg'] else None,
+            float(item['subtotal']) if item['subtotal'] else None
+        )
+
+    def _order_from_row(self, order, items):
+        return OrderRecord(
+            order['order_id'],
+            order['user_email'],
+            float(order['total']) if order['total'] else None,
+            order['status'],
+            str(order['order_date']),
+            items
+        )
+
+    def _schedule_from_row(self, schedule):
+        return ScheduleRecord(
+            schedule['id'],
+            schedule['user_email'],
+            schedule['type'],
+            schedule['date'],
+            schedule['time'],
+            schedule['address'],
+            schedule['email'],
+            schedule['status']
+        )
+
+    def fetch_users(self, where="", params=(), suffix=""):
+        self.flush_writes()
+        with self.engine.transaction() as cursor:
+            cursor.execute(f"SELECT * FROM users {where} {suffix}", params)
+            users = cursor.fetchall()
+        return [self._user_from_row(user) for user in users]
+
+    def fetch_orders(self, where="", params=(), suffix=""):
+        self.flush_writes()
+        with self.engine.transaction() as cursor:
+            cursor.execute(f"SELECT * FROM orders {where} {suffix}", params)
+            orders = cursor.fetchall()
+            items_by_order = {}
+            if not where and not suffix:
+                cursor.execute("SELECT * FROM order_items ORDER BY id")
+            else:
+                # The same filter picks the items, so a scoped load is two
+                # queries however many orders match. A derived table, as
+                # MySQL rejects LIMIT inside an IN subquery.
+                cursor.execute(f"""
+                    SELECT i.* FROM order_items i
+                    JOIN (SELECT order_id FROM orders {where} {suffix}) o ON o.order_id = i.order_id
+                    ORDER BY i.id
+                """, params)
+            items = cursor.fetchall()
+        for item in items:
+            items_by_order.setdefault(item['order_id'], []).append(self._item_from_row(item))
+        return [self._order_from_row(order, items_by_order.get(order['order_id'], [])) for order in orders]
+
+    def fetch_schedules(self, where="", params=(), suffix=""):
+        self.flush_writes()
+        with self.engine.transaction() as cursor:
+            cursor.execute(f"SELECT * FROM schedules {where} {suffix}", params)
+            schedules = cursor.fetchall()
+        return [self._schedule_from_row(schedule) for schedule in schedules]
+
+    def _merge_orders(self, orders, generation=None, refresh=False):
+        with self._lock:
+            if generation is not None and generation != self._scope_generation:
+                return False
+            for order in orders:
+                if order['Order ID'] not in self.orders:
+                    self.orders.add(order)
+                elif refresh:
+                    self.orders.update(order['Order ID'], order)
+            return True
+
+    def _merge_schedules(self, schedules, generation=None, refresh=False):
+        with self._lock:
+            if generation is not None and generation != self._scope_generation:
+                return False
+            for schedule in schedules:
+                if schedule['ID'] not in self.schedules:
+                    self.schedules.add(schedule)
+                elif refresh:
+                    self.schedules.update(schedule['ID'], schedule)
+            return True
+
+    def hydrate_for(self, role, email=None, background=True):
+        with self._lock:
+            self._scope_generation += 1
+            generation = self._scope_generation
+            self.scope = (role, email)
+            self.orders.clear()
+            self.schedules.clear()
+            self.scope_ready.clear()
+        if background:
+            threading.Thread(target=self._hydrate_scope, args=(generation,),
+                             name='DataManagerScope', daemon=True).start()
+        else:
+            self._hydrate_scope(generation)
+
+    def _hydrate_scope(self, generation):
+        role, email = self.scope
+        try:
+            if self.engine:
+                if role == 'Customer':
+                    self._merge_orders(self.fetch_orders("WHERE user_email = %s", (email,)), generation)
+                    self._merge_schedules(self.fetch_schedules("WHERE user_email = %s", (email,)), generation)
+                elif role == 'Staff':
+                    today = QDate.currentDate().toString("MM/dd/yyyy")
+                    statuses = ', '.join(['%s'] * len(self.ACTIVE_STATUSES))
+                    self._merge_orders(self.fetch_orders(f"WHERE status IN ({statuses})", self.ACTIVE_STATUSES), generation)
+                    self._merge_schedules(self.fetch_schedules("WHERE date = %s", (today,)), generation)
+                elif role == 'Admin':
+                    # Admin views page through query_orders/query_schedules;
+                    # warm the cache with the first page of each.
+                    self.query_orders(limit=self.ORDER_PAGE_SIZE)
+                    self.query_schedules(limit=self.SCHEDULE_PAGE_SIZE)
+            if generation != self._scope_generation:
+                return
+            self._evict_cold()
+            print(f"✓ Loaded {len(self.orders)} orders and {len(self.schedules)} schedules for {role}")
+            self.scope_ready.set()
+            self.data_loaded.emit()
+            self.order_updated.emit()
+        except DB_ERRORS as err:
+            print(f"✗ Error loading {role} data: {err}")
+            self.loading_failed.emit(str(err))
+
+    def _keyset_clause(self, sort, key, descending, after):
+        op = "<" if descending else ">"
+        if sort == key:
+            return f"{key} {op} %s", [after[1]]
+        # The leading bound on sort alone lets both engines seek the index
+        # instead of scanning it up to the cursor.
+        return f"{sort} {op}= %s AND ({sort} {op} %s OR {key} {op} %s)", [after[0], after[0], after[1]]
+
+    def query_orders(self, status=None, date_from=None, date_to=None, customer=None,
+                     sort='order_date', descending=True, after=None, limit=50):
+        if sort not in self.ORDER_SORT_FIELDS:
+            raise ValueError(f"Unsupported order sort column: {sort}")
+        try:
+            statuses = [status] if isinstance(status, str) else list(status or [])
+            if not self.engine:
+                return self._query_orders_in_memory(statuses, date_from, date_to, customer,
+                                                    sort, descending, after, limit)
+
+            conditions, params = [], []
+            if statuses:
+                conditions.append(f"status IN ({', '.join(['%s'] * len(statuses))})")
+                params.extend(statuses)
+            if date_from:
+                conditions.append("order_date >= %s")
+                params.append(date_from)
+            if date_to:
+                conditions.append("order_date <= %s")
+                params.append(date_to)
+            if customer:
+                conditions.append("user_email = %s")
+                params.append(customer)
+            if after is not None:
+                clause, clause_params = self._keyset_clause(sort, 'order_id', descending, after)
+                conditions.append(clause)
+                params.extend(clause_params)
+            where = "WHERE " + " AND ".join(conditions) if conditions else ""
+            direction = "DESC" if descending else "ASC"
+            order_by = f"ORDER BY {sort} {direction}"
+            if sort != 'order_id':
+                order_by += f", order_id {direction}"
+            rows = self.fetch_orders(where, params, f"{order_by} LIMIT {int(limit) + 1}")
+
+            with self._lock:
+                self._merge_orders(rows[:limit], refresh=True)
+                page = [self.orders.get(order['Order ID']) for order in rows[:limit]]
+                # The latest page stays resident while it is on screen.
+                self.orders.pin(order['Order ID'] for order in page)
+            self._evict_cold()
+            next_cursor = None
+            if len(rows) > limit and page:
+                next_cursor = (page[-1][self.ORDER_SORT_FIELDS[sort]], page[-1]['Order ID'])
+            return page, next_cursor
+        except DB_ERRORS as err:
+            print(f"✗ Error querying orders: {err}")
+            return [], None
+
+    def _query_orders_in_memory(self, statuses, date_from, date_to, customer, sort, descending, after, limit):
+        field = self.ORDER_SORT_FIELDS[sort]
+        with self._lock:
+            orders = [
+                o for o in self.orders
+                if (not statuses or o['Status'] in statuses)
+                and (not date_from or o['Order Date'] >= date_from)
+                and (not date_to or o['Order Date'] <= date_to)
+                and (not customer or o['User Email'] == customer)
+            ]
+        return self._page_in_memory(orders, field, 'Order ID', descending, after, limit)
+
+    def _page_in_memory(self, rows, field, key, descending, after, limit):
+        rows.sort(key=lambda row: (row[field], row[key]), reverse=descending)
+        if after is not None:
+            after = tuple(after)
+            rows = [row for row in rows
+                    if (row[field], row[key]) != after and ((row[field], row[key]) < after) == descending]
+        next_cursor = (rows[limit - 1][field], rows[limit - 1][key]) if len(rows) > limit else None
+        return rows[:limit], next_cursor
+
+    def query_schedules(self, status=None, schedule_date=None, customer=None,
+                        sort='id', descending=True, after=None, limit=50):
+        if sort not in self.SCHEDULE_SORT_FIELDS:
+            raise ValueError(f"Unsupported schedule sort column: {sort}")
+        try:
+            statuses = [status] if isinstance(status, str) else list(status or [])
+            if not self.engine:
+                field = self.SCHEDULE_SORT_FIELDS[sort]
+                with self._lock:
+                    schedules = [
+                        s for s in self.schedules
+                        if (not statuses or s['Status'] in statuses)
+                        and (not schedule_date or s['Date'] == schedule_date)
+                        and (not customer or s['User Email'] == customer)
+                    ]
+                return self._page_in_memory(schedules, field, 'ID', descending, after, limit)
+
+            conditions, params = [], []
+            if statuses:
+                conditions.append(f"status IN ({', '.join(['%s'] * len(statuses))})")
+                params.extend(statuses)
+            if schedule_date:
+                conditions.append("date = %s")
+                params.append(schedule_date)
+            if customer:
+                conditions.append("user_email = %s")
+                params.append(customer)
+            if after is not None:
+                clause, clause_params = self._keyset_clause(sort, 'id', descending, after)
+                conditions.append(clause)
+                params.extend(clause_params)
+            where = "WHERE " + " AND ".join(conditions) if conditions else ""
+            direction = "DESC" if descending else "ASC"
+            order_by = f"ORDER BY {sort} {direction}"
+            if sort != 'id':
+                order_by += f", id {direction}"
+            rows = self.fetch_schedules(where, params, f"{order_by} LIMIT {int(limit) + 1}")
+
+            with self._lock:
+                self._merge_schedules(rows[:limit], refresh=True)
+                page = [self.schedules.get(schedule['ID']) for schedule in rows[:limit]]
+                self.schedules.pin(schedule['ID'] for schedule in page)
+            self._evict_cold()
+            next_cursor = None
+            if len(rows) > limit and page:
+                next_cursor = (page[-1][self.SCHEDULE_SORT_FIELDS[sort]], page[-1]['ID'])
+            return page, next_cursor
+        except DB_ERRORS as err:
+            print(f"✗ Error querying schedules: {err}")
+            return [], None
+
+    def get_report_totals(self):
+        try:
+            counters = self._report_counters()
+            with self._lock:
+                return counters.totals()
+        except DB_ERRORS as err:
+            print(f"✗ Error loading report totals: {err}")
+            return {'orders': 0, 'revenue': 0.0, 'open_schedules': 0}
+
+    def get_daily_totals(self, order_date, schedule_date):
+        try:
+            counters = self._report_counters()
+            with self._lock:
+                return counters.daily(order_date, schedule_date)
+        except DB_ERRORS as err:
+            print(f"✗ Error loading daily totals: {err}")
+            return {'orders': 0, 'revenue': 0.0, 'schedules': 0}
+
+    def _report_counters(self):
+        # Seeded once from the daily summary tables, then kept current by
+        # this client's writes. Changes from other clients invalidate them,
+        # and the next read seeds again.
+        with self._lock:
+            if self.reports.ready:
+                return self.reports
+            version = self.report_version
+        counters = ReportCounters(self.CLOSED_STATUSES)
+        self._seed_report_counters(counters)
+        with self._lock:
+            if self.report_version == version:
+                self.reports = counters
+        return counters
+
+    def _seed_report_counters(self, counters):
+        if not self.engine:
+            self._count_report_rows(counters)
             return
+        self.flush_writes()
+        # One transaction, so order and schedule totals come from the same
+        # snapshot even while other clients are writing.
+        with self.engine.transaction() as cursor:
+            cursor.execute("SELECT order_date, status, orders, revenue FROM daily_order_totals")
+            for row in cursor.fetchall():
+                counters.count_orders(str(row['order_date']), row['status'], row['orders'],
+                                      counters.cents(row['revenue']))
+            cursor.execute("SELECT date, status, schedules FROM daily_schedule_totals")
+            for row in cursor.fetchall():
+                counters.count_schedules(row['date'], row['status'], row['schedules'])
+        counters.ready = True
 
+    def _count_report_rows(self, counters):
+        if not self.engine:
+            with self._lock:
+                for order in self.orders:
+                    counters.count_order(order)
+                for schedule in self.schedules:
+                    counters.count_schedule(schedule)
+        else:
+            self.flush_writes()
+            with self.engine.transaction() as cursor:
+                cursor.execute("""
+                    SELECT order_date, COALESCE(status, '') AS status, COUNT(*) AS orders, SUM(total) AS revenue
+                    FROM orders GROUP BY order_date, COALESCE(status, '')
+                """)
+                for row in cursor.fetchall():
+                    counters.count_orders(str(row['order_date']), row['status'], row['orders'],
+                                          counters.cents(row['revenue']))
+                cursor.execute("""
+                    SELECT COALESCE(date, '') AS date, COALESCE(status, '') AS status, COUNT(*) AS schedules
+                    FROM schedules GROUP BY COALESCE(date, ''), COALESCE(status, '')
+                """)
+                for row in cursor.fetchall():
+                    counters.count_schedules(row['date'], row['status'], row['schedules'])
+        counters.ready = True
+
+    def invalidate_reports(self):
+        with self._lock:
+            self.report_version += 1
+            self.reports = ReportCounters(self.CLOSED_STATUSES)
+
+    def _recount_order(self, before, after):
+        # Caller holds self._lock; before/after are ReportCounters.order_fields.
+        self.report_version += 1
+        if self.reports.ready:
+            if before:
+                self.reports.count_order(before, -1)
+            if after:
+                self.reports.count_order(after)
+
+    def _recount_schedule(self, schedule):
+        self.report_version += 1
+        if self.reports.ready:
+            self.reports.count_schedule(schedule)
+
+    def verify_report_counters(self):
+        # Compares the running counters, and through them the summary
+        # tables they were seeded from, with a recount of the orders and
+        # schedules tables; returns the names of the aggregates that differ.
+        with self._lock:
+            if not self.reports.ready:
+                return []
+            version = self.report_version
+        expected = ReportCounters(self.CLOSED_STATUSES)
+        self._count_report_rows(expected)
+        with self._lock:
+            if self.report_version != version:
+                print("✗ Report counters changed during the check, try again")
+                return None
+            actual = self.reports.snapshot()
+        mismatches = [name for name, value in expected.snapshot().items() if actual[name] != value]
+        if mismatches:
+            print(f"✗ Report counters out of step: {', '.join(mismatches)}")
+        else:
+            print("✓ Report counters match a full recount")
+        return mismatches
+
+    def get_revenue_report(self, date_from, date_to):
+        # Both reads are range scans over the (order_date, ...) primary keys
+        # of the summary tables, taken from one snapshot.
+        report = {'orders': 0, 'revenue': 0.0, 'kg': 0.0, 'days': [], 'items': {}}
+        try:
+            if not self.engine:
+                return self._revenue_report_in_memory(report, date_from, date_to)
+            self.flush_writes()
+            with self.engine.transaction() as cursor:
+                cursor.execute("""
+                    SELECT order_date, SUM(orders) AS orders, SUM(revenue) AS revenue
+                    FROM daily_order_totals WHERE order_date >= %s AND order_date <= %s
+                    GROUP BY order_date ORDER BY order_date
+                """, (date_from, date_to))
+                days = cursor.fetchall()
+                cursor.execute("""
+                    SELECT item, SUM(items) AS items, SUM(kg) AS kg, SUM(revenue) AS revenue
+                    FROM daily_item_totals WHERE order_date >= %s AND order_date <= %s
+                    GROUP BY item ORDER BY item
+                """, (date_from, date_to))
+                items = cursor.fetchall()
+            for row in days:
+                if row['orders']:
+                    report['days'].append((str(row['order_date']), int(row['orders']), float(row['revenue'])))
+            for row in items:
+                if row['items']:
+                    report['items'][row['item']] = {'items': int(row['items']), 'kg': float(row['kg']),
+                                                    'revenue': float(row['revenue'])}
+            report['orders'] = sum(orders for day, orders, revenue in report['days'])
+            report['revenue'] = round(sum(revenue for day, orders, revenue in report['days']), 2)
+            report['kg'] = round(sum(item['kg'] for item in report['items'].values()), 2)
+            return report
+        except DB_ERRORS as err:
+            print(f"✗ Error loading revenue report: {err}")
+            return report
+
+    def _revenue_report_in_memory(self, report, date_from, date_to):
+        days = {}
+        with self._lock:
+            for order in self.orders:
+                if not date_from <= order['Order Date'] <= date_to:
+                    continue
+                orders, revenue = days.get(order['Order Date'], (0, 0.0))
+                days[order['Order Date']] = (orders + 1, revenue + float(order['Total'] or 0))
+                for item in order['items']:
+                    totals = report['items'].setdefault(item['item'], {'items': 0, 'kg': 0.0, 'revenue': 0.0})
+                    totals['items'] += 1
+                    totals['kg'] += float(item['actual_kg'] or 0)
+                    totals['revenue'] += float(item['subtotal'] or 0)
+        report['days'] = [(day, orders, revenue) for day, (orders, revenue) in sorted(days.items())]
+        report['orders'] = sum(orders for orders, revenue in days.values())
+        report['revenue'] = round(sum(revenue for orders, revenue in days.values()), 2)
+        report['kg'] = round(sum(item['kg'] for item in report['items'].values()), 2)
+        return report
+
+    def prepare_analytics(self):
+        # Built once, outside self._lock; kept current by the write paths
+        # and by changes synced from other clients.
+        self.analytics.build(self._load_analytics_rows)
+
+    def _load_analytics_rows(self):
+        if not self.engine:
+            with self._lock:
+                orders = [(o['Order ID'], o['User Email'], o['Order Date'], o['Total']) for o in self.orders]
+                items = [(o['Order ID'], i['item'], i['actual_kg'], i['subtotal'])
+                         for o in self.orders for i in o['items']]
+            return orders, items
+        self.flush_writes()
+        with self.engine.transaction() as cursor:
+            cursor.execute("SELECT order_id, user_email, order_date, total FROM orders")
+            orders = [(row['order_id'], row['user_email'], row['order_date'], row['total'])
+                      for row in cursor.fetchall()]
+            cursor.execute("SELECT order_id, item, actual_kg, subtotal FROM order_items ORDER BY order_id, id")
+            items = [(row['order_id'], row['item'], row['actual_kg'], row['subtotal'])
+                     for row in cursor.fetchall()]
+        return orders, items
+
+    def get_analytics(self, by, date_from, date_to):
+        try:
+            self.prepare_analytics()
+            return self.analytics.summarize(by, date_from, date_to)
+        except DB_ERRORS as err:
+            print(f"✗ Error loading analytics: {err}")
+            return []
+
+    def get_year_over_year(self, year):
+        try:
+            self.prepare_analytics()
+            return self.analytics.year_over_year(year)
+        except DB_ERRORS as err:
+            print(f"✗ Error loading analytics: {err}")
+            return []
+
+    def _summarize_order(self, cursor, order_id, sign):
+        # Adds (sign=1) or takes back (sign=-1) the order's share of the daily
+        # summary tables, read inside the caller's transaction so the tables
+        # stay exact whatever other clients did in between.
+        cursor.execute(f"SELECT order_date, status, total FROM orders WHERE order_id = %s {self.engine.row_lock}",
+                       (order_id,))
+        order = cursor.fetchone()
+        if order is None:
+            return
+        keys = {'order_date': order['order_date'], 'status': order['status'] or ''}
+        self.engine.add_totals(cursor, 'daily_order_totals', keys,
+                               {'orders': sign, 'revenue': sign * (order['total'] or 0)})
+        cursor.execute("""
+            SELECT item, COUNT(*) AS items, SUM(actual_kg) AS kg, SUM(subtotal) AS revenue
+            FROM order_items WHERE order_id = %s GROUP BY item
+        """, (order_id,))
+        for row in cursor.fetchall():
+            self.engine.add_totals(cursor, 'daily_item_totals', dict(keys, item=row['item'] or ''),
+                                   {'items': sign * row['items'], 'kg': sign * (row['kg'] or 0),
+                                    'revenue': sign * (row['revenue'] or 0)})
+
+    def _log_change(self, cursor, entity, key, op='upsert'):
+        cursor.execute("""
+            INSERT INTO change_log (entity, entity_key, op, origin)
+            VALUES (%s, %s, %s, %s)
+        """, (entity, str(key), op, self.origin))
+
+    def _current_sync_token(self):
+        with self.engine.transaction() as cursor:
+            cursor.execute("SELECT MAX(id) AS token FROM change_log")
+            row = cursor.fetchone()
+        return row['token'] or 0
+
+    def prune_change_log(self):
         try:
-            self.cursor.execute("SELECT * FROM users")
-            users = self.cursor.fetchall()
-            for user in users:
-                role = user['role']
-                email = user['email_address']
-                self.user_data[role][email] = {
-                    'id': user['id'],
-                    'fullname': user['fullname'],
-                    'password': user['password'],
-                    'contact_info': user['contact_info'],
-                    'email_address': email,
-                    'home_address': user['home_address']
-                }
-                if user['id'] > self.last_user_id:
-                    self.last_user_id = user['id']
-
-            self.cursor.execute("SELECT * FROM orders")
-            orders = self.cursor.fetchall()
+            token = self._current_sync_token()
+            if token > self.CHANGE_LOG_RETENTION:
+                with self.engine.transaction() as cursor:
+                    cursor.execute("DELETE FROM change_log WHERE id <= %s", (token - self.CHANGE_LOG_RETENTION,))
+        except DB_ERRORS as err:
+            print(f"✗ Error pruning change log: {err}")
+
+    def start_sync(self, interval=None):
+        if not self.engine or (self._sync_thread and self._sync_thread.is_alive()):
+            return
+        self.sync_interval = interval or self.sync_interval
+        self._stop_sync.clear()
+        self._sync_thread = threading.Thread(target=self._sync_worker, name='DataManagerSync', daemon=True)
+        self._sync_thread.start()
+
+    def stop_sync(self):
+        self._stop_sync.set()
+        if self._sync_thread and self._sync_thread is not threading.current_thread():
+            self._sync_thread.join()
+
+    def _sync_worker(self):
+        while not self._stop_sync.wait(self.sync_interval):
+            self.poll_changes()
+
+    def poll_changes(self):
+        if not self.engine:
+            return 0
+        try:
+            with self.engine.transaction() as cursor:
+                cursor.execute("SELECT MIN(id) AS oldest FROM change_log")
+                oldest = cursor.fetchone()['oldest']
+                cursor.execute("""
+                    SELECT id, entity, entity_key, op, origin FROM change_log
+                    WHERE id > %s ORDER BY id LIMIT %s
+                """, (self.sync_token, self.SYNC_BATCH_SIZE))
+                rows = cursor.fetchall()
+                late = []
+                if self._sync_gaps:
+                    gaps = list(self._sync_gaps)
+                    cursor.execute(f"""
+                        SELECT id, entity, entity_key, op, origin FROM change_log
+                        WHERE id IN ({', '.join(['%s'] * len(gaps))})
+                    """, gaps)
+                    late = cursor.fetchall()
+            if oldest and oldest > self.sync_token + 1:
+                # Entries this client has not seen were pruned; start over.
+                print("✗ Change log gap detected, reloading data")
+                self.invalidate_reports()
+                self.analytics.reset()
+                self.sync_token = self._current_sync_token()
+                self._sync_gaps = {}
+                self.load_users()
+                if self.scope[0]:
+                    self.hydrate_for(*self.scope, background=False)
+                self.user_data_changed.emit()
+                return 0
+            if not rows and not late:
+                return 0
+
+            # AUTO_INCREMENT ids are handed out before their transaction
+            # commits, so a lower id can become visible after a higher one.
+            # Skipped ids are re-read on later polls until they show up.
+            now = time.monotonic()
+            token = self.sync_token
+            gaps = dict(self._sync_gaps)
+            for row in rows:
+                for missing in range(max(token + 1, row['id'] - self.SYNC_BATCH_SIZE), row['id']):
+                    gaps[missing] = now
+                token = row['id']
+            for row in late:
+                gaps.pop(row['id'], None)
+            gaps = {key: seen for key, seen in gaps.items() if now - seen < self.SYNC_GAP_TIMEOUT}
+
+            changes = {}
+            for row in list(late) + list(rows):
+                if row['origin'] != self.origin:
+                    changes[(row['entity'], row['entity_key'])] = row['op']
+            if any(entity in ('order', 'schedule') for entity, key in changes):
+                self.invalidate_reports()
+            if changes:
+                self._apply_changes(changes)
+            # Only move on once the rows are in; a failed fetch is retried.
+            self.sync_token = token
+            self._sync_gaps = gaps
+            return len(changes)
+        except DB_ERRORS as err:
+            print(f"✗ Error polling changes: {err}")
+            return 0
+
+    def _apply_changes(self, changes):
+        order_ids = [key for (entity, key), op in changes.items() if entity == 'order']
+        schedule_ids = [int(key) for (entity, key), op in changes.items() if entity == 'schedule']
+        user_ids = [int(key) for (entity, key), op in changes.items() if entity == 'user']
+
+        orders = self._fetch_by_keys(self.fetch_orders, 'order_id', order_ids)
+        schedules = self._fetch_by_keys(self.fetch_schedules, 'id', schedule_ids)
+        users = self._fetch_by_keys(self.fetch_users, 'id', user_ids)
+
+        events = []
+        with self._lock:
             for order in orders:
-                order_dict = {
-                    'Order ID': order['order_id'],
-                    'User Email': order['user_email'],
-                    'Total': float(order['total']) if order['total'] else None,
-                    'Status': order['status'],
-                    'Order Date': str(order['order_date'])
-                }
-                self.cursor.execute("SELECT * FROM order_items WHERE order_id = %s", (order['order_id'],))
-                items = self.cursor.fetchall()
-                order_dict['items'] = [
-                    {
-                        'id': item['id'],
-                        'item': item['item'],
-                        'price_per_kg': float(item['price_per_kg']),
-                        'actual_kg': float(item['actual_kg']) if item['actual_kg'] else None,
-                        'subtotal': float(item['subtotal']) if item['subtotal'] else None
-                    } for item in items
-                ]
-                self.orders.append(order_dict)
-
-            self.cursor.execute("SELECT * FROM schedules")
-            schedules = self.cursor.fetchall()
+                self.analytics.upsert_order(order)
+                existing = self.orders.get(order['Order ID'])
+                if existing is not None:
+                    fields = [field for field in order if existing.get(field) != order[field]]
+                    if fields:
+                        self.orders.update(order['Order ID'], order)
+                        events.append((self.order_changed, order['Order ID'], fields))
+                elif self._in_scope('order', order):
+                    self.orders.add(order)
+                    events.append((self.order_added, order['Order ID']))
+            fetched_order_ids = {order['Order ID'] for order in orders}
+            for order_id in order_ids:
+                if order_id not in fetched_order_ids:
+                    self.analytics.remove_order(order_id)
+                    if self.orders.remove(order_id):
+                        events.append((self.order_removed, order_id))
             for schedule in schedules:
-                self.schedules.append({
-                    'ID': schedule['id'],
-                    'User Email': schedule['user_email'],
-                    'Type': schedule['type'],
-                    'Date': schedule['date'],
-                    'Time': schedule['time'],
-                    'Address': schedule['address'],
-                    'Email': schedule['email'],
-                    'Status': schedule['status']
-                })
-
-            print(f"✓ Loaded {len(users)} users, {len(orders)} orders, {len(schedules)} schedules")
-        except pymysql.Error as err:
-            print(f"✗ Error loading data: {err}")
-            self.db.rollback()
+                existing = self.schedules.get(schedule['ID'])
+                if existing is not None:
+                    fields = [field for field in schedule if existing.get(field) != schedule[field]]
+                    if fields:
+                        self.schedules.update(schedule['ID'], schedule)
+                        events.append((self.schedule_changed, schedule['ID'], fields))
+                elif self._in_scope('schedule', schedule):
+                    self.schedules.add(schedule)
+                    events.append((self.schedule_added, schedule['ID']))
+            fetched_user_ids = set()
+            for role, user in users:
+                fetched_user_ids.add(user['id'])
+                if self.users.remove_by_id(user['id'])[1] is not None:
+                    events.append((self.user_removed, user['id']))
+                self.users.add(role, user)
+                events.append((self.user_added, user['id']))
+                self.last_user_id = max(self.last_user_id, user['id'])
+            for user_id in user_ids:
+                if user_id not in fetched_user_ids and self.users.remove_by_id(user_id)[1] is not None:
+                    events.append((self.user_removed, user_id))
+
+        print(f"✓ Synced {len(order_ids)} orders, {len(schedule_ids)} schedules, {len(user_ids)} users")
+        for signal, *args in events:
+            signal.emit(*args)
+        self._evict_cold()
+
+    def _resync(self, entity, key):
+        # Re-reads one row after a queued write to it failed.
+        self._apply_changes({(entity, str(key)): 'upsert'})
+
+    def _discard_schedule(self, schedule):
+        with self._lock:
+            schedule_id = self.schedules.discard(schedule)
+        if schedule_id is not None:
+            self.schedule_removed.emit(schedule_id)
+
+    def _fetch_by_keys(self, fetch, column, keys):
+        rows = []
+        for start in range(0, len(keys), self.IN_CLAUSE_SIZE):
+            chunk = keys[start:start + self.IN_CLAUSE_SIZE]
+            rows.extend(fetch(f"WHERE {column} IN ({', '.join(['%s'] * len(chunk))})", chunk))
+        return rows
+
+    def _in_scope(self, entity, row):
+        role, email = self.scope
+        if role == 'Customer':
+            return UserRegistry.normalize(row['User Email']) == UserRegistry.normalize(email)
+        if role == 'Staff':
+            if entity == 'order':
+                return row['Status'] in self.ACTIVE_STATUSES
+            return row['Date'] == QDate.currentDate().toString("MM/dd/yyyy")
+        # Admin views page straight from the database.
+        return False
 
     def get_next_user_id(self):
-        self.last_user_id += 1
-        return self.last_user_id
+        with self._lock:
+            self.last_user_id += 1
+            return self.last_user_id
 
     def register_user(self, role, data):
         try:
             email = data['email']
-            for r in self.user_data:
-                if email in self.user_data[r]:
-                    print(f"✗ Registration failed: Email '{email}' already exists")
-                    return False
+            if email in self.users:
+                print(f"✗ Registration failed: Email '{email}' already exists")
+                return False
 
             user_id = self.get_next_user_id()
             hashed_password = self.hash_password(data['password'])
             home_address = data.get('home_address', '')
 
-            if self.cursor:
-                self.cursor.execute("""
+            def write(cursor):
+                cursor.execute("""
                     INSERT INTO users (id, fullname, password, contact_info, email_address, home_address, role)
                     VALUES (%s, %s, %s, %s, %s, %s, %s)
                 """, (user_id, data['fullname'], hashed_password,
                       data['contact_info'], email, home_address, role))
-                self.db.commit()
-                print(f"✓ User registered: {email}, ID: {user_id}")
+                self._log_change(cursor, 'user', user_id)
+
+            self._write(f"register user {email}", write, lambda: self._resync('user', user_id))
+            print(f"✓ User registered: {email}, ID: {user_id}")
 
             data['id'] = user_id
             data['password'] = hashed_password
             data['email_address'] = email
-            self.user_data[role][email] = data
-            self.user_data_changed.emit()
+            with self._lock:
+                self.users.add(role, UserRecord.from_dict(data))
+            self.user_added.emit(user_id)
             return True
-        except pymysql.Error as err:
+        except DB_ERRORS as err:
             print(f"✗ Database error during registration: {err}")
-            if self.db:
-                self.db.rollback()
             return False
         except Exception as e:
             print(f"✗ Unexpected error during registration: {e}")
@@ -244,10 +1106,7 @@ class DataManager(QObject):
 
     def get_user(self, email):
         try:
-            for role in ['Admin', 'Staff', 'Customer']:
-                if email in self.user_data[role]:
-                    return role, self.user_data[role][email]
-            return None, None
+            return self.users.get(email)
         except Exception as e:
             print(f"✗ Error retrieving user: {e}")
             return None, None
@@ -261,41 +1120,71 @@ class DataManager(QObject):
 
     def get_all_users_flat(self):
         try:
-            users = []
-            for role, user_map in self.user_data.items():
-                for email, data in user_map.items():
-                    users.append({
-                        'id': data['id'],
-                        'name': data['fullname'],
-                        'contact': data['contact_info'],
-                        'role': role,
-                        'email': data.get('email_address', 'N/A'),
-                        'address': data.get('home_address', 'N/A')
-                    })
-            return users
+            return self.users.flat()
         except Exception as e:
             print(f"✗ Error retrieving users: {e}")
             return []
 
+    def prepare_user_search(self):
+        # Built outside the lock: indexing a large user table takes seconds.
+        with self._lock:
+            if self.users.search_ready():
+                return
+            users = [data for role, data in self.users.by_email.values()]
+        index = UserSearchIndex.build(users)
+        with self._lock:
+            if not self.users.search_ready():
+                self.users.install_search_index(index)
+
+    def search_users(self, query, limit=None):
+        query = query.strip()
+        try:
+            if not self.users_ready.is_set():
+                return self._search_users_in_sql(query, limit)
+            if not query:
+                with self._lock:
+                    users = list(self.users.flat())
+                return users[:limit] if limit else users
+            self.prepare_user_search()
+            with self._lock:
+                return self.users.search(query, limit)
+        except DB_ERRORS as err:
+            print(f"✗ Error searching users: {err}")
+            return []
+
+    def _search_users_in_sql(self, query, limit):
+        # Used while accounts are still loading.
+        if not self.engine:
+            return []
+        where, params = "", []
+        if query:
+            pattern = '%' + query.lower().replace('!', '!!').replace('%', '!%').replace('_', '!_') + '%'
+            where = "WHERE " + " OR ".join(f"LOWER({column}) LIKE %s ESCAPE '!'"
+                                           for column in UserSearchIndex.FIELDS)
+            params = [pattern] * len(UserSearchIndex.FIELDS)
+        suffix = "ORDER BY id" + (f" LIMIT {int(limit)}" if limit else "")
+        return [UserRegistry.flat_user(role, data) for role, data in self.fetch_users(where, params, suffix)]
+
     def delete_user(self, user_id):
         try:
             user_id = int(user_id)
-            for role, user_map in self.user_data.items():
-                for email, data in list(user_map.items()):
-                    if data['id'] == user_id:
-                        if self.cursor:
-                            self.cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
-                            self.db.commit()
-                        del user_map[email]
-                        self.user_data_changed.emit()
-                        print(f"✓ User deleted: ID {user_id}")
-                        return True
-            print(f"✗ User not found: ID {user_id}")
-            return False
-        except pymysql.Error as err:
+            role, data = self.users.get_by_id(user_id)
+            if not data:
+                print(f"✗ User not found: ID {user_id}")
+                return False
+
+            def write(cursor):
+                cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
+                self._log_change(cursor, 'user', user_id, 'delete')
+
+            self._write(f"delete user {user_id}", write, lambda: self._resync('user', user_id))
+            with self._lock:
+                self.users.remove_by_id(user_id)
+            self.user_removed.emit(user_id)
+            print(f"✓ User deleted: ID {user_id}")
+            return True
+        except DB_ERRORS as err:
             print(f"✗ Error deleting user: {err}")
-            if self.db:
-                self.db.rollback()
             return False
         except Exception as e:
             print(f"✗ Unexpected error deleting user: {e}")
@@ -303,26 +1192,41 @@ class DataManager(QObject):
 
     def add_order(self, order_data):
         try:
+            # Kept as a compact record; the caller's dict is not stored.
+            order_data = OrderRecord.from_dict(order_data)
             order_id = order_data['Order ID']
-            if self.cursor:
-                self.cursor.execute("""
+            if order_id in self.orders:
+                print(f"✗ Order already exists: {order_id}")
+                return False
+
+            def write(cursor):
+                cursor.execute("""
                     INSERT INTO orders (order_id, user_email, total, status, order_date)
                     VALUES (%s, %s, %s, %s, %s)
                 """, (order_id, order_data['User Email'], None, order_data['Status'], order_data['Order Date']))
-                for item in order_data['items']:
-                    self.cursor.execute("""
-                        INSERT INTO order_items (order_id, item, price_per_kg, actual_kg, subtotal)
-                        VALUES (%s, %s, %s, NULL, NULL)
-                    """, (order_id, item['item'], item['price_per_kg']))
-                self.db.commit()
-            self.orders.append(order_data)
-            self.order_updated.emit()
+                if order_data['items']:
+                    item_ids = self.engine.insert_rows(
+                        cursor, 'order_items', ('order_id', 'item', 'price_per_kg', 'actual_kg', 'subtotal'),
+                        [(order_id, item['item'], item['price_per_kg'], None, None) for item in order_data['items']])
+                    if item_ids is None:
+                        cursor.execute("SELECT id FROM order_items WHERE order_id = %s ORDER BY id", (order_id,))
+                        item_ids = [row['id'] for row in cursor.fetchall()]
+                    for item, item_id in zip(order_data['items'], item_ids):
+                        item['id'] = item_id
+                self._summarize_order(cursor, order_id, 1)
+                self._log_change(cursor, 'order', order_id)
+
+            self._write(f"add order {order_id}", write, lambda: self._resync('order', order_id))
+            with self._lock:
+                self.orders.add(order_data)
+                self._recount_order(None, ReportCounters.order_fields(order_data))
+                self.analytics.upsert_order(order_data)
+            self.order_added.emit(order_id)
+            self._evict_cold()
             print(f"✓ Order added: {order_id}")
             return True
-        except pymysql.Error as err:
+        except DB_ERRORS as err:
             print(f"✗ Error adding order: {err}")
-            if self.db:
-                self.db.rollback()
             return False
         except Exception as e:
             print(f"✗ Unexpected error adding order: {e}")
@@ -330,74 +1234,128 @@ class DataManager(QObject):
 
     def update_order(self, order_id, updates):
         try:
-            order = next((o for o in self.orders if o['Order ID'] == order_id), None)
+            order = self.get_order(order_id)
             if not order:
                 print(f"✗ Order not found: {order_id}")
                 return False
 
-            if self.cursor:
-                set_parts = []
-                values = []
-                if 'Status' in updates:
-                    set_parts.append("status = %s")
-                    values.append(updates['Status'])
-                if 'Total' in updates:
-                    set_parts.append("total = %s")
-                    values.append(updates['Total'])
-                if set_parts:
-                    values.append(order_id)
-                    set_clause = ", ".join(set_parts)
-                    self.cursor.execute(f"UPDATE orders SET {set_clause} WHERE order_id = %s", values)
-                    self.db.commit()
-
-            order.update(updates)
-            self.order_updated.emit()
+            set_parts = []
+            values = []
+            if 'Status' in updates:
+                set_parts.append("status = %s")
+                values.append(updates['Status'])
+            if 'Total' in updates:
+                set_parts.append("total = %s")
+                values.append(updates['Total'])
+            if set_parts:
+                values.append(order_id)
+                set_clause = ", ".join(set_parts)
+
+                def write(cursor):
+                    self._summarize_order(cursor, order_id, -1)
+                    cursor.execute(f"UPDATE orders SET {set_clause} WHERE order_id = %s", values)
+                    self._summarize_order(cursor, order_id, 1)
+                    self._log_change(cursor, 'order', order_id)
+
+                self._write(f"update order {order_id}", write, lambda: self._resync('order', order_id))
+
+            with self._lock:
+                before = ReportCounters.order_fields(order)
+                self.orders.update(order_id, updates)
+                self._recount_order(before, ReportCounters.order_fields(order))
+                self.analytics.upsert_order(order)
+            self.order_changed.emit(order_id, list(updates))
             print(f"✓ Order updated: {order_id}")
             return True
-        except pymysql.Error as err:
+        except DB_ERRORS as err:
             print(f"✗ Error updating order: {err}")
-            if self.db:
-                self.db.rollback()
             return False
         except Exception as e:
             print(f"✗ Unexpected error updating order: {e}")
             return False
 
-    def update_order_item(self, item_id, actual_kg, subtotal):
+    def save_billing(self, order_id, weights):
         try:
-            if self.cursor:
-                self.cursor.execute("""
+            order = self.get_order(order_id)
+            if not order:
+                print(f"✗ Order not found: {order_id}")
+                return False
+
+            lines = [
+                (item, actual_kg, actual_kg * item['price_per_kg'])
+                for item, actual_kg in zip(order['items'], weights)
+            ]
+            total = sum(subtotal for item, actual_kg, subtotal in lines)
+
+            def write(cursor):
+                # Item ids are read here, not up front: a queued add_order may
+                # only assign them just before this runs.
+                self._summarize_order(cursor, order_id, -1)
+                cursor.executemany("""
                     UPDATE order_items SET actual_kg = %s, subtotal = %s WHERE id = %s
-                """, (actual_kg, subtotal, item_id))
-                self.db.commit()
-                print(f"✓ Order item updated: ID {item_id}")
-        except pymysql.Error as err:
-            print(f"✗ Error updating order item: {err}")
-            if self.db:
-                self.db.rollback()
+                """, [(actual_kg, subtotal, item['id']) for item, actual_kg, subtotal in lines])
+                cursor.execute("UPDATE orders SET total = %s WHERE order_id = %s", (total, order_id))
+                self._summarize_order(cursor, order_id, 1)
+                self._log_change(cursor, 'order', order_id)
+
+            self._write(f"save billing {order_id}", write, lambda: self._resync('order', order_id))
+            with self._lock:
+                for item, actual_kg, subtotal in lines:
+                    item['actual_kg'] = actual_kg
+                    item['subtotal'] = subtotal
+                before = ReportCounters.order_fields(order)
+                self.orders.update(order_id, {'Total': total})
+                self._recount_order(before, ReportCounters.order_fields(order))
+                self.analytics.upsert_order(order)
+            self.order_changed.emit(order_id, ['Total', 'items'])
+            print(f"✓ Billing saved: {order_id}, total {total:.2f}")
+            return True
+        except DB_ERRORS as err:
+            print(f"✗ Error saving billing: {err}")
+            return False
         except Exception as e:
-            print(f"✗ Unexpected error updating order item: {e}")
+            print(f"✗ Unexpected error saving billing: {e}")
+            return False
 
     def add_schedule(self, schedule_data):
         try:
-            if self.cursor:
-                self.cursor.execute("""
+            schedule_data = ScheduleRecord.from_dict(schedule_data)
+            def write(cursor):
+                cursor.execute("""
                     INSERT INTO schedules (user_email, type, date, time, address, email, status)
                     VALUES (%s, %s, %s, %s, %s, %s, %s)
                 """, (schedule_data['User Email'], schedule_data['Type'], schedule_data['Date'],
                       schedule_data['Time'], schedule_data['Address'], schedule_data['Email'],
                       schedule_data['Status']))
-                self.db.commit()
-                schedule_data['ID'] = self.cursor.lastrowid
-                print(f"✓ Schedule added: ID {schedule_data['ID']}")
-            else:
-                schedule_data['ID'] = len(self.schedules) + 1
-            self.schedules.append(schedule_data)
+                schedule_id = cursor.lastrowid
+                self.engine.add_totals(cursor, 'daily_schedule_totals',
+                                       {'date': schedule_data['Date'] or '', 'status': schedule_data['Status'] or ''},
+                                       {'schedules': 1})
+                self._log_change(cursor, 'schedule', schedule_id)
+                return schedule_id
+
+            def committed(schedule_id):
+                # A rolled-back attempt's id is never announced.
+                with self._lock:
+                    pending = self.schedules.assign_id(schedule_data, schedule_id)
+                if pending:
+                    self.schedule_added.emit(schedule_id)
+
+            schedule_data['ID'] = None
+            self._write(f"add schedule for {schedule_data['User Email']}", write,
+                        lambda: self._discard_schedule(schedule_data), committed)
+            with self._lock:
+                if not self.engine:
+                    schedule_data['ID'] = len(self.schedules) + 1
+                self.schedules.append(schedule_data)
+                self._recount_schedule(schedule_data)
+            if schedule_data['ID'] is not None:
+                self.schedule_added.emit(schedule_data['ID'])
+            self._evict_cold()
+            print(f"✓ Schedule added for {schedule_data['User Email']}")
             return True
-        except pymysql.Error as err:
+        except DB_ERRORS as err:
             print(f"✗ Error adding schedule: {err}")
-            if self.db:
-                self.db.rollback()
             return False
         except Exception as e:
             print(f"✗ Unexpected error adding schedule: {e}")
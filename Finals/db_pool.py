@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+import queue
+import threading
+import pymysql
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    # Client-side codes for a connection the server has dropped.
+    LOST_CONNECTION_ERRORS = (2006, 2013, 2055)
+
+    def __init__(self, max_size=5, timeout=10, **connect_args):
+        connect_args.setdefault('cursorclass', pymysql.cursors.DictCursor)
+        self.connect_args = connect_args
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._closed = False
+
+    def _connect(self):
+        return pymysql.connect(**self.connect_args)
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        if self._closed:
+            raise PoolTimeout("Connection pool is closed")
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(f"No database connection available after {self.timeout}s")
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            try:
+                conn.ping(reconnect=True)
+            except pymysql.Error:
+                self._close_quietly(conn)
+                conn = self._connect()
+            return conn
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn, discard=False):
+        try:
+            if discard or self._closed:
+                self._close_quietly(conn)
+            else:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def is_lost_connection(self, err):
+        if isinstance(err, pymysql.err.InterfaceError):
+            return True
+        return isinstance(err, pymysql.err.OperationalError) and bool(err.args) and \
+            err.args[0] in self.LOST_CONNECTION_ERRORS
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        discard = False
+        try:
+            yield conn
+        except pymysql.Error as err:
+            discard = self.is_lost_connection(err)
+            raise
+        finally:
+            self.release(conn, discard)
+
+    @contextmanager
+    def transaction(self):
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            except Exception:
+                try:
+                    conn.rollback()
+                except pymysql.Error:
+                    pass
+                raise
+            finally:
+                cursor.close()
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._close_quietly(self._idle.get_nowait())
+            except queue.Empty:
+                break
@@ -0,0 +1,106 @@
+import pymysql
+
+# Ordered schema changes applied on top of the tables created by
+# StorageEngine.create_schema. Append new migrations with the next version
+# number; never edit one that has shipped. Statements are plain SQL that
+# both MySQL and SQLite accept.
+MIGRATIONS = [
+    (1, "Index order items by order", [
+        "CREATE INDEX idx_order_items_order ON order_items (order_id, id)",
+    ]),
+    (2, "Index orders for date, status and customer lookups", [
+        "CREATE INDEX idx_orders_date ON orders (order_date, order_id, total)",
+        "CREATE INDEX idx_orders_status ON orders (status, order_date, order_id)",
+        "CREATE INDEX idx_orders_customer ON orders (user_email, order_date, order_id)",
+    ]),
+    (3, "Index schedules for date, status and customer lookups", [
+        "CREATE INDEX idx_schedules_date ON schedules (date, status, id)",
+        "CREATE INDEX idx_schedules_status ON schedules (status, id)",
+        "CREATE INDEX idx_schedules_customer ON schedules (user_email, id)",
+    ]),
+    # Kept current by DataManager's write paths in the same transaction as
+    # the row they summarize, so every client reads the same numbers.
+    (4, "Add daily summary tables for reports", [
+        """CREATE TABLE IF NOT EXISTS daily_order_totals (
+            order_date DATE NOT NULL,
+            status VARCHAR(50) NOT NULL,
+            orders INT NOT NULL DEFAULT 0,
+            revenue DECIMAL(14, 2) NOT NULL DEFAULT 0,
+            PRIMARY KEY (order_date, status)
+        )""",
+        """CREATE TABLE IF NOT EXISTS daily_item_totals (
+            order_date DATE NOT NULL,
+            status VARCHAR(50) NOT NULL,
+            item VARCHAR(255) NOT NULL,
+            items INT NOT NULL DEFAULT 0,
+            kg DECIMAL(14, 2) NOT NULL DEFAULT 0,
+            revenue DECIMAL(14, 2) NOT NULL DEFAULT 0,
+            PRIMARY KEY (order_date, status, item)
+        )""",
+        """CREATE TABLE IF NOT EXISTS daily_schedule_totals (
+            date VARCHAR(50) NOT NULL,
+            status VARCHAR(50) NOT NULL,
+            schedules INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (date, status)
+        )""",
+        # Backfilled after the last CREATE: MySQL commits DDL implicitly, and
+        # the inserts must commit together with the version row.
+        """INSERT INTO daily_order_totals (order_date, status, orders, revenue)
+            SELECT order_date, COALESCE(status, ''), COUNT(*), COALESCE(SUM(total), 0)
+            FROM orders GROUP BY order_date, COALESCE(status, '')""",
+        """INSERT INTO daily_item_totals (order_date, status, item, items, kg, revenue)
+            SELECT o.order_date, COALESCE(o.status, ''), COALESCE(i.item, ''), COUNT(*),
+                   COALESCE(SUM(i.actual_kg), 0), COALESCE(SUM(i.subtotal), 0)
+            FROM order_items i JOIN orders o ON o.order_id = i.order_id
+            GROUP BY o.order_date, COALESCE(o.status, ''), COALESCE(i.item, '')""",
+        """INSERT INTO daily_schedule_totals (date, status, schedules)
+            SELECT COALESCE(date, ''), COALESCE(status, ''), COUNT(*)
+            FROM schedules GROUP BY COALESCE(date, ''), COALESCE(status, '')""",
+    ]),
+    (5, "Index schedules for sorting by type", [
+        "CREATE INDEX idx_schedules_type ON schedules (type, id)",
+    ]),
+    # Keyset pages sort on (column, key); SQLite does not append the
+    # primary key of orders to its secondary indexes the way InnoDB does.
+    (6, "Index orders and schedules for paging by status, customer and date", [
+        "CREATE INDEX idx_orders_status_paging ON orders (status, order_id)",
+        "CREATE INDEX idx_orders_customer_paging ON orders (user_email, order_id)",
+        "CREATE INDEX idx_schedules_date_paging ON schedules (date, id)",
+    ]),
+]
+
+# MySQL commits DDL immediately, so an index can outlive a run that failed
+# before recording its version.
+ER_DUP_KEYNAME = 1061
+
+
+def schema_version(cursor):
+    cursor.execute("SELECT MAX(version) AS version FROM schema_version")
+    row = cursor.fetchone()
+    return row['version'] or 0
+
+
+def migrate(engine):
+    with engine.transaction() as cursor:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INT PRIMARY KEY,
+                description VARCHAR(255),
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+    for version, description, statements in MIGRATIONS:
+        with engine.transaction() as cursor:
+            # Re-checked per migration so two workstations starting at once
+            # do not apply the same step twice.
+            if schema_version(cursor) >= version:
+                continue
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+                except pymysql.err.OperationalError as err:
+                    if err.args[0] != ER_DUP_KEYNAME:
+                        raise
+            cursor.execute("INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                           (version, description))
+        print(f"✓ Schema migrated to version {version}: {description}")
@@ -0,0 +1,197 @@
+from PyQt5.QtWidgets import (
+    QTableView, QHeaderView, QStyledItemDelegate, QComboBox, QStyle,
+    QStyleOptionButton, QStyleOptionComboBox, QApplication, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QRect, pyqtSignal
+from PyQt5.QtGui import QFont
+
+ORDER_STATUSES = [
+    "Pending Pick-up", "Washing", "Drying", "Completed",
+    "Ready for Pickup", "Ready for Delivery", "Cancelled"
+]
+
+
+class OrderTableModel(QAbstractTableModel):
+    HEADERS = ["Order ID", "User Email", "Items", "Total", "Status", "Actions"]
+    STATUS_COLUMN = 4
+    ACTION_COLUMN = 5
+    status_change_requested = pyqtSignal(str, str)
+
+    def __init__(self, orders=None, parent=None):
+        super().__init__(parent)
+        # A copy of the rows, changed only through the methods below: the
+        # store can drop or evict orders on another thread at any time.
+        self.orders = list(orders) if orders is not None else []
+        self._rows = None
+
+    def set_orders(self, orders):
+        self.beginResetModel()
+        self.orders = list(orders)
+        self._rows = None
+        self.endResetModel()
+
+    def upsert_order(self, order):
+        row = self.row_of(order['Order ID'])
+        if row is None:
+            row = len(self.orders)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.orders.append(order)
+            self._rows[order['Order ID']] = row
+            self.endInsertRows()
+        else:
+            # A removed and re-added order comes back as a new record.
+            self.orders[row] = order
+            self.refresh_row(row)
+
+    def remove_order(self, order_id):
+        row = self.row_of(order_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.orders[row]
+        self._rows = None
+        self.endRemoveRows()
+
+    def order_at(self, row):
+        if 0 <= row < len(self.orders):
+            return self.orders[row]
+        return None
+
+    def row_of(self, order_id):
+        if self._rows is None:
+            self._rows = {order['Order ID']: row for row, order in enumerate(self.orders)}
+        return self._rows.get(order_id)
+
+    def refresh_row(self, row):
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def refresh_order(self, order_id):
+        row = self.row_of(order_id)
+        if row is not None:
+            self.refresh_row(row)
+        return row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.orders)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        # The view asks only for visible cells, so nothing is built per order.
+        order = self.order_at(index.row())
+        if order is None or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        column = index.column()
+        if column == 0:
+            return order['Order ID']
+        if column == 1:
+            return order['User Email']
+        if column == 2:
+            return ", ".join(i['item'] for i in order['items'])
+        if column == 3:
+            return f"₱{order['Total']:.2f}" if order['Total'] is not None else '-'
+        if column == self.STATUS_COLUMN:
+            return order['Status']
+        return "Edit Billing"
+
+    def flags(self, index):
+        if index.column() == self.STATUS_COLUMN:
+            return Qt.ItemIsEnabled | Qt.ItemIsEditable
+        return Qt.ItemIsEnabled
+
+    def setData(self, index, value, role=Qt.EditRole):
+        order = self.order_at(index.row())
+        if order is None or index.column() != self.STATUS_COLUMN or role != Qt.EditRole:
+            return False
+        if value != order['Status']:
+            # The dashboard saves the change by id, since rows can move
+            # before it runs; the row repaints from the order.
+            self.status_change_requested.emit(order['Order ID'], value)
+        return True
+
+
+class StatusDelegate(QStyledItemDelegate):
+    def paint(self, painter, option, index):
+        combo = QStyleOptionComboBox()
+        combo.rect = option.rect.adjusted(2, 2, -2, -2)
+        combo.currentText = index.data()
+        combo.state = option.state | QStyle.State_Enabled
+        style = QApplication.style()
+        style.drawComplexControl(QStyle.CC_ComboBox, combo, painter)
+        style.drawControl(QStyle.CE_ComboBoxLabel, combo, painter)
+
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.setFont(QFont('Arial', 9))
+        editor.addItems(ORDER_STATUSES)
+        editor.activated.connect(lambda: self.commit_and_close(editor))
+        return editor
+
+    def commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+    def setEditorData(self, editor, index):
+        position = editor.findText(index.data())
+        if position >= 0:
+            editor.setCurrentIndex(position)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText())
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    clicked = pyqtSignal(int)
+
+    def button_rect(self, rect):
+        return QRect(rect.x() + 2, rect.y() + 2, min(100, rect.width() - 4), min(25, rect.height() - 4))
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = self.button_rect(option.rect)
+        button.text = index.data()
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        QApplication.style().drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and self.button_rect(option.rect).contains(event.pos()):
+            self.clicked.emit(index.row())
+            return True
+        return False
+
+
+class OrderTableView(QTableView):
+    billing_requested = pyqtSignal(str)
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setFont(QFont('Arial', 9))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.CurrentChanged | QAbstractItemView.SelectedClicked |
+                             QAbstractItemView.DoubleClicked)
+        self.verticalHeader().setDefaultSectionSize(30)
+        header = self.horizontalHeader()
+        for i in range(len(model.HEADERS) - 1):
+            header.setSectionResizeMode(i, QHeaderView.Stretch)
+        header.setSectionResizeMode(model.ACTION_COLUMN, QHeaderView.Fixed)
+        header.resizeSection(model.ACTION_COLUMN, 110)
+        self.status_delegate = StatusDelegate(self)
+        self.button_delegate = ButtonDelegate(self)
+        self.button_delegate.clicked.connect(self.on_button_clicked)
+        self.setItemDelegateForColumn(model.STATUS_COLUMN, self.status_delegate)
+        self.setItemDelegateForColumn(model.ACTION_COLUMN, self.button_delegate)
+
+    def on_button_clicked(self, row):
+        order = self.model().order_at(row)
+        if order is not None:
+            self.billing_requested.emit(order['Order ID'])
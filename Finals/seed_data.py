@@ -0,0 +1,110 @@
+# Shared by the tests and benchmarks: seeded databases and storage engines.
+
+import datetime
+import os
+import random
+import tempfile
+import pymysql
+from database import DataManager
+from order_table import ORDER_STATUSES
+from storage import MySQLEngine, SQLiteEngine
+
+ITEM_PRICES = (('Clothes', 50.0), ('Beddings', 60.0), ('Curtains', 70.0), ('Others', 40.0))
+SCHEDULE_STATUSES = ('Scheduled', 'In Progress', 'Completed', 'Cancelled')
+FIRST_DAY = datetime.date(2025, 1, 1)
+
+
+def customer_email(number):
+    return f"customer{number}@mail.com"
+
+
+def seed_database(path, customers=100, orders=1000, schedules=200, days=365, seed=1):
+    engine = SQLiteEngine(path)
+    seed_engine(engine, customers, orders, schedules, days, seed)
+    engine.close()
+
+
+def seed_engine(engine, customers=100, orders=1000, schedules=200, days=365, seed=1):
+    # Fills an empty database with the same rows on every run, for the
+    # tests and benchmarks. Run it before DataManager opens it: the daily
+    # summary tables are backfilled when the schema is migrated.
+    rng = random.Random(seed)
+    with engine.transaction() as cursor:
+        engine.create_schema(cursor)
+        cursor.executemany("""
+            INSERT INTO users (id, fullname, password, contact_info, email_address, home_address, role)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, [(1000 + number, f"Customer {number}", '', '0900', customer_email(number), 'Street', 'Customer')
+              for number in range(customers)])
+
+        order_rows, item_rows = [], []
+        for number in range(orders):
+            order_id = f"S{number:07d}"
+            status = rng.choice(ORDER_STATUSES)
+            billed = status in ('Completed', 'Ready for Pickup', 'Ready for Delivery')
+            total = 0.0
+            for item, price in rng.sample(ITEM_PRICES, rng.randint(1, 3)):
+                kg = round(rng.uniform(1, 8), 1) if billed else None
+                subtotal = round(kg * price, 2) if billed else None
+                total += subtotal or 0
+                item_rows.append((order_id, item, price, kg, subtotal))
+            order_date = FIRST_DAY + datetime.timedelta(days=rng.randrange(days))
+            order_rows.append((order_id, customer_email(rng.randrange(customers)), round(total, 2) if billed else None,
+                               status, order_date.isoformat()))
+        cursor.executemany("""
+            INSERT INTO orders (order_id, user_email, total, status, order_date) VALUES (%s, %s, %s, %s, %s)
+        """, order_rows)
+        cursor.executemany("""
+            INSERT INTO order_items (order_id, item, price_per_kg, actual_kg, subtotal) VALUES (%s, %s, %s, %s, %s)
+        """, item_rows)
+
+        schedule_rows = []
+        for number in range(schedules):
+            email = customer_email(rng.randrange(customers))
+            day = FIRST_DAY + datetime.timedelta(days=rng.randrange(days))
+            schedule_rows.append((email, rng.choice(('Pick-up', 'Delivery')), day.strftime("%m/%d/%Y"), '09:00 AM',
+                                  'Street', email, rng.choice(SCHEDULE_STATUSES)))
+        cursor.executemany("""
+            INSERT INTO schedules (user_email, type, date, time, address, email, status)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, schedule_rows)
+
+
+# A scratch database on the same server the app uses; dropped on each run.
+MYSQL_ARGS = {'host': 'localhost', 'user': 'root', 'password': '', 'charset': 'utf8mb4'}
+MYSQL_TEST_DATABASE = 'washdesk_test'
+
+
+def sqlite_engine():
+    return SQLiteEngine(os.path.join(tempfile.mkdtemp(), 'storage.db'))
+
+
+def mysql_engine(pool_size=3, reset=True):
+    # reset=False opens a second client on the current scratch database.
+    if reset:
+        conn = pymysql.connect(**MYSQL_ARGS)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f"DROP DATABASE IF EXISTS {MYSQL_TEST_DATABASE}")
+                cursor.execute(f"CREATE DATABASE {MYSQL_TEST_DATABASE}")
+        finally:
+            conn.close()
+    return MySQLEngine(pool_size=pool_size, database=MYSQL_TEST_DATABASE,
+                       cursorclass=pymysql.cursors.DictCursor, **MYSQL_ARGS)
+
+
+ENGINES = {'sqlite': sqlite_engine, 'mysql': mysql_engine}
+
+
+def open_manager(engine):
+    dm = DataManager()
+    dm.engine = engine
+    dm.create_tables()
+    dm.load_users()
+    return dm
+
+
+def new_order(order_id, email, status='Pending Pick-up', order_date='2026-01-05'):
+    return {'Order ID': order_id, 'User Email': email, 'Total': None, 'Status': status, 'Order Date': order_date,
+            'items': [{'id': None, 'item': 'Clothes', 'price_per_kg': 50.0, 'actual_kg': None, 'subtotal': None},
+                      {'id': None, 'item': 'Beddings', 'price_per_kg': 60.0, 'actual_kg': None, 'subtotal': None}]}
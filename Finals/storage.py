@@ -0,0 +1,299 @@
+from contextlib import contextmanager
+import os
+import sqlite3
+import threading
+import pymysql
+from db_pool import ConnectionPool, PoolTimeout
+
+DB_ERRORS = (pymysql.Error, sqlite3.Error, PoolTimeout)
+OFFLINE_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'washdesk.db')
+
+
+class StorageEngine:
+    # Every engine accepts the same SQL text, written with %s placeholders,
+    # and yields rows that can be read by column name.
+    name = None
+    # Appended to a SELECT that reads rows the transaction will rewrite.
+    row_lock = ''
+
+    def transaction(self):
+        raise NotImplementedError
+
+    def add_totals(self, cursor, table, keys, deltas):
+        # Adds deltas to the summary row identified by keys, creating it.
+        raise NotImplementedError
+
+    def insert_rows(self, cursor, table, columns, rows):
+        # Inserts rows with as few statements as possible and returns their
+        # generated ids in order, or None when the caller must read them back.
+        raise NotImplementedError
+
+    def create_schema(self, cursor):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MySQLEngine(StorageEngine):
+    name = 'mysql'
+    row_lock = 'FOR UPDATE'
+
+    def __init__(self, pool_size=5, **connect_args):
+        self.pool = ConnectionPool(max_size=pool_size, **connect_args)
+        self.pool.release(self.pool.acquire())
+
+    def transaction(self):
+        return self.pool.transaction()
+
+    def add_totals(self, cursor, table, keys, deltas):
+        columns = list(keys) + list(deltas)
+        cursor.execute(f"""
+            INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})
+            ON DUPLICATE KEY UPDATE {', '.join(f'{c} = {c} + VALUES({c})' for c in deltas)}
+        """, list(keys.values()) + list(deltas.values()))
+
+    def insert_rows(self, cursor, table, columns, rows):
+        # pymysql folds this into one multi-row INSERT, but its ids are only
+        # consecutive under some innodb_autoinc_lock_mode settings.
+        cursor.executemany(f"""
+            INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})
+        """, rows)
+        return None
+
+    def create_schema(self, cursor):
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                id INT PRIMARY KEY,
+                fullname VARCHAR(255),
+                password VARCHAR(255),
+                contact_info VARCHAR(255),
+                email_address VARCHAR(255) UNIQUE,
+                home_address TEXT,
+                role ENUM('Admin', 'Staff', 'Customer')
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS orders (
+                order_id VARCHAR(50) PRIMARY KEY,
+                user_email VARCHAR(255),
+                total DECIMAL(10, 2),
+                status VARCHAR(50),
+                order_date DATE
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS order_items (
+                id INT PRIMARY KEY AUTO_INCREMENT,
+                order_id VARCHAR(50),
+                item VARCHAR(255),
+                price_per_kg DECIMAL(10, 2),
+                actual_kg DECIMAL(10, 2),
+                subtotal DECIMAL(10, 2)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schedules (
+                id INT PRIMARY KEY AUTO_INCREMENT,
+                user_email VARCHAR(255),
+                type VARCHAR(50),
+                date VARCHAR(50),
+                time VARCHAR(50),
+                address TEXT,
+                email VARCHAR(255),
+                status VARCHAR(50)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS change_log (
+                id BIGINT PRIMARY KEY AUTO_INCREMENT,
+                entity VARCHAR(20),
+                entity_key VARCHAR(255),
+                op VARCHAR(10),
+                origin VARCHAR(32),
+                changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def close(self):
+        self.pool.close()
+
+
+class SQLiteCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    @staticmethod
+    def _sql(sql):
+        return sql.replace('%s', '?')
+
+    def execute(self, sql, params=()):
+        self._cursor.execute(self._sql(sql), tuple(params))
+        return self._cursor.rowcount
+
+    def executemany(self, sql, seq_of_params):
+        self._cursor.executemany(self._sql(sql), [tuple(p) for p in seq_of_params])
+        return self._cursor.rowcount
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteEngine(StorageEngine):
+    name = 'sqlite'
+    # Tables of the bundled washdesk.db that predate the MySQL schema.
+    LEGACY_TABLES = ('users', 'orders', 'schedules')
+    # The bound-parameter limit of older SQLite builds.
+    MAX_VARIABLES = 999
+
+    def __init__(self, path=OFFLINE_DB_PATH, timeout=10):
+        self.path = path
+        self.timeout = timeout
+        # One connection per thread, keyed by thread id: Qt pool threads
+        # lose threading.local() state between jobs.
+        self._connections = {}
+        self._lock = threading.Lock()
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        self._retire_legacy_schema(conn)
+
+    def _connection(self):
+        ident = threading.current_thread().ident
+        conn = self._connections.get(ident)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                   check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=OFF")
+            with self._lock:
+                self._release_dead_threads()
+                self._connections[ident] = conn
+        return conn
+
+    def _release_dead_threads(self):
+        # Hydration threads come and go; their connections must not pile up.
+        alive = {thread.ident for thread in threading.enumerate()}
+        for ident in [ident for ident in self._connections if ident not in alive]:
+            self._connections.pop(ident).close()
+
+    def _retire_legacy_schema(self, conn):
+        columns = [row['name'] for row in conn.execute("PRAGMA table_info(users)")]
+        if not columns or 'email_address' in columns:
+            return
+        for table in self.LEGACY_TABLES:
+            if conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone():
+                conn.execute(f"ALTER TABLE {table} RENAME TO legacy_{table}")
+        print("✓ Legacy offline tables renamed with a legacy_ prefix")
+
+    @contextmanager
+    def transaction(self):
+        conn = self._connection()
+        cursor = SQLiteCursor(conn.cursor())
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.close()
+
+    def add_totals(self, cursor, table, keys, deltas):
+        columns = list(keys) + list(deltas)
+        cursor.execute(f"""
+            INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})
+            ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {', '.join(f'{c} = {c} + excluded.{c}' for c in deltas)}
+        """, list(keys.values()) + list(deltas.values()))
+
+    def insert_rows(self, cursor, table, columns, rows):
+        # BEGIN IMMEDIATE makes this the only writer, so the rows of one
+        # statement get consecutive ids ending at lastrowid.
+        ids = []
+        per_statement = max(1, self.MAX_VARIABLES // len(columns))
+        placeholders = f"({', '.join(['%s'] * len(columns))})"
+        for start in range(0, len(rows), per_statement):
+            chunk = rows[start:start + per_statement]
+            cursor.execute(f"""
+                INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([placeholders] * len(chunk))}
+            """, [value for row in chunk for value in row])
+            ids.extend(range(cursor.lastrowid - len(chunk) + 1, cursor.lastrowid + 1))
+        return ids
+
+    def create_schema(self, cursor):
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY,
+                fullname TEXT,
+                password TEXT,
+                contact_info TEXT,
+                email_address TEXT UNIQUE,
+                home_address TEXT,
+                role TEXT CHECK(role IN ('Admin', 'Staff', 'Customer'))
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS orders (
+                order_id TEXT PRIMARY KEY,
+                user_email TEXT,
+                total REAL,
+                status TEXT,
+                order_date TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS order_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                order_id TEXT,
+                item TEXT,
+                price_per_kg REAL,
+                actual_kg REAL,
+                subtotal REAL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schedules (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_email TEXT,
+                type TEXT,
+                date TEXT,
+                time TEXT,
+                address TEXT,
+                email TEXT,
+                status TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS change_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                entity TEXT,
+                entity_key TEXT,
+                op TEXT,
+                origin TEXT,
+                changed_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, {}
+        for conn in connections.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
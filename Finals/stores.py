@@ -0,0 +1,559 @@
+import bisect
+import re
+from collections import OrderedDict
+
+
+class EntityCache:
+    # Recency and budget bookkeeping for one store. Past max_entries or
+    # max_bytes the least recently used entities are evicted down to
+    # LOW_WATER of the budget; entities for which is_hot() holds, pinned
+    # keys and keys the caller asks to keep never are.
+    LOW_WATER = 0.9
+
+    def __init__(self, max_entries=None, max_bytes=None, is_hot=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.is_hot = is_hot or (lambda entity: False)
+        self.pinned = frozenset()
+        self.recent = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def admit(self, key, entity):
+        size = entity.footprint() if self.max_bytes is not None else 0
+        self.bytes += size - self.recent.pop(key, 0)
+        self.recent[key] = size
+
+    def touch(self, key):
+        if key in self.recent:
+            self.recent.move_to_end(key)
+
+    def forget(self, key):
+        self.bytes -= self.recent.pop(key, 0)
+
+    def clear(self):
+        self.recent.clear()
+        self.bytes = 0
+
+    def over_budget(self, share=1.0):
+        return ((self.max_entries is not None and len(self.recent) > self.max_entries * share) or
+                (self.max_bytes is not None and self.bytes > self.max_bytes * share))
+
+    def victims(self, get, keep=()):
+        victims = []
+        if not self.over_budget():
+            return victims
+        checked = 0
+        while self.over_budget(self.LOW_WATER) and checked < len(self.recent):
+            key, size = self.recent.popitem(last=False)
+            if key in keep or key in self.pinned or self.is_hot(get(key)):
+                # Moved to the recent end so the next pass does not rescan it.
+                self.recent[key] = size
+                checked += 1
+                continue
+            self.bytes -= size
+            self.evictions += 1
+            victims.append(key)
+        return victims
+
+    def stats(self):
+        return {
+            'entries': len(self.recent),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+class OrderStore:
+    INDEXED_FIELDS = {'User Email': 'by_email', 'Status': 'by_status', 'Order Date': 'by_date'}
+
+    def __init__(self):
+        # Removed orders leave a None in _orders until enough have piled up
+        # to compact the list in one pass; _positions maps ids to slots.
+        self._orders = []
+        self._positions = {}
+        self._holes = 0
+        self.by_id = {}
+        self.by_email = {}
+        self.by_status = {}
+        self.by_date = {}
+        self.cache = None
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return (order for order in self._orders if order is not None)
+
+    def __contains__(self, order_id):
+        return order_id in self.by_id
+
+    def _index(self, order):
+        for field, name in self.INDEXED_FIELDS.items():
+            getattr(self, name).setdefault(order[field], {})[order['Order ID']] = order
+
+    def _unindex(self, order, fields):
+        for field in fields:
+            bucket = getattr(self, self.INDEXED_FIELDS[field]).get(order[field])
+            if bucket is not None:
+                bucket.pop(order['Order ID'], None)
+                if not bucket:
+                    del getattr(self, self.INDEXED_FIELDS[field])[order[field]]
+
+    def add(self, order):
+        if order['Order ID'] in self.by_id:
+            raise KeyError(f"Duplicate order ID: {order['Order ID']}")
+        self._positions[order['Order ID']] = len(self._orders)
+        self._orders.append(order)
+        self.by_id[order['Order ID']] = order
+        self._index(order)
+        if self.cache is not None:
+            self.cache.admit(order['Order ID'], order)
+
+    append = add
+
+    def get(self, order_id):
+        if self.cache is not None:
+            self.cache.touch(order_id)
+        return self.by_id.get(order_id)
+
+    def attach_cache(self, cache):
+        self.cache = cache
+        for order in self:
+            cache.admit(order['Order ID'], order)
+
+    def update(self, order_id, updates):
+        order = self.by_id.get(order_id)
+        if order is None:
+            return None
+        changed = [f for f in self.INDEXED_FIELDS if f in updates and updates[f] != order[f]]
+        self._unindex(order, changed)
+        order.update(updates)
+        for field in changed:
+            getattr(self, self.INDEXED_FIELDS[field]).setdefault(order[field], {})[order_id] = order
+        if self.cache is not None:
+            self.cache.admit(order_id, order)
+        return order
+
+    def remove(self, order_id):
+        order = self.by_id.pop(order_id, None)
+        if order is None:
+            return None
+        self._unindex(order, self.INDEXED_FIELDS)
+        self._drop(order_id)
+        self._compact()
+        if self.cache is not None:
+            self.cache.forget(order_id)
+        return order
+
+    def _drop(self, order_id):
+        self._orders[self._positions.pop(order_id)] = None
+        self._holes += 1
+
+    def _compact(self):
+        if self._holes * 2 <= len(self._orders):
+            return
+        self._orders = [order for order in self._orders if order is not None]
+        self._positions = {order['Order ID']: row for row, order in enumerate(self._orders)}
+        self._holes = 0
+
+    def pin(self, order_ids):
+        # Replaces the pinned set, e.g. with the rows of the page on screen.
+        if self.cache is not None:
+            self.cache.pinned = frozenset(order_ids)
+
+    def evict_cold(self, keep=()):
+        victims = self.cache.victims(self.by_id.get, keep)
+        for order_id in victims:
+            self._unindex(self.by_id.pop(order_id), self.INDEXED_FIELDS)
+            self._drop(order_id)
+        self._compact()
+        return victims
+
+    def clear(self):
+        self._orders = []
+        self._positions.clear()
+        self._holes = 0
+        self.by_id.clear()
+        self.by_email.clear()
+        self.by_status.clear()
+        self.by_date.clear()
+        if self.cache is not None:
+            self.cache.clear()
+
+    def for_customer(self, email):
+        return list(self.by_email.get(email, {}).values())
+
+    def with_status(self, status):
+        return list(self.by_status.get(status, {}).values())
+
+    def on_date(self, order_date):
+        return list(self.by_date.get(order_date, {}).values())
+
+
+class ScheduleStore:
+    def __init__(self):
+        self._schedules = []
+        self.by_id = {}
+        self._pending = {}
+        self.cache = None
+
+    def __len__(self):
+        return len(self._schedules)
+
+    def __iter__(self):
+        return iter(self._schedules)
+
+    def __getitem__(self, index):
+        return self._schedules[index]
+
+    def __contains__(self, schedule_id):
+        return schedule_id in self.by_id
+
+    def add(self, schedule):
+        if schedule['ID'] is None:
+            # Written behind: indexed once the database assigns the id.
+            self._pending[id(schedule)] = schedule
+        elif schedule['ID'] in self.by_id:
+            raise KeyError(f"Duplicate schedule ID: {schedule['ID']}")
+        else:
+            self.by_id[schedule['ID']] = schedule
+            if self.cache is not None:
+                self.cache.admit(schedule['ID'], schedule)
+        self._schedules.append(schedule)
+
+    append = add
+
+    def get(self, schedule_id):
+        if self.cache is not None:
+            self.cache.touch(schedule_id)
+        return self.by_id.get(schedule_id)
+
+    def attach_cache(self, cache):
+        self.cache = cache
+        for schedule_id, schedule in self.by_id.items():
+            cache.admit(schedule_id, schedule)
+
+    def assign_id(self, schedule, schedule_id):
+        schedule['ID'] = schedule_id
+        if self._pending.pop(id(schedule), None) is None:
+            return False
+        self.by_id[schedule_id] = schedule
+        if self.cache is not None:
+            self.cache.admit(schedule_id, schedule)
+        return True
+
+    def discard(self, schedule):
+        # Drops a schedule whose insert failed; returns the id it was
+        # announced under, if it got one.
+        self._pending.pop(id(schedule), None)
+        self._schedules = [row for row in self._schedules if row is not schedule]
+        schedule_id = schedule['ID']
+        if schedule_id is None or self.by_id.get(schedule_id) is not schedule:
+            return None
+        del self.by_id[schedule_id]
+        if self.cache is not None:
+            self.cache.forget(schedule_id)
+        return schedule_id
+
+    def update(self, schedule_id, updates):
+        schedule = self.by_id.get(schedule_id)
+        if schedule is not None:
+            schedule.update(updates)
+            if self.cache is not None:
+                self.cache.admit(schedule_id, schedule)
+        return schedule
+
+    def pin(self, schedule_ids):
+        if self.cache is not None:
+            self.cache.pinned = frozenset(schedule_ids)
+
+    def evict_cold(self, keep=()):
+        victims = self.cache.victims(self.by_id.get, keep)
+        for schedule_id in victims:
+            del self.by_id[schedule_id]
+        if victims:
+            self._schedules = [schedule for schedule in self._schedules
+                               if schedule['ID'] is None or schedule['ID'] in self.by_id]
+        return victims
+
+    def clear(self):
+        self._schedules.clear()
+        self.by_id.clear()
+        self._pending.clear()
+        if self.cache is not None:
+            self.cache.clear()
+
+
+class ReportCounters:
+    # Running order and schedule aggregates. Revenue is kept in centavos so
+    # repeated deltas add up exactly.
+    def __init__(self, closed_statuses):
+        self.closed_statuses = closed_statuses
+        self.ready = False
+        self.orders = 0
+        self.revenue = 0
+        self.order_status = {}
+        self.day_orders = {}
+        self.day_revenue = {}
+        self.schedule_status = {}
+        self.day_schedules = {}
+
+    @staticmethod
+    def cents(amount):
+        return int(round(float(amount) * 100)) if amount is not None else 0
+
+    @staticmethod
+    def bump(counts, key, delta):
+        value = counts.get(key, 0) + delta
+        if value:
+            counts[key] = value
+        else:
+            counts.pop(key, None)
+
+    @staticmethod
+    def order_fields(order):
+        return {'Status': order['Status'], 'Total': order['Total'], 'Order Date': order['Order Date']}
+
+    @staticmethod
+    def schedule_fields(schedule):
+        return {'Status': schedule['Status'], 'Date': schedule['Date']}
+
+    def count_orders(self, order_date, status, count, revenue_cents):
+        self.orders += count
+        self.revenue += revenue_cents
+        self.bump(self.order_status, status, count)
+        self.bump(self.day_orders, order_date, count)
+        self.bump(self.day_revenue, order_date, revenue_cents)
+
+    def count_schedules(self, schedule_date, status, count):
+        self.bump(self.schedule_status, status, count)
+        self.bump(self.day_schedules, schedule_date, count)
+
+    def count_order(self, order, sign=1):
+        self.count_orders(order['Order Date'], order['Status'], sign, sign * self.cents(order['Total']))
+
+    def count_schedule(self, schedule, sign=1):
+        self.count_schedules(schedule['Date'], schedule['Status'], sign)
+
+    def open_schedules(self):
+        return sum(count for status, count in self.schedule_status.items() if status not in self.closed_statuses)
+
+    def totals(self):
+        return {
+            'orders': self.orders,
+            'revenue': self.revenue / 100,
+            'open_schedules': self.open_schedules()
+        }
+
+    def daily(self, order_date, schedule_date):
+        return {
+            'orders': self.day_orders.get(order_date, 0),
+            'revenue': self.day_revenue.get(order_date, 0) / 100,
+            'schedules': self.day_schedules.get(schedule_date, 0)
+        }
+
+    def snapshot(self):
+        return {
+            'orders': self.orders,
+            'revenue': self.revenue,
+            'order_status': dict(self.order_status),
+            'day_orders': dict(self.day_orders),
+            'day_revenue': dict(self.day_revenue),
+            'schedule_status': dict(self.schedule_status),
+            'day_schedules': dict(self.day_schedules)
+        }
+
+
+class UserSearchIndex:
+    # Prefix queries bisect a sorted token list; queries of MIN_SUBSTRING
+    # characters or more also scan the prebuilt lowercase text for matches
+    # inside words, stopping once `limit` users are found.
+    FIELDS = ('fullname', 'contact_info', 'email_address', 'home_address')
+    MIN_SUBSTRING = 3
+    TOKEN_SEPARATORS = re.compile(r"[\s,@.]+")
+
+    def __init__(self):
+        self.text = {}
+        self.postings = {}
+        self.tokens = []
+
+    @classmethod
+    def text_of(cls, data):
+        # Tabs keep a query from matching across two fields.
+        return '\t'.join(str(data.get(field) or '').lower() for field in cls.FIELDS)
+
+    def tokens_of(self, text):
+        tokens = set()
+        for value in text.split('\t'):
+            if value:
+                tokens.add(value)
+                tokens.update(t for t in self.TOKEN_SEPARATORS.split(value) if t)
+        return tokens
+
+    @classmethod
+    def build(cls, users):
+        index = cls()
+        for data in users:
+            index.add(data['id'], data, keep_sorted=False)
+        index.tokens = sorted(index.postings)
+        return index
+
+    def add(self, user_id, data, keep_sorted=True):
+        text = self.text_of(data)
+        self.text[user_id] = text
+        for token in self.tokens_of(text):
+            ids = self.postings.get(token)
+            if ids is None:
+                self.postings[token] = ids = []
+                if keep_sorted:
+                    bisect.insort(self.tokens, token)
+            ids.append(user_id)
+
+    def remove(self, user_id):
+        text = self.text.pop(user_id, None)
+        if text is None:
+            return
+        for token in self.tokens_of(text):
+            ids = self.postings.get(token)
+            if ids is None or user_id not in ids:
+                continue
+            ids.remove(user_id)
+            if not ids:
+                del self.postings[token]
+                del self.tokens[bisect.bisect_left(self.tokens, token)]
+
+    def search(self, query, limit=None):
+        query = query.strip().lower()
+        matches = []
+        seen = set()
+        position = bisect.bisect_left(self.tokens, query)
+        while position < len(self.tokens) and self.tokens[position].startswith(query):
+            for user_id in self.postings[self.tokens[position]]:
+                if user_id not in seen:
+                    seen.add(user_id)
+                    matches.append(user_id)
+                    if limit is not None and len(matches) >= limit:
+                        return matches
+            position += 1
+        if len(query) < self.MIN_SUBSTRING:
+            return matches
+        for user_id, text in self.text.items():
+            if query in text and user_id not in seen:
+                matches.append(user_id)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+
+class UserRegistry:
+    ROLES = ('Admin', 'Staff', 'Customer')
+
+    def __init__(self):
+        self.by_email = {}
+        self.by_id = {}
+        self.by_role = {role: {} for role in self.ROLES}
+        self._flat = None
+        # Built on the first search, then kept up to date by add/remove.
+        self._search_index = None
+
+    @staticmethod
+    def normalize(email):
+        return (email or '').strip().lower()
+
+    def __len__(self):
+        return len(self.by_email)
+
+    def __contains__(self, email):
+        return self.normalize(email) in self.by_email
+
+    def add(self, role, data):
+        email = self.normalize(data['email_address'])
+        if email in self.by_email:
+            raise KeyError(f"Duplicate email: {data['email_address']}")
+        self.by_email[email] = (role, data)
+        self.by_id[data['id']] = email
+        self.by_role[role][email] = data
+        self._flat = None
+        if self._search_index is not None:
+            self._search_index.add(data['id'], data)
+
+    def get(self, email):
+        return self.by_email.get(self.normalize(email), (None, None))
+
+    def get_by_id(self, user_id):
+        email = self.by_id.get(user_id)
+        if email is None:
+            return None, None
+        return self.by_email[email]
+
+    def remove_by_id(self, user_id):
+        email = self.by_id.pop(user_id, None)
+        if email is None:
+            return None, None
+        role, data = self.by_email.pop(email)
+        del self.by_role[role][email]
+        self._flat = None
+        if self._search_index is not None:
+            self._search_index.remove(user_id)
+        return role, data
+
+    def clear(self):
+        self.by_email.clear()
+        self.by_id.clear()
+        for users in self.by_role.values():
+            users.clear()
+        self._flat = None
+        self._search_index = None
+
+    def count(self, role):
+        return len(self.by_role[role])
+
+    @staticmethod
+    def flat_user(role, data):
+        return {
+            'id': data['id'],
+            'name': data['fullname'],
+            'contact': data['contact_info'],
+            'role': role,
+            'email': data.get('email_address', 'N/A'),
+            'address': data.get('home_address', 'N/A')
+        }
+
+    def flat(self):
+        if self._flat is None:
+            self._flat = [
+                self.flat_user(role, data)
+                for role in self.ROLES
+                for data in self.by_role[role].values()
+            ]
+        return self._flat
+
+    def search_ready(self):
+        return self._search_index is not None
+
+    def install_search_index(self, index):
+        # The index was built from a snapshot; catch up with later changes.
+        for user_id in set(index.text) - set(self.by_id):
+            index.remove(user_id)
+        for user_id in set(self.by_id) - set(index.text):
+            index.add(user_id, self.get_by_id(user_id)[1])
+        self._search_index = index
+
+    def search(self, query, limit=None):
+        if self._search_index is None:
+            self._search_index = UserSearchIndex.build(
+                data for role in self.ROLES for data in self.by_role[role].values())
+        users = []
+        for user_id in self._search_index.search(query, limit):
+            role, data = self.get_by_id(user_id)
+            users.append(self.flat_user(role, data))
+        return users
+
+    @staticmethod
+    def matches(data, query):
+        return query.strip().lower() in UserSearchIndex.text_of(data)
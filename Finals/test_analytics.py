@@ -0,0 +1,75 @@
+# test_analytics.py - OrderAnalytics buckets, item counts and cache invalidation
+
+import os
+import sys
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics import OrderAnalytics
+
+# 2026-01-05 and 2026-02-02 are Mondays; 2026-01-11 is the Sunday after.
+ORDERS = [('O1', 'a@mail.com', '2026-01-05', 100.0),
+          ('O2', 'b@mail.com', '2026-01-11', 60.0),
+          ('O3', 'a@mail.com', '2026-02-02', 70.0)]
+ITEMS = [('O1', 'Clothes', 1.0, 50.0), ('O1', 'Clothes', 1.0, 50.0),
+         ('O2', 'Beddings', 1.0, 60.0),
+         ('O3', 'Curtains', 1.0, 70.0)]
+
+
+def built():
+    analytics = OrderAnalytics()
+    analytics.build(lambda: (ORDERS, ITEMS))
+    return analytics
+
+
+def order(order_id, email, order_date, items):
+    return {'Order ID': order_id, 'User Email': email, 'Order Date': order_date,
+            'Total': sum(subtotal for item, kg, subtotal in items),
+            'items': [{'item': item, 'actual_kg': kg, 'subtotal': subtotal} for item, kg, subtotal in items]}
+
+
+def test_weeks_and_months():
+    analytics = built()
+    assert analytics.summarize('week', '2026-01-01', '2026-02-28') == \
+        [('2026-01-05', 2, 3.0, 160.0), ('2026-02-02', 1, 1.0, 70.0)]
+    assert analytics.summarize('month', '2026-01-01', '2026-02-28') == \
+        [('2026-01', 2, 3.0, 160.0), ('2026-02', 1, 1.0, 70.0)]
+    assert analytics.summarize('day', '2026-01-06', '2026-01-31') == [('2026-01-11', 1, 1.0, 60.0)]
+
+
+def test_item_counts_each_order_once():
+    analytics = built()
+    assert analytics.summarize('item', '2026-01-01', '2026-02-28') == \
+        [('Clothes', 1, 2.0, 100.0), ('Beddings', 1, 1.0, 60.0), ('Curtains', 1, 1.0, 70.0)]
+
+
+def test_changes_invalidate_cached_results():
+    analytics = built()
+    january = ('month', '2026-01-01', '2026-01-31')
+    february = ('month', '2026-02-01', '2026-02-28')
+    assert analytics.summarize(*january) == [('2026-01', 2, 3.0, 160.0)]
+    assert analytics.summarize(*february) == [('2026-02', 1, 1.0, 70.0)]
+    analytics.upsert_order(order('O4', 'c@mail.com', '2026-01-20', [('Clothes', 2.0, 100.0), ('Clothes', 1.0, 50.0)]))
+    assert analytics.summarize(*january) == [('2026-01', 3, 6.0, 310.0)]
+    assert analytics.summarize('item', '2026-01-01', '2026-01-31')[0] == ('Clothes', 2, 5.0, 250.0)
+    analytics.upsert_order(order('O2', 'b@mail.com', '2026-01-11', [('Beddings', 2.0, 120.0)]))
+    assert analytics.summarize(*january) == [('2026-01', 3, 7.0, 370.0)]
+    analytics.remove_order('O1')
+    assert analytics.summarize(*january) == [('2026-01', 2, 5.0, 270.0)]
+    assert analytics.summarize('item', '2026-01-01', '2026-01-31') == \
+        [('Clothes', 1, 3.0, 150.0), ('Beddings', 1, 2.0, 120.0)]
+    assert analytics.summarize(*february) == [('2026-02', 1, 1.0, 70.0)]
+
+
+if __name__ == "__main__":
+    failed = False
+    for test in (test_weeks_and_months, test_item_counts_each_order_once, test_changes_invalidate_cached_results):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as err:
+            failed = True
+            print(f"✗ {test.__name__}: {err}")
+    sys.exit(1 if failed else 0)
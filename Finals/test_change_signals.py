@@ -0,0 +1,122 @@
+# test_change_signals.py - A change to one order repaints only that order's row
+
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication, QDialog, QDoubleSpinBox, QPushButton
+from database import DataManager
+
+APP = QApplication.instance() or QApplication(sys.argv)
+
+
+def open_dashboard(count):
+    from staff_dashboard import StaffDashboard
+    dm = DataManager()
+    dm.open_offline_database(os.path.join(tempfile.mkdtemp(), 'signals.db'))
+    dm.load_users()
+    for number in range(count):
+        dm.add_order({'Order ID': f"S{number:02d}", 'User Email': 'x@mail.com', 'Total': None,
+                      'Status': 'Washing', 'Order Date': '2026-01-01',
+                      'items': [{'id': None, 'item': 'Clothes', 'price_per_kg': 50.0, 'actual_kg': None,
+                                 'subtotal': None}]})
+    dm.hydrate_for('Staff', 'staff@mail.com', background=False)
+    dashboard = StaffDashboard(dm)
+    return dm, dashboard
+
+
+def record_model(model):
+    touched = {'rows': [], 'resets': 0, 'inserts': 0, 'layouts': 0}
+    model.dataChanged.connect(lambda top, bottom: touched['rows'].extend(range(top.row(), bottom.row() + 1)))
+    model.modelReset.connect(lambda: touched.__setitem__('resets', touched['resets'] + 1))
+    model.rowsInserted.connect(lambda *args: touched.__setitem__('inserts', touched['inserts'] + 1))
+    model.layoutChanged.connect(lambda: touched.__setitem__('layouts', touched['layouts'] + 1))
+    return touched
+
+
+def wait_for_batch(dashboard):
+    batches = []
+    dashboard.changes.changes_ready.connect(batches.append)
+    deadline = time.monotonic() + 2
+    while not batches and time.monotonic() < deadline:
+        APP.processEvents()
+        time.sleep(0.01)
+    return batches
+
+
+def close(dm, dashboard):
+    dashboard.close()
+    APP.processEvents()
+    dm.close()
+
+
+def test_single_order_update_touches_one_row():
+    dm, dashboard = open_dashboard(30)
+    try:
+        model = dashboard.order_model
+        assert model.rowCount() == 30
+        row = model.row_of('S07')
+        touched = record_model(model)
+        assert dm.update_order('S07', {'Status': 'Drying'})
+        assert wait_for_batch(dashboard), "no change batch arrived"
+        assert touched['rows'] == [row], touched
+        assert (touched['resets'], touched['inserts'], touched['layouts']) == (0, 0, 0), touched
+        assert model.order_at(row)['Status'] == 'Drying'
+    finally:
+        close(dm, dashboard)
+
+
+def test_repeated_updates_coalesce_into_one_repaint():
+    dm, dashboard = open_dashboard(30)
+    try:
+        model = dashboard.order_model
+        row = model.row_of('S12')
+        touched = record_model(model)
+        for status in ('Drying', 'Completed', 'Ready for Pickup'):
+            assert dm.update_order('S12', {'Status': status})
+        batches = wait_for_batch(dashboard)
+        assert len(batches) == 1, f"{len(batches)} batches"
+        assert touched['rows'] == [row], touched
+        assert model.order_at(row)['Status'] == 'Ready for Pickup'
+    finally:
+        close(dm, dashboard)
+
+
+def test_billing_is_saved_to_the_clicked_order_after_rows_move():
+    dm, dashboard = open_dashboard(30)
+    exec_ = QDialog.exec_
+
+    def edit_while_rows_move(dialog):
+        # A synced delete shifts every later row before the model resets.
+        dm.orders.remove('S00')
+        dialog.findChild(QDoubleSpinBox).setValue(3.0)
+        next(b for b in dialog.findChildren(QPushButton) if b.text() == "Save").click()
+        return QDialog.Accepted
+
+    QDialog.exec_ = edit_while_rows_move
+    try:
+        dashboard.order_table.on_button_clicked(dashboard.order_model.row_of('S05'))
+        assert dm.get_order('S05')['items'][0]['actual_kg'] == 3.0
+        assert dm.get_order('S06')['items'][0]['actual_kg'] is None
+    finally:
+        QDialog.exec_ = exec_
+        close(dm, dashboard)
+
+
+if __name__ == "__main__":
+    failed = False
+    for test in (test_single_order_update_touches_one_row, test_repeated_updates_coalesce_into_one_repaint,
+                 test_billing_is_saved_to_the_clicked_order_after_rows_move):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as err:
+            failed = True
+            print(f"✗ {test.__name__}: {err}")
+    sys.exit(1 if failed else 0)
@@ -56,6 +56,8 @@ except Exception as e:
 print("\n4. Testing Module Imports...")
 try:
     from database import DATA_MANAGER
+    DATA_MANAGER.start_loading()
+    DATA_MANAGER.wait_until_ready()
     print("   ✓ database.py imported")
 except Exception as e:
     print(f"   ✗ database.py error: {e}")
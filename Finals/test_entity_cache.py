@@ -0,0 +1,109 @@
+# test_entity_cache.py - The bounded cache never drops rows that are in use
+
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication, QMessageBox
+from database import DataManager
+
+APP = QApplication.instance() or QApplication(sys.argv)
+
+
+def open_manager(active, completed):
+    dm = DataManager()
+    dm.open_offline_database(os.path.join(tempfile.mkdtemp(), 'cache.db'))
+    dm.load_users()
+    for number in range(active + completed):
+        dm.add_order({'Order ID': f"O{number:02d}", 'User Email': 'x@mail.com', 'Total': None,
+                      'Status': 'Washing' if number >= completed else 'Completed', 'Order Date': '2026-01-01',
+                      'items': [{'id': None, 'item': 'Clothes', 'price_per_kg': 50.0, 'actual_kg': None,
+                                 'subtotal': None}]})
+    return dm
+
+
+def test_fetched_order_is_returned_when_hot_rows_fill_the_cache():
+    dm = open_manager(active=20, completed=5)
+    try:
+        dm.enable_cache(max_entries=20)
+        assert 'O00' not in dm.orders
+        order = dm.get_order('O00')
+        assert order is not None and order['Order ID'] == 'O00'
+        assert dm.update_order('O00', {'Status': 'Cancelled'})
+        assert dm.save_billing('O01', [2.0])
+    finally:
+        dm.close()
+
+
+def test_admin_order_page_settles():
+    dm = open_manager(active=0, completed=80)
+    warnings_shown = []
+    critical = QMessageBox.critical
+    QMessageBox.critical = staticmethod(lambda *args, **kwargs: warnings_shown.append(args[2]))
+    calls = []
+    query_orders = dm.query_orders
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return query_orders(*args, **kwargs)
+
+    dm.query_orders = counting
+    try:
+        from admin_dashboard import AdminDashboard
+        dm.enable_cache(max_entries=20)
+        dm.hydrate_for('Admin', 'admina@mail.com', background=False)
+        dashboard = AdminDashboard(dm)
+        dashboard.buttons['view_orders'].click()
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            APP.processEvents()
+            time.sleep(0.01)
+        dashboard.close()
+        APP.processEvents()
+        assert not warnings_shown, warnings_shown
+        assert len(calls) <= 3, f"{len(calls)} page loads"
+    finally:
+        QMessageBox.critical = critical
+        dm.close()
+
+
+def test_eviction_does_not_shift_the_staff_order_rows():
+    from staff_dashboard import StaffDashboard
+    dm = open_manager(active=30, completed=5)
+    dashboard = StaffDashboard(dm)
+    try:
+        model = dashboard.order_model
+        shown = [model.order_at(row)['Order ID'] for row in range(model.rowCount())]
+        dm.enable_cache(max_entries=20)
+        assert len(dm.orders) == 30
+        # Until the coalesced batch arrives, every row still shows its order.
+        assert [model.order_at(row)['Order ID'] for row in range(model.rowCount())] == shown
+        deadline = time.monotonic() + 2
+        while model.rowCount() != len(dm.orders) and time.monotonic() < deadline:
+            APP.processEvents()
+            time.sleep(0.01)
+        assert [model.order_at(row)['Order ID'] for row in range(model.rowCount())] == \
+            [order['Order ID'] for order in dm.orders]
+    finally:
+        dashboard.close()
+        APP.processEvents()
+        dm.close()
+
+
+if __name__ == "__main__":
+    failed = False
+    for test in (test_fetched_order_is_returned_when_hot_rows_fill_the_cache, test_admin_order_page_settles,
+                 test_eviction_does_not_shift_the_staff_order_rows):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as err:
+            failed = True
+            print(f"✗ {test.__name__}: {err}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,108 @@
+# test_login_leaks.py - Logging in and out leaves no handlers or memory behind
+
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QEvent, QMetaMethod
+from PyQt5.QtWidgets import QApplication
+
+APP = QApplication.instance() or QApplication(sys.argv)
+
+LOGINS = 100
+WARM_UP = 10
+# Allowance for interpreter caches that fill once, not per login.
+MEMORY_SLACK = 512 * 1024
+USERS = (('Customer', 'leak.customer@mail.com'), ('Staff', 'leak.staff@mail.com'), ('Admin', 'leak.admin@mail.com'))
+
+
+def signal_receivers(dm):
+    meta = dm.metaObject()
+    counts = {}
+    for number in range(meta.methodOffset(), meta.methodCount()):
+        method = meta.method(number)
+        if method.methodType() == QMetaMethod.Signal:
+            name = bytes(method.name()).decode()
+            counts[name] = dm.receivers(getattr(dm, name))
+    return counts
+
+
+def open_manager():
+    from database import DATA_MANAGER
+    import main
+    path = os.path.join(tempfile.mkdtemp(), 'leaks.db')
+    DATA_MANAGER.open_storage = lambda: DATA_MANAGER.open_offline_database(path)
+    # As in the app: the login screen is up before the users have loaded.
+    DATA_MANAGER.start_loading()
+    manager = main.WashDeskManager()
+    assert DATA_MANAGER.wait_for_users(10)
+    APP.processEvents()
+    for role, email in USERS:
+        DATA_MANAGER.register_user(role, {'fullname': role, 'email': email, 'password': 'x', 'contact_info': '0'})
+    for number in range(20):
+        DATA_MANAGER.add_order({'Order ID': f"L{number:02d}", 'User Email': USERS[0][1], 'Total': None,
+                                'Status': 'Washing', 'Order Date': '2026-01-01',
+                                'items': [{'id': None, 'item': 'Clothes', 'price_per_kg': 50.0, 'actual_kg': None,
+                                           'subtotal': None}]})
+    return DATA_MANAGER, manager
+
+
+def settle(dm):
+    dm.wait_for_scope(5)
+    for _ in range(3):
+        APP.processEvents()
+        APP.sendPostedEvents(None, QEvent.DeferredDelete)
+    gc.collect()
+
+
+def log_in_and_out(dm, manager, number):
+    role, email = USERS[number % len(USERS)]
+    manager.switch_to_dashboard(*dm.get_user(email))
+    settle(dm)
+    assert manager.current_dashboard is not None, f"{role} login failed"
+    manager.current_dashboard.close()
+    settle(dm)
+
+
+def live_dashboards():
+    from ui_helpers import BaseDashboard
+    return [widget for widget in APP.topLevelWidgets() if isinstance(widget, BaseDashboard)]
+
+
+def test_repeated_logins_do_not_leak():
+    dm, manager = open_manager()
+    try:
+        for number in range(WARM_UP):
+            log_in_and_out(dm, manager, number)
+        receivers = signal_receivers(dm)
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for number in range(LOGINS):
+            log_in_and_out(dm, manager, number)
+        growth = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        assert signal_receivers(dm) == receivers, (receivers, signal_receivers(dm))
+        assert not live_dashboards(), f"{len(live_dashboards())} dashboards still alive"
+        assert growth < MEMORY_SLACK, f"memory grew {growth / 1024:.0f} KB over {LOGINS} logins"
+    finally:
+        manager.close()
+        dm.close()
+
+
+if __name__ == "__main__":
+    failed = False
+    for test in (test_repeated_logins_do_not_leak,):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as err:
+            failed = True
+            print(f"✗ {test.__name__}: {err}")
+    sys.exit(1 if failed else 0)
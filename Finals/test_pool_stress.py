@@ -0,0 +1,78 @@
+# test_pool_stress.py - Many threads using one DataManager at once
+
+import os
+import sys
+import threading
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from seed_data import ENGINES, new_order, open_manager
+from storage import DB_ERRORS
+
+THREADS = 16
+ROUNDS = 15
+
+
+def hammer(dm, worker, errors):
+    email = f"worker{worker}@mail.com"
+    try:
+        assert dm.register_user('Customer', {'fullname': email, 'email': email, 'password': 'x',
+                                             'contact_info': '1', 'home_address': 'a'})
+        for number in range(ROUNDS):
+            order_id = f"W{worker:02d}-{number:02d}"
+            assert dm.add_order(new_order(order_id, email)), order_id
+            assert dm.update_order(order_id, {'Status': 'Washing'}), order_id
+            assert dm.save_billing(order_id, [1.0, 2.0]), order_id
+            assert dm.add_schedule({'User Email': email, 'Type': 'Pick-up', 'Date': '01/05/2026',
+                                    'Time': '09:00 AM', 'Address': 'a', 'Email': email, 'Status': 'Scheduled'})
+            dm.query_orders(customer=email, limit=5)
+            dm.get_report_totals()
+    except Exception as err:
+        errors.append(f"worker {worker}: {err!r}")
+
+
+def test_concurrent_writers(engine):
+    dm = open_manager(engine)
+    errors = []
+    threads = [threading.Thread(target=hammer, args=(dm, worker, errors)) for worker in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+
+    expected = THREADS * ROUNDS
+    with engine.transaction() as cursor:
+        cursor.execute("SELECT COUNT(*) AS orders, SUM(total) AS revenue FROM orders")
+        row = cursor.fetchone()
+        assert row['orders'] == expected and float(row['revenue']) == expected * 170.0
+        cursor.execute("SELECT COUNT(*) AS items, COUNT(DISTINCT id) AS ids FROM order_items")
+        row = cursor.fetchone()
+        assert row['items'] == row['ids'] == expected * 2
+        cursor.execute("SELECT COUNT(*) AS schedules FROM schedules")
+        assert cursor.fetchone()['schedules'] == expected
+    item_ids = [item['id'] for order in dm.orders for item in order['items']]
+    assert None not in item_ids and len(set(item_ids)) == expected * 2
+    assert len({schedule['ID'] for schedule in dm.schedules}) == expected
+    assert dm.verify_report_counters() == []
+
+
+if __name__ == "__main__":
+    failed = False
+    for name in sorted(ENGINES):
+        try:
+            storage = ENGINES[name](pool_size=5) if name == 'mysql' else ENGINES[name]()
+        except DB_ERRORS as err:
+            print(f"- {name}: skipped, engine unavailable ({err})")
+            continue
+        try:
+            test_concurrent_writers(storage)
+            print(f"✓ {name}: {THREADS} threads x {ROUNDS} orders")
+        except AssertionError as err:
+            failed = True
+            print(f"✗ {name}: {err}")
+        finally:
+            storage.close()
+    sys.exit(1 if failed else 0)
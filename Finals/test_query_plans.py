@@ -0,0 +1,177 @@
+# test_query_plans.py - Every filtered query DataManager sends must use an index
+
+import os
+import re
+import sys
+import warnings
+from contextlib import contextmanager
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PyQt5.QtCore import QDate
+from seed_data import ENGINES, customer_email, mysql_engine, open_manager, seed_engine
+from storage import DB_ERRORS, SQLiteEngine
+
+# Statements without WHERE or LIMIT read whole tables on purpose (the user
+# directory, the analytics build, the summary tables) and are not checked.
+FILTERED = re.compile(r"\b(WHERE|LIMIT)\b", re.IGNORECASE)
+WHERE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+# Scans that are known and accepted, with the reason.
+ACCEPTED_SCANS = (
+    # _search_users_in_sql: a substring LIKE cannot use a B-tree index, and
+    # it only runs while the accounts are still loading.
+    re.compile(r"\bLIKE\b.*\bESCAPE\b", re.IGNORECASE | re.DOTALL),
+)
+
+
+class RecordingCursor:
+    def __init__(self, cursor, statements):
+        self.cursor = cursor
+        self.statements = statements
+
+    def execute(self, sql, params=()):
+        self.statements.append((sql, tuple(params or ())))
+        return self.cursor.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+
+def record_statements(engine, statements):
+    transaction = engine.transaction
+
+    @contextmanager
+    def recording():
+        with transaction() as cursor:
+            yield RecordingCursor(cursor, statements)
+
+    engine.transaction = recording
+    return lambda: setattr(engine, 'transaction', transaction)
+
+
+def reopen(engine):
+    # A second client on the same database.
+    if engine.name == 'sqlite':
+        return SQLiteEngine(engine.path)
+    return mysql_engine(pool_size=1, reset=False)
+
+
+def exercise(dm, other):
+    email = customer_email(1)
+    today = QDate.currentDate().toString("MM/dd/yyyy")
+    dm._search_users_in_sql('customer1', 20)
+    dm._search_users_in_sql('', 20)
+    dm.hydrate_for('Customer', email, background=False)
+    dm.hydrate_for('Staff', 'staff@mail.com', background=False)
+    dm.hydrate_for('Admin', 'admina@mail.com', background=False)
+
+    for sort in dm.ORDER_SORT_FIELDS:
+        page, cursor = dm.query_orders(sort=sort, limit=20)
+        dm.query_orders(sort=sort, after=cursor, limit=20)
+    dm.query_orders(status='Washing', limit=20)
+    dm.query_orders(status=list(dm.ACTIVE_STATUSES), limit=20)
+    dm.query_orders(date_from='2025-03-01', date_to='2025-03-31', limit=20)
+    dm.query_orders(customer=email, limit=20)
+    for sort in dm.SCHEDULE_SORT_FIELDS:
+        page, cursor = dm.query_schedules(sort=sort, limit=20)
+        dm.query_schedules(sort=sort, after=cursor, limit=20)
+    dm.query_schedules(status='Scheduled', limit=20)
+    dm.query_schedules(schedule_date=today, limit=20)
+    dm.query_schedules(customer=email, limit=20)
+
+    dm.get_revenue_report('2025-03-01', '2025-03-31')
+    dm.enable_cache(max_entries=10000)
+    other.enable_cache(max_entries=10000)
+    dm.get_order('S0000005')
+    dm.get_schedule(5)
+
+    dm.register_user('Customer', {'fullname': 'Plan Test', 'email': 'plan@mail.com', 'password': 'x',
+                                  'contact_info': '1', 'home_address': 'a'})
+    dm.add_order({'Order ID': 'PLAN1', 'User Email': 'plan@mail.com', 'Total': None, 'Status': 'Pending Pick-up',
+                  'Order Date': '2025-03-15',
+                  'items': [{'id': None, 'item': 'Clothes', 'price_per_kg': 50.0, 'actual_kg': None, 'subtotal': None}]})
+    dm.update_order('PLAN1', {'Status': 'Washing'})
+    dm.save_billing('PLAN1', [3.0])
+    dm.add_schedule({'User Email': 'plan@mail.com', 'Type': 'Pick-up', 'Date': today, 'Time': '09:00 AM',
+                     'Address': 'a', 'Email': 'plan@mail.com', 'Status': 'Scheduled'})
+    other.update_order('S0000007', {'Status': 'Drying'})
+    dm.poll_changes()
+    dm.delete_user(dm.get_user('plan@mail.com')[1]['id'])
+    dm.prune_change_log()
+
+
+def sqlite_scans(cursor, sql, params):
+    # Only SEARCH is accepted, except the scan of an unfiltered page that
+    # reads rows in index order and stops at the LIMIT.
+    # A derived table holds rows its own plan already picked, so reading it
+    # back is not a table scan.
+    cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+    plan = cursor.fetchall()
+    # Sorts are matched to the scan feeding the same (sub)query.
+    sorted_in_memory = {row['parent'] for row in plan if 'TEMP B-TREE' in row['detail']}
+    derived = {row['detail'].split()[1] for row in plan if row['detail'].startswith(('MATERIALIZE ', 'CO-ROUTINE '))}
+    return [row['detail'] for row in plan
+            if row['detail'].startswith('SCAN ') and row['detail'] != 'SCAN CONSTANT ROW'
+            and row['detail'].split()[1] not in derived
+            and (WHERE.search(sql) or row['parent'] in sorted_in_memory)]
+
+
+def mysql_scans(cursor, sql, params):
+    # type ALL is a table scan and index a full index scan; the same
+    # unfiltered-page exception applies as on SQLite.
+    cursor.execute("EXPLAIN " + sql, params)
+    return [f"{row['table']}: type {row['type']}" for row in cursor.fetchall()
+            if row['type'] in ('ALL', 'index') and not (row['table'] or '').startswith('<derived')
+            and (WHERE.search(sql) or 'filesort' in (row['Extra'] or ''))]
+
+
+def full_scans(engine, statements):
+    plan_scans = sqlite_scans if engine.name == 'sqlite' else mysql_scans
+    scans = []
+    with engine.transaction() as cursor:
+        for sql, params in statements:
+            if not FILTERED.search(sql) or sql.lstrip().upper().startswith('INSERT'):
+                continue
+            if any(pattern.search(sql) for pattern in ACCEPTED_SCANS):
+                continue
+            for scan in plan_scans(cursor, sql, params):
+                scans.append((scan, " ".join(sql.split())))
+    return scans
+
+
+def test_no_full_table_scans(engine):
+    seed_engine(engine, customers=200, orders=3000, schedules=600)
+    dm = open_manager(engine)
+    other = open_manager(reopen(engine))
+    statements = []
+    restores = [record_statements(dm.engine, statements), record_statements(other.engine, statements)]
+    try:
+        exercise(dm, other)
+    finally:
+        for restore in restores:
+            restore()
+    scans = full_scans(engine, statements)
+    dm.stop_sync()
+    other.close()
+    assert statements
+    assert not scans, "\n".join(f"{scan}: {sql}" for scan, sql in sorted(set(scans)))
+
+
+if __name__ == "__main__":
+    failed = False
+    for name in sorted(ENGINES):
+        try:
+            storage = ENGINES[name]()
+        except DB_ERRORS as err:
+            print(f"- {name}: skipped, engine unavailable ({err})")
+            continue
+        try:
+            test_no_full_table_scans(storage)
+            print(f"✓ {name}: no filtered query scans a whole table")
+        except AssertionError as err:
+            failed = True
+            print(f"✗ {name}: full table scans found:\n{err}")
+        finally:
+            storage.close()
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,160 @@
+# test_storage.py - Behaviour every storage engine must share (SQLite and MySQL)
+
+import os
+import sys
+import warnings
+from contextlib import contextmanager
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from migrations import MIGRATIONS
+from seed_data import ENGINES, new_order, open_manager, seed_engine
+from storage import DB_ERRORS
+
+
+def test_schema_setup_is_idempotent(engine):
+    open_manager(engine)
+    open_manager(engine)
+    with engine.transaction() as cursor:
+        cursor.execute("SELECT MAX(version) AS version FROM schema_version")
+        assert cursor.fetchone()['version'] == MIGRATIONS[-1][0]
+        cursor.execute("SELECT COUNT(*) AS admins FROM users WHERE email_address = %s", ('admina@mail.com',))
+        assert cursor.fetchone()['admins'] == 1
+
+
+def test_failed_transaction_rolls_back(engine):
+    open_manager(engine)
+    with pytest.raises(RuntimeError):
+        with engine.transaction() as cursor:
+            cursor.execute("INSERT INTO change_log (entity, entity_key, op, origin) VALUES (%s, %s, %s, %s)",
+                           ('order', 'X1', 'upsert', 'test'))
+            raise RuntimeError("abort")
+    with engine.transaction() as cursor:
+        cursor.execute("SELECT COUNT(*) AS entries FROM change_log WHERE entity_key = %s", ('X1',))
+        assert cursor.fetchone()['entries'] == 0
+
+
+def test_lastrowid_and_add_totals(engine):
+    open_manager(engine)
+    with engine.transaction() as cursor:
+        cursor.execute("INSERT INTO schedules (user_email, type, date, time, address, email, status) "
+                       "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                       ('x@mail.com', 'Pick-up', '01/05/2026', '09:00 AM', 'a', 'x@mail.com', 'Scheduled'))
+        first = cursor.lastrowid
+        cursor.execute("INSERT INTO schedules (user_email, type, date, time, address, email, status) "
+                       "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                       ('x@mail.com', 'Delivery', '01/05/2026', '10:00 AM', 'a', 'x@mail.com', 'Scheduled'))
+        assert cursor.lastrowid == first + 1
+        for _ in range(3):
+            engine.add_totals(cursor, 'daily_schedule_totals', {'date': '01/05/2026', 'status': 'Test'},
+                              {'schedules': 2})
+    with engine.transaction() as cursor:
+        cursor.execute(f"SELECT schedules FROM daily_schedule_totals WHERE date = %s AND status = %s {engine.row_lock}",
+                       ('01/05/2026', 'Test'))
+        assert cursor.fetchone()['schedules'] == 6
+
+
+def test_orders_round_trip(engine):
+    dm = open_manager(engine)
+    assert dm.register_user('Customer', {'fullname': 'X', 'email': 'x@mail.com', 'password': 'x',
+                                         'contact_info': '1', 'home_address': 'a'})
+    assert dm.add_order(new_order('R1', 'x@mail.com'))
+    item_ids = [item['id'] for item in dm.orders.get('R1')['items']]
+    assert None not in item_ids and len(set(item_ids)) == 2
+    assert dm.update_order('R1', {'Status': 'Washing'})
+    assert dm.save_billing('R1', [2.0, 1.5])
+
+    other = open_manager(engine)
+    assert other.get_user('x@mail.com')[0] == 'Customer'
+    other.hydrate_for('Customer', 'x@mail.com', background=False)
+    assert dict(other.orders.get('R1')) == dict(dm.orders.get('R1'))
+    assert other.orders.get('R1')['Total'] == 190.0
+
+
+def test_changes_reach_other_clients(engine):
+    dm = open_manager(engine)
+    other = open_manager(engine)
+    other.sync_token = other._current_sync_token()
+    other.hydrate_for('Customer', 'x@mail.com', background=False)
+    dm.add_order(new_order('C1', 'x@mail.com'))
+    dm.add_schedule({'User Email': 'x@mail.com', 'Type': 'Pick-up', 'Date': '01/05/2026', 'Time': '09:00 AM',
+                     'Address': 'a', 'Email': 'x@mail.com', 'Status': 'Scheduled'})
+    dm.update_order('C1', {'Status': 'Drying'})
+    assert other.poll_changes() == 2
+    assert other.orders.get('C1')['Status'] == 'Drying'
+    assert [schedule['Type'] for schedule in other.schedules] == ['Pick-up']
+
+
+def test_pages_and_reports_agree(engine):
+    dm = open_manager(engine)
+    for number in range(25):
+        dm.add_order(new_order(f"P{number:02d}", 'x@mail.com', order_date=f"2026-01-{number % 5 + 1:02d}"))
+        if number % 3 == 0:
+            dm.save_billing(f"P{number:02d}", [1.0, 1.0])
+    seen, cursor = [], None
+    while True:
+        page, cursor = dm.query_orders(after=cursor, limit=10)
+        seen.extend(order['Order ID'] for order in page)
+        if cursor is None:
+            break
+    assert sorted(seen) == [f"P{number:02d}" for number in range(25)]
+    assert dm.query_orders(date_from='2026-01-02', date_to='2026-01-02', limit=50)[0] == \
+        [dm.orders.get(order_id) for order_id in ('P21', 'P16', 'P11', 'P06', 'P01')]
+    report = dm.get_revenue_report('2026-01-01', '2026-01-31')
+    assert report['orders'] == 25 and report['revenue'] == 9 * 110.0
+    assert dm.get_report_totals()['orders'] == 25
+    assert dm.verify_report_counters() == []
+
+
+def test_scoped_fetch_is_two_queries(engine):
+    seed_engine(engine, customers=50, orders=2400, schedules=0)
+    dm = open_manager(engine)
+    statements = []
+    transaction = engine.transaction
+
+    @contextmanager
+    def counting():
+        with transaction() as cursor:
+            execute = cursor.execute
+            cursor.execute = lambda sql, params=(): statements.append(sql) or execute(sql, params)
+            yield cursor
+
+    engine.transaction = counting
+    try:
+        orders = dm.fetch_orders("WHERE status IN (%s, %s)", ('Washing', 'Drying'))
+    finally:
+        engine.transaction = transaction
+    # More orders than one IN list used to take, in one round trip each.
+    assert len(orders) > 500
+    assert len(statements) == 2
+    with engine.transaction() as cursor:
+        cursor.execute("SELECT COUNT(*) AS items FROM order_items i JOIN orders o ON o.order_id = i.order_id "
+                       "WHERE o.status IN (%s, %s)", ('Washing', 'Drying'))
+        assert sum(len(order['items']) for order in orders) == cursor.fetchone()['items']
+
+
+TESTS = [test_schema_setup_is_idempotent, test_failed_transaction_rolls_back, test_lastrowid_and_add_totals,
+         test_orders_round_trip, test_changes_reach_other_clients, test_pages_and_reports_agree,
+         test_scoped_fetch_is_two_queries]
+
+
+if __name__ == "__main__":
+    failed = False
+    for name in sorted(ENGINES):
+        for test in TESTS:
+            try:
+                storage = ENGINES[name]()
+            except DB_ERRORS as err:
+                print(f"- {name}: skipped, engine unavailable ({err})")
+                break
+            try:
+                test(storage)
+                print(f"✓ {name}: {test.__name__}")
+            except AssertionError as err:
+                failed = True
+                print(f"✗ {name}: {test.__name__} {err}")
+            finally:
+                storage.close()
+    sys.exit(1 if failed else 0)
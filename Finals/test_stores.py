@@ -0,0 +1,50 @@
+# test_stores.py - OrderStore keeps order and indexes through removals
+
+import os
+import sys
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from records import OrderRecord
+from stores import OrderStore
+
+
+def new_order(number):
+    return OrderRecord.from_dict({'Order ID': f"T{number:04d}", 'User Email': f"c{number % 3}@mail.com",
+                                  'Total': None, 'Status': 'Washing', 'Order Date': '2026-01-01', 'items': []})
+
+
+def test_removals_keep_order_and_positions():
+    store = OrderStore()
+    for number in range(100):
+        store.add(new_order(number))
+    # Enough removals to compact more than once, with adds in between.
+    removed = set(range(0, 100, 3)) | set(range(40, 90))
+    for number in sorted(removed):
+        assert store.remove(f"T{number:04d}")['Order ID'] == f"T{number:04d}"
+        if number == 60:
+            store.add(new_order(200))
+    assert store.remove('T0000') is None
+    expected = [f"T{number:04d}" for number in range(100) if number not in removed]
+    expected.append('T0200')
+    assert [order['Order ID'] for order in store] == expected
+    assert len(store) == len(expected)
+    assert sorted(o['Order ID'] for o in store.for_customer('c1@mail.com')) == \
+        sorted(i for i in expected if int(i[1:]) % 3 == 1)
+    for order_id in expected:
+        assert store.remove(order_id) is not None
+    assert len(store) == 0 and list(store) == []
+
+
+if __name__ == "__main__":
+    failed = False
+    for test in (test_removals_keep_order_and_positions,):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as err:
+            failed = True
+            print(f"✗ {test.__name__}: {err}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,133 @@
+# test_write_behind.py - A queued write that fails is undone in memory
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+from database import DataManager
+
+# A full QApplication, so widget tests collected in the same run still work.
+APP = QApplication.instance() or QApplication(sys.argv)
+
+
+def open_clients(count):
+    path = os.path.join(tempfile.mkdtemp(), 'write_behind.db')
+    clients = []
+    for _ in range(count):
+        dm = DataManager()
+        dm.open_offline_database(path)
+        dm.load_users()
+        dm.enable_write_behind()
+        clients.append(dm)
+    return clients
+
+
+def settle(dm):
+    dm.flush_writes()
+    APP.processEvents()
+
+
+def new_user(email):
+    return {'fullname': email, 'password': 'x', 'contact_info': '1', 'email': email, 'home_address': 'a'}
+
+
+def test_failed_registration_is_rolled_back():
+    first, second = open_clients(2)
+    failures = []
+    second.write_failed.connect(lambda description, error: failures.append(description))
+    try:
+        # Both clients pick the next free id; the second insert collides.
+        assert first.register_user('Customer', new_user('x@mail.com'))
+        settle(first)
+        assert second.register_user('Customer', new_user('y@mail.com'))
+        settle(second)
+        assert failures == ['register user y@mail.com']
+        assert 'y@mail.com' not in second.users
+        assert 'x@mail.com' in second.users
+    finally:
+        first.close()
+        second.close()
+
+
+def test_failed_update_is_reloaded():
+    dm, = open_clients(1)
+    try:
+        dm.add_order({'Order ID': 'WB1', 'User Email': 'x@mail.com', 'Total': None, 'Status': 'Pending Pick-up',
+                      'Order Date': '2026-01-01', 'items': []})
+        settle(dm)
+        dm.engine._connection().execute(
+            "CREATE TRIGGER block_updates BEFORE UPDATE ON orders BEGIN SELECT RAISE(ABORT, 'blocked'); END")
+        assert dm.update_order('WB1', {'Status': 'Washing'})
+        settle(dm)
+        assert dm.orders.get('WB1')['Status'] == 'Pending Pick-up'
+    finally:
+        dm.close()
+
+
+def test_failed_schedule_is_dropped():
+    dm, = open_clients(1)
+    try:
+        dm.engine._connection().execute(
+            "CREATE TRIGGER block_inserts BEFORE INSERT ON schedules BEGIN SELECT RAISE(ABORT, 'blocked'); END")
+        assert dm.add_schedule({'User Email': 'x@mail.com', 'Type': 'Pick-up', 'Date': '01/01/2026',
+                                'Time': '09:00 AM', 'Address': 'a', 'Email': 'x@mail.com', 'Status': 'Scheduled'})
+        settle(dm)
+        assert len(dm.schedules) == 0
+    finally:
+        dm.close()
+
+
+def test_replayed_schedule_is_announced_under_its_committed_id():
+    dm, = open_clients(1)
+    added = []
+    dm.schedule_added.connect(added.append)
+    release = threading.Event()
+    attempts = []
+
+    def burn_id_on_replay(cursor):
+        # Stands in for MySQL, whose AUTO_INCREMENT survives a rollback: the
+        # replayed insert gets a different id than the first attempt.
+        attempts.append(1)
+        if len(attempts) > 1:
+            cursor.execute("INSERT INTO schedules (user_email, status) VALUES ('other@mail.com', 'Scheduled')")
+
+    try:
+        # Hold the writer so the next three writes share one group.
+        dm._write("hold", lambda cursor: release.wait(5))
+        time.sleep(0.05)
+        dm._write("burn", burn_id_on_replay)
+        assert dm.add_schedule({'User Email': 'x@mail.com', 'Type': 'Pick-up', 'Date': '01/01/2026',
+                                'Time': '09:00 AM', 'Address': 'a', 'Email': 'x@mail.com', 'Status': 'Scheduled'})
+        dm._write("fail", lambda cursor: cursor.execute("SELECT no_such_column FROM schedules"))
+        release.set()
+        settle(dm)
+        schedule = next(iter(dm.schedules))
+        assert added == [schedule['ID']], (added, schedule['ID'])
+        assert all(row is schedule for row in dm.schedules.by_id.values())
+        with dm.engine.transaction() as cursor:
+            cursor.execute("SELECT user_email FROM schedules WHERE id = %s", (schedule['ID'],))
+            assert cursor.fetchone()['user_email'] == 'x@mail.com'
+    finally:
+        release.set()
+        dm.close()
+
+
+if __name__ == "__main__":
+    failed = False
+    for test in (test_failed_registration_is_rolled_back, test_failed_update_is_reloaded,
+                 test_failed_schedule_is_dropped, test_replayed_schedule_is_announced_under_its_committed_id):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as err:
+            failed = True
+            print(f"✗ {test.__name__}: {err}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,101 @@
+from PyQt5.QtWidgets import QTableView, QHeaderView, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QFont
+from order_table import ButtonDelegate
+
+
+class UserTableModel(QAbstractTableModel):
+    # Shows the current search result; filtering happens in the search
+    # index, so the model never walks rows to hide them.
+    HEADERS = ["Name", "Contact", "Role", "Email", "Address", "Actions"]
+    FIELDS = ['name', 'contact', 'role', 'email', 'address']
+    ACTION_COLUMN = 5
+
+    def __init__(self, users=None, parent=None):
+        super().__init__(parent)
+        self.users = users if users is not None else []
+        self._rows = None
+
+    def set_users(self, users):
+        self.beginResetModel()
+        self.users = users
+        self._rows = None
+        self.endResetModel()
+
+    def user_at(self, row):
+        if 0 <= row < len(self.users):
+            return self.users[row]
+        return None
+
+    def row_of(self, user_id):
+        if self._rows is None:
+            self._rows = {user['id']: row for row, user in enumerate(self.users)}
+        return self._rows.get(user_id)
+
+    def upsert_user(self, user):
+        row = self.row_of(user['id'])
+        if row is None:
+            row = len(self.users)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.users.append(user)
+            self._rows[user['id']] = row
+            self.endInsertRows()
+        else:
+            self.users[row] = user
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def remove_user(self, user_id):
+        row = self.row_of(user_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.users[row]
+        self._rows = None
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.users)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        user = self.user_at(index.row())
+        if user is None or role != Qt.DisplayRole:
+            return None
+        if index.column() == self.ACTION_COLUMN:
+            return "Delete"
+        return user[self.FIELDS[index.column()]]
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled
+
+
+class UserTableView(QTableView):
+    delete_requested = pyqtSignal(int)
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setFont(QFont('Arial', 9))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.verticalHeader().setDefaultSectionSize(30)
+        header = self.horizontalHeader()
+        for i in range(len(model.HEADERS) - 1):
+            header.setSectionResizeMode(i, QHeaderView.Stretch)
+        header.setSectionResizeMode(model.ACTION_COLUMN, QHeaderView.Fixed)
+        header.resizeSection(model.ACTION_COLUMN, 110)
+        self.button_delegate = ButtonDelegate(self)
+        self.button_delegate.clicked.connect(self.on_button_clicked)
+        self.setItemDelegateForColumn(model.ACTION_COLUMN, self.button_delegate)
+
+    def on_button_clicked(self, row):
+        user = self.model().user_at(row)
+        if user is not None:
+            self.delete_requested.emit(user['id'])
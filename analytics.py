@@ -0,0 +1,274 @@
+import datetime
+import threading
+import numpy as np
+
+ITEM_TYPES = ('Clothes', 'Beddings', 'Curtains', 'Others')
+GROUPINGS = ('day', 'week', 'month', 'item', 'customer')
+EPOCH = datetime.date(1970, 1, 1).toordinal()
+
+
+class ColumnTable:
+    # Equal-length NumPy columns with spare capacity, so appends do not
+    # copy the table every time.
+    def __init__(self, dtypes, capacity=1024):
+        self.dtypes = dtypes
+        self.size = 0
+        self.columns = {name: np.zeros(capacity, dtype) for name, dtype in dtypes.items()}
+
+    def __getitem__(self, name):
+        return self.columns[name][:self.size]
+
+    def reserve(self, count):
+        capacity = len(next(iter(self.columns.values())))
+        if self.size + count <= capacity:
+            return
+        capacity = max(capacity * 2, self.size + count)
+        for name, column in self.columns.items():
+            grown = np.zeros(capacity, self.dtypes[name])
+            grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+
+    def extend(self, **values):
+        count = len(next(iter(values.values())))
+        self.reserve(count)
+        start = self.size
+        for name, column in values.items():
+            self.columns[name][start:start + count] = column
+        self.size += count
+        return start
+
+
+def day_number(value):
+    return datetime.date.fromisoformat(str(value)[:10]).toordinal() - EPOCH
+
+
+def month_of(days):
+    return np.asarray(days, 'datetime64[D]').astype('datetime64[M]').astype(np.int32)
+
+
+def day_label(day):
+    return datetime.date.fromordinal(int(day) + EPOCH).isoformat()
+
+
+class OrderAnalytics:
+    # Revenue, kg and order counts per period, item type or customer.
+    # Order-level figures come from the orders table; the item breakdown
+    # comes from one row per order item. Results are cached per query and
+    # dropped when an order on one of their days changes.
+    ORDER_COLUMNS = {'day': np.int32, 'month': np.int32, 'customer': np.int32, 'revenue': np.float64, 'kg': np.float64,
+                     'item_start': np.int64, 'item_count': np.int32, 'live': np.bool_}
+    ITEM_COLUMNS = {'order': np.int64, 'day': np.int32, 'month': np.int32, 'item': np.int8, 'customer': np.int32,
+                    'kg': np.float64, 'revenue': np.float64, 'live': np.bool_}
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.ready = False
+            self.orders = ColumnTable(self.ORDER_COLUMNS)
+            self.items = ColumnTable(self.ITEM_COLUMNS)
+            self.order_rows = {}
+            self.customers = []
+            self.customer_codes = {}
+            self._cache = {}
+            # Changes seen while a build is reading the database; replayed
+            # on top of it, as the build may have missed them.
+            self._pending = None
+
+    @staticmethod
+    def item_code(item):
+        return ITEM_TYPES.index(item) if item in ITEM_TYPES else len(ITEM_TYPES) - 1
+
+    @staticmethod
+    def snapshot(order):
+        return (order['Order Date'], order['User Email'], order['Total'],
+                [(item['item'], item['actual_kg'], item['subtotal']) for item in order['items']])
+
+    def customer_code(self, email):
+        code = self.customer_codes.get(email)
+        if code is None:
+            code = self.customer_codes[email] = len(self.customers)
+            self.customers.append(email)
+        return code
+
+    def build(self, load):
+        # load() returns (orders, items): orders as (order_id, email, date,
+        # total) rows and items as (order_id, item, kg, subtotal) rows with
+        # each order's items next to each other.
+        with self._build_lock:
+            with self._lock:
+                if self.ready:
+                    return
+                self._pending = {}
+            try:
+                orders, items = load()
+                self._install(orders, items)
+            finally:
+                with self._lock:
+                    self._pending = None
+
+    def _install(self, orders, items):
+        order_ids = [row[0] for row in orders]
+        customers = np.array([self.customer_code(row[1]) for row in orders], np.int32)
+        days = np.array([str(row[2])[:10] for row in orders], 'datetime64[D]').astype(np.int64)
+        months = month_of(days)
+        totals = np.array([row[3] or 0 for row in orders], np.float64)
+        rows = {order_id: row for row, order_id in enumerate(order_ids)}
+
+        item_orders = np.array([rows.get(row[0], -1) for row in items], np.int64)
+        item_codes = np.array([self.item_code(row[1]) for row in items], np.int8)
+        item_kg = np.array([row[2] or 0 for row in items], np.float64)
+        item_revenue = np.array([row[3] or 0 for row in items], np.float64)
+        known = item_orders >= 0
+        item_orders, item_codes = item_orders[known], item_codes[known]
+        item_kg, item_revenue = item_kg[known], item_revenue[known]
+
+        item_start = np.zeros(len(orders), np.int64)
+        item_count = np.zeros(len(orders), np.int32)
+        first, starts, counts = np.unique(item_orders, return_index=True, return_counts=True)
+        item_start[first] = starts
+        item_count[first] = counts
+
+        with self._lock:
+            self.order_rows = rows
+            self.orders.extend(day=days, month=months, customer=customers, revenue=totals,
+                               kg=np.bincount(item_orders, weights=item_kg, minlength=len(orders)),
+                               item_start=item_start, item_count=item_count,
+                               live=np.ones(len(orders), np.bool_))
+            self.items.extend(order=item_orders, day=days[item_orders], month=months[item_orders], item=item_codes,
+                              customer=customers[item_orders], kg=item_kg, revenue=item_revenue,
+                              live=np.ones(len(item_orders), np.bool_))
+            self.ready = True
+            for order_id, snapshot in (self._pending or {}).items():
+                self._apply(order_id, snapshot)
+        print(f"✓ Analytics built over {len(orders)} orders and {len(item_orders)} items")
+
+    def upsert_order(self, order):
+        with self._lock:
+            if self._pending is not None:
+                self._pending[order['Order ID']] = self.snapshot(order)
+            if self.ready:
+                self._apply(order['Order ID'], self.snapshot(order))
+
+    def remove_order(self, order_id):
+        with self._lock:
+            if self._pending is not None:
+                self._pending[order_id] = None
+            if self.ready:
+                self._apply(order_id, None)
+
+    def _apply(self, order_id, snapshot):
+        row = self.order_rows.get(order_id)
+        if row is not None:
+            self._touch(self.orders['day'][row])
+        if snapshot is None:
+            if row is not None:
+                self._retire_items(row)
+                self.orders.columns['live'][row] = False
+                del self.order_rows[order_id]
+            return
+        order_date, email, total, items = snapshot
+        day = day_number(order_date)
+        month = int(month_of([day])[0])
+        customer = self.customer_code(email)
+        kg = [float(item_kg or 0) for item, item_kg, subtotal in items]
+        order_row = row if row is not None else self.orders.size
+        item_values = dict(order=[order_row] * len(items),
+                           day=[day] * len(items),
+                           month=[month] * len(items),
+                           item=[self.item_code(item) for item, k, s in items],
+                           customer=[customer] * len(items),
+                           kg=kg,
+                           revenue=[float(subtotal or 0) for item, k, subtotal in items],
+                           live=[True] * len(items))
+        if row is not None and self.orders['item_count'][row] == len(items):
+            # Billing and status changes keep the item list: rewrite in place.
+            start = self.orders['item_start'][row]
+            for name, value in item_values.items():
+                self.items.columns[name][start:start + len(items)] = value
+        else:
+            if row is not None:
+                self._retire_items(row)
+            start = self.items.extend(**item_values)
+        values = dict(day=[day], month=[month], customer=[customer], revenue=[float(total or 0)], kg=[sum(kg)],
+                      item_start=[start], item_count=[len(items)], live=[True])
+        if row is None:
+            self.order_rows[order_id] = self.orders.extend(**values)
+        else:
+            for name, value in values.items():
+                self.orders.columns[name][row] = value[0]
+        self._touch(day)
+
+    def _retire_items(self, row):
+        start, count = self.orders['item_start'][row], self.orders['item_count'][row]
+        self.items.columns['live'][start:start + count] = False
+
+    def _touch(self, day):
+        for key in [key for key in self._cache if key[1] <= day <= key[2]]:
+            del self._cache[key]
+
+    def summarize(self, by, date_from, date_to):
+        # Returns (label, orders, kg, revenue) rows; for the item breakdown
+        # the order count is the number of orders with that item.
+        if by not in GROUPINGS:
+            raise ValueError(f"Unknown grouping: {by}")
+        key = (by, day_number(date_from), day_number(date_to))
+        with self._lock:
+            if not self.ready:
+                raise RuntimeError("Analytics are not built yet")
+            rows = self._cache.get(key)
+            if rows is None:
+                rows = self._cache[key] = self._summarize(*key)
+            return rows
+
+    def _summarize(self, by, first, last):
+        table = self.items if by == 'item' else self.orders
+        days = table['day']
+        mask = table['live'] & (days >= first) & (days <= last)
+        days = days[mask]
+        if by == 'day':
+            codes, offset = days - first, first
+        elif by == 'week':
+            # Day 0 was a Thursday; weeks start on Monday.
+            weeks = (days + 3) // 7
+            offset = (first + 3) // 7
+            codes = weeks - offset
+        elif by == 'month':
+            offset = int(month_of([first])[0])
+            codes = table['month'][mask] - offset
+        elif by == 'item':
+            codes, offset = table['item'][mask].astype(np.int64), 0
+        else:
+            codes, offset = table['customer'][mask], 0
+        counts = np.bincount(codes, minlength=1)
+        if by == 'item':
+            # An order with two lines of one item type counts once.
+            pairs = np.unique(table['order'][mask] * len(ITEM_TYPES) + codes)
+            counts = np.bincount(pairs % len(ITEM_TYPES), minlength=len(counts))
+        kg = np.bincount(codes, weights=table['kg'][mask], minlength=1)
+        revenue = np.bincount(codes, weights=table['revenue'][mask], minlength=1)
+        return [(self._label(by, code + offset), int(counts[code]), round(float(kg[code]), 2),
+                 round(float(revenue[code]), 2))
+                for code in np.flatnonzero(counts)]
+
+    def _label(self, by, code):
+        if by == 'day':
+            return day_label(code)
+        if by == 'week':
+            return day_label(code * 7 - 3)
+        if by == 'month':
+            return str(np.datetime64(int(code), 'M'))
+        if by == 'item':
+            return ITEM_TYPES[code]
+        return self.customers[code]
+
+    def year_over_year(self, year):
+        # (month, last year's row, this year's row), months as "01".."12".
+        previous = {label[5:]: row for label, *row in self.summarize('month', f"{year - 1}-01-01", f"{year - 1}-12-31")}
+        current = {label[5:]: row for label, *row in self.summarize('month', f"{year}-01-01", f"{year}-12-31")}
+        empty = [0, 0.0, 0.0]
+        return [(month, previous.get(month, empty), current.get(month, empty))
+                for month in sorted(set(previous) | set(current))]
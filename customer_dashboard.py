@@ -24,8 +24,9 @@ class CustomerDashboard(BaseDashboard):
         self.calendar_widget.selectionChanged.connect(self.update_date_dropdown)
         self.calendar_dialog = None
         self.cart_items = []
+        self.status_table = None
         self.init_sidebar()
-        self.dm.order_updated.connect(lambda: self.refresh_active_view(['status']))
+        self.watch_changes(data_manager)
         self.show_screen('order', self.create_order_laundry_screen)
 
     def init_sidebar(self):
@@ -71,14 +72,31 @@ class CustomerDashboard(BaseDashboard):
 
         self.main_h_layout.addWidget(sidebar, 0, Qt.AlignLeft)
 
-    def refresh_active_view(self, keys):
+    def refresh_screen(self, screen_key):
+        if screen_key == 'status':
+            self.populate_status_table()
+
+    def apply_changes(self, batch):
         try:
-            current_key = next((k for k, btn in self.buttons.items() if 'ffcdd2' in btn.styleSheet()), None)
-            if current_key in keys:
-                if current_key == 'status':
-                    self.show_screen('status', self.create_order_view_screen)
+            if 'orders' in batch.reloads or batch.touches('order'):
+                self.mark_stale(['status'])
+            if self.active_screen() != 'status':
+                return
+            rows = {self.status_table.item(row, 0).text(): row for row in range(self.status_table.rowCount())}
+            if 'orders' in batch.reloads or any(order_id in rows for order_id in batch.removed['order']):
+                self.refresh_active_view(['status'])
+                return
+            for order_id in list(batch.changed['order']) + list(batch.added['order']):
+                order = self.dm.orders.get(order_id)
+                if not order or order['User Email'] != self.user_data['email_address']:
+                    continue
+                row = rows.get(order_id)
+                if row is None:
+                    row = self.status_table.rowCount()
+                    self.status_table.insertRow(row)
+                self.set_status_row(row, order)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to refresh view: {str(e)}")
+            QMessageBox.critical(self, "Error", f"Failed to update order rows: {str(e)}")
 
     def create_order_laundry_screen(self):
         container = QWidget()
@@ -390,45 +408,51 @@ class CustomerDashboard(BaseDashboard):
         layout.addWidget(self.create_title_bar("Order Status", "#81d4fa", "#01579b"))
         layout.addSpacing(15)
 
-        order_table = QTableWidget()
+        self.status_table = QTableWidget()
         headers = ["Order ID", "Items", "Total", "Status", "Order Date"]
-        order_table.setColumnCount(len(headers))
-        order_table.setHorizontalHeaderLabels(headers)
-        order_table.setFont(QFont('Arial', 9))
-        header = order_table.horizontalHeader()
+        self.status_table.setColumnCount(len(headers))
+        self.status_table.setHorizontalHeaderLabels(headers)
+        self.status_table.setFont(QFont('Arial', 9))
+        header = self.status_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
+        self.populate_status_table()
+
+        layout.addWidget(self.status_table)
+        layout.addStretch()
+        return container
+
+    def populate_status_table(self):
         try:
-            user_orders = [o for o in self.dm.orders if o['User Email'] == self.user_data['email_address']]
-            order_table.setRowCount(len(user_orders))
+            user_orders = self.dm.orders.for_customer(self.user_data['email_address'])
+            self.status_table.setRowCount(len(user_orders))
             for row, order in enumerate(user_orders):
-                item = QTableWidgetItem(order['Order ID'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.ItemIsEnabled)  # View-only
-                order_table.setItem(row, 0, item)
-                items_str = ", ".join([i['item'] for i in order['items']])
-                item = QTableWidgetItem(items_str)
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.ItemIsEnabled)  # View-only
-                order_table.setItem(row, 1, item)
-                item = QTableWidgetItem(f"₱{order['Total']:.2f}" if order['Total'] is not None else '-')
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.ItemIsEnabled)  # View-only
-                order_table.setItem(row, 2, item)
-                item = QTableWidgetItem(order['Status'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.ItemIsEnabled)  # View-only
-                self.set_status_color(item, order['Status'])
-                order_table.setItem(row, 3, item)
-                item = QTableWidgetItem(order['Order Date'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.ItemIsEnabled)  # View-only
-                order_table.setItem(row, 4, item)
+                self.set_status_row(row, order)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to populate orders: {str(e)}")
 
-        layout.addWidget(order_table)
-        layout.addStretch()
-        return container
+    def set_status_row(self, row, order):
+        item = QTableWidgetItem(order['Order ID'])
+        item.setFont(QFont('Arial', 9))
+        item.setFlags(Qt.ItemIsEnabled)  # View-only
+        self.status_table.setItem(row, 0, item)
+        items_str = ", ".join([i['item'] for i in order['items']])
+        item = QTableWidgetItem(items_str)
+        item.setFont(QFont('Arial', 9))
+        item.setFlags(Qt.ItemIsEnabled)  # View-only
+        self.status_table.setItem(row, 1, item)
+        item = QTableWidgetItem(f"₱{order['Total']:.2f}" if order['Total'] is not None else '-')
+        item.setFont(QFont('Arial', 9))
+        item.setFlags(Qt.ItemIsEnabled)  # View-only
+        self.status_table.setItem(row, 2, item)
+        item = QTableWidgetItem(order['Status'])
+        item.setFont(QFont('Arial', 9))
+        item.setFlags(Qt.ItemIsEnabled)  # View-only
+        self.set_status_color(item, order['Status'])
+        self.status_table.setItem(row, 3, item)
+        item = QTableWidgetItem(order['Order Date'])
+        item.setFont(QFont('Arial', 9))
+        item.setFlags(Qt.ItemIsEnabled)  # View-only
+        self.status_table.setItem(row, 4, item)
 
     def set_status_color(self, item, status):
         colors = {
@@ -1,9 +1,10 @@
+import os
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QMainWindow, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QMessageBox, QLineEdit
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 
 # Import all modules
@@ -69,13 +70,13 @@ class LoginScreen(QWidget):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
-        login_btn = QPushButton("Login")
-        login_btn.setFixedSize(120, 30)
-        login_btn.setFont(QFont('Arial', 10))
-        login_btn.setStyleSheet(
+        self.login_btn = QPushButton("Login")
+        self.login_btn.setFixedSize(120, 30)
+        self.login_btn.setFont(QFont('Arial', 10))
+        self.login_btn.setStyleSheet(
             "background-color: #0288d1; color: white; border-radius: 4px; border: none;")
-        login_btn.clicked.connect(self.attempt_login)
-        button_layout.addWidget(login_btn)
+        self.login_btn.clicked.connect(self.attempt_login)
+        button_layout.addWidget(self.login_btn)
 
         button_layout.addStretch()
         main_layout.addLayout(button_layout)
@@ -88,21 +89,63 @@ class LoginScreen(QWidget):
         register_label.setStyleSheet("color: #555555;")
         main_layout.addWidget(register_label)
 
-        register_btn = QPushButton("Register")
-        register_btn.setFixedSize(120, 30)
-        register_btn.setFont(QFont('Arial', 10))
-        register_btn.setStyleSheet(
+        self.register_btn = QPushButton("Register")
+        self.register_btn.setFixedSize(120, 30)
+        self.register_btn.setFont(QFont('Arial', 10))
+        self.register_btn.setStyleSheet(
             "background-color: #4CAF50; color: white; border-radius: 4px; border: none;")
-        register_btn.clicked.connect(self.open_registration)
+        self.register_btn.clicked.connect(self.open_registration)
         register_h_layout = QHBoxLayout()
         register_h_layout.addStretch()
-        register_h_layout.addWidget(register_btn)
+        register_h_layout.addWidget(self.register_btn)
         register_h_layout.addStretch()
         main_layout.addLayout(register_h_layout)
+        main_layout.addSpacing(10)
+
+        # Loading status
+        self.status_label = QLabel("")
+        self.status_label.setFont(QFont('Arial', 9))
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("color: #888888;")
+        main_layout.addWidget(self.status_label)
 
         main_layout.addStretch()
         self.setStyleSheet("background-color: #f5f5f5;")
 
+        if DATA_MANAGER.users_ready.is_set():
+            self.on_users_loaded()
+        else:
+            self.login_btn.setEnabled(False)
+            self.register_btn.setEnabled(False)
+            self.status_label.setText("Loading accounts...")
+            DATA_MANAGER.loading_progress.connect(self.on_loading_progress)
+            DATA_MANAGER.users_loaded.connect(self.on_users_loaded)
+            DATA_MANAGER.loading_failed.connect(self.on_loading_failed)
+
+    def on_loading_progress(self, message, percent):
+        if not DATA_MANAGER.users_ready.is_set():
+            self.status_label.setText(f"{message}... {percent}%")
+
+    def on_users_loaded(self):
+        self.release_loading_signals()
+        self.login_btn.setEnabled(True)
+        self.register_btn.setEnabled(True)
+        self.status_label.setText("")
+
+    def on_loading_failed(self, error):
+        self.on_users_loaded()
+        self.status_label.setText(f"Failed to load data: {error}")
+
+    def release_loading_signals(self):
+        # Loading finishes once; later login screens never connect.
+        for signal, slot in ((DATA_MANAGER.loading_progress, self.on_loading_progress),
+                             (DATA_MANAGER.users_loaded, self.on_users_loaded),
+                             (DATA_MANAGER.loading_failed, self.on_loading_failed)):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+
     def open_registration(self):
         try:
             reg_dialog = RegistrationDialog(DATA_MANAGER, self)
@@ -119,6 +162,10 @@ class LoginScreen(QWidget):
                 QMessageBox.warning(self, "Error", "Please enter both email and password.")
                 return
 
+            if not DATA_MANAGER.users_ready.is_set():
+                QMessageBox.warning(self, "Please Wait", "User accounts are still loading.")
+                return
+
             role, user_data = DATA_MANAGER.get_user(email)
 
             if user_data and DATA_MANAGER.verify_password(password, user_data['password']):
@@ -146,8 +193,14 @@ class WashDeskManager(QMainWindow):
         self.stack_layout = QVBoxLayout(self.central_widget)
         self.stack_layout.setContentsMargins(0, 0, 0, 0)
 
+        DATA_MANAGER.write_failed.connect(self.on_write_failed)
         self.switch_to_login()
 
+    def on_write_failed(self, description, error):
+        QMessageBox.warning(self.current_dashboard or self, "Save Failed",
+                            f"A change could not be saved ({description}):\n{error}\n\n"
+                            "It has been reloaded from the database; please try again.")
+
     def clear_screen(self):
         while self.stack_layout.count():
             item = self.stack_layout.takeAt(0)
@@ -158,9 +211,10 @@ class WashDeskManager(QMainWindow):
     def switch_to_login(self):
         try:
             self.clear_screen()
-            if self.current_dashboard:
-                self.current_dashboard.close()
-                self.current_dashboard = None
+            dashboard, self.current_dashboard = self.current_dashboard, None
+            if dashboard:
+                dashboard.closed.disconnect(self.on_dashboard_closed)
+                dashboard.close()
 
             self.login_screen = LoginScreen(self)
             self.stack_layout.addWidget(self.login_screen)
@@ -171,6 +225,7 @@ class WashDeskManager(QMainWindow):
     def switch_to_dashboard(self, role, user_data):
         try:
             self.hide()
+            DATA_MANAGER.hydrate_for(role, user_data.get('email_address'))
             if role == 'Customer':
                 dashboard = CustomerDashboard(user_data, DATA_MANAGER)
             elif role == 'Staff':
@@ -178,12 +233,16 @@ class WashDeskManager(QMainWindow):
             elif role == 'Admin':
                 dashboard = AdminDashboard(DATA_MANAGER)
 
-            dashboard.closeEvent = lambda event: self.switch_to_login()
+            dashboard.closed.connect(self.on_dashboard_closed)
             self.current_dashboard = dashboard
             dashboard.show()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to switch to dashboard: {str(e)}")
 
+    def on_dashboard_closed(self):
+        self.current_dashboard = None
+        self.switch_to_login()
+
 
 if __name__ == '__main__':
     try:
@@ -193,7 +252,11 @@ if __name__ == '__main__':
             app = QApplication.instance()
 
         app.setFont(QFont('Arial', 10))
+        app.aboutToQuit.connect(DATA_MANAGER.close)
+        # Write-behind is opt-in: saves return before they reach the database.
+        DATA_MANAGER.write_behind = os.environ.get('WASHDESK_WRITE_BEHIND') == '1'
         manager = WashDeskManager()
+        QTimer.singleShot(0, DATA_MANAGER.start_loading)
         sys.exit(app.exec_())
     except Exception as e:
         print(f"Application failed to start: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,101 @@
+import sys
+from collections.abc import MutableMapping
+
+
+class Record(MutableMapping):
+    # A slotted row that reads and writes like the dict it replaces, under
+    # the same keys. Values of INTERNED keys (emails, statuses, dates, item
+    # names) share one string object across all rows.
+    __slots__ = ()
+    KEYS = ()
+    SLOTS = {}
+    INTERNED = frozenset()
+
+    def __init__(self, *values):
+        for key, slot, value in zip(self.KEYS, self.__slots__, values):
+            if key in self.INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            object.__setattr__(self, slot, value)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*(data.get(key) for key in cls.KEYS))
+
+    def __getitem__(self, key):
+        slot = self.SLOTS.get(key)
+        if slot is None:
+            raise KeyError(key)
+        return getattr(self, slot)
+
+    def __setitem__(self, key, value):
+        slot = self.SLOTS.get(key)
+        if slot is None:
+            raise KeyError(key)
+        if key in self.INTERNED and isinstance(value, str):
+            value = sys.intern(value)
+        setattr(self, slot, value)
+
+    def __delitem__(self, key):
+        raise TypeError(f"{type(self).__name__} fields cannot be deleted")
+
+    def __contains__(self, key):
+        return key in self.SLOTS
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def footprint(self):
+        # Approximate bytes owned by this row; interned strings are shared
+        # and not counted.
+        size = sys.getsizeof(self)
+        for key, slot in self.SLOTS.items():
+            value = getattr(self, slot)
+            if isinstance(value, list):
+                size += sys.getsizeof(value) + sum(item.footprint() for item in value)
+            elif value is not None and key not in self.INTERNED:
+                size += sys.getsizeof(value)
+        return size
+
+    def copy(self):
+        return type(self)(*(getattr(self, slot) for slot in self.__slots__))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class ItemRecord(Record):
+    __slots__ = ('id', 'item', 'price_per_kg', 'actual_kg', 'subtotal')
+    KEYS = ('id', 'item', 'price_per_kg', 'actual_kg', 'subtotal')
+    SLOTS = dict(zip(KEYS, __slots__))
+    INTERNED = frozenset(['item'])
+
+
+class OrderRecord(Record):
+    # 'items' is a Mapping method, so that key lives in order_items.
+    __slots__ = ('order_id', 'user_email', 'total', 'status', 'order_date', 'order_items')
+    KEYS = ('Order ID', 'User Email', 'Total', 'Status', 'Order Date', 'items')
+    SLOTS = dict(zip(KEYS, __slots__))
+    INTERNED = frozenset(['User Email', 'Status', 'Order Date'])
+
+    @classmethod
+    def from_dict(cls, data):
+        order = super().from_dict(data)
+        order.order_items = [item if isinstance(item, ItemRecord) else ItemRecord.from_dict(item)
+                             for item in order.order_items or []]
+        return order
+
+
+class ScheduleRecord(Record):
+    __slots__ = ('id', 'user_email', 'type', 'date', 'time', 'address', 'email', 'status')
+    KEYS = ('ID', 'User Email', 'Type', 'Date', 'Time', 'Address', 'Email', 'Status')
+    SLOTS = dict(zip(KEYS, __slots__))
+    INTERNED = frozenset(['User Email', 'Type', 'Date', 'Time', 'Email', 'Status'])
+
+
+class UserRecord(Record):
+    __slots__ = ('id', 'fullname', 'password', 'contact_info', 'email_address', 'home_address')
+    KEYS = ('id', 'fullname', 'password', 'contact_info', 'email_address', 'home_address')
+    SLOTS = dict(zip(KEYS, __slots__))
@@ -5,6 +5,8 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QDate
 from PyQt5.QtGui import QFont, QColor
+from data_tasks import AsyncDataManager
+from order_table import OrderTableModel, OrderTableView
 from ui_helpers import BaseDashboard
 
 
@@ -12,9 +14,14 @@ class StaffDashboard(BaseDashboard):
     def __init__(self, data_manager, parent_app=None):
         super().__init__("Staff Dashboard", parent_app)
         self.dm = data_manager
+        self.tasks = AsyncDataManager(data_manager)
         self.order_table = None
+        self.order_model = None
+        self.pickup_table = None
+        self.pickup_filter_combo = None
+        self.report_fields = {}
         self.init_sidebar()
-        self.dm.order_updated.connect(lambda: self.refresh_active_view(['view_orders', 'manage_pickup', 'report']))
+        self.watch_changes(data_manager)
         self.show_screen('view_orders', self.create_view_orders_screen)
 
     def init_sidebar(self):
@@ -56,19 +63,70 @@ class StaffDashboard(BaseDashboard):
 
         self.main_h_layout.addWidget(sidebar)
 
-    def refresh_active_view(self, keys):
+    def refresh_screen(self, screen_key):
+        if screen_key == 'view_orders':
+            self.populate_order_table(self.order_table)
+        elif screen_key == 'manage_pickup':
+            self.populate_pickup_table(self.pickup_table, self.pickup_filter_combo)
+        elif screen_key == 'report':
+            self.reload_daily_totals()
+
+    def apply_changes(self, batch):
         try:
-            current_key = next((k for k, btn in self.buttons.items() if 'ffcdd2' in btn.styleSheet()), None)
-            if current_key in keys:
-                if current_key == 'view_orders':
-                    self.show_screen('view_orders', self.create_view_orders_screen)
-                elif current_key == 'manage_pickup':
-                    self.show_screen('manage_pickup', self.create_manage_pickup_screen)
-                elif current_key == 'report':
-                    self.show_screen('report', self.create_daily_report_screen)
+            screen = self.active_screen()
+            if 'orders' in batch.reloads:
+                self.refresh_active_view([screen])
+            elif screen == 'view_orders':
+                self.apply_order_changes(batch)
+            elif screen == 'manage_pickup':
+                self.apply_pickup_changes(batch)
+            elif screen == 'report' and self.report_changed(batch):
+                self.reload_daily_totals()
+            if batch:
+                self.mark_stale(['view_orders', 'manage_pickup', 'report'])
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh view: {str(e)}")
 
+    def apply_order_changes(self, batch):
+        for order_id in list(batch.removed['order']) + list(batch.evicted['order']):
+            self.order_model.remove_order(order_id)
+        for order_id in list(batch.added['order']) + list(batch.changed['order']):
+            order = self.dm.orders.get(order_id)
+            if order is None:
+                self.order_model.remove_order(order_id)
+            else:
+                self.order_model.upsert_order(order)
+
+    def apply_pickup_changes(self, batch):
+        rows = {self.pickup_table.item(row, 0).text(): row for row in range(self.pickup_table.rowCount())}
+        stale = []
+        appended = []
+        for schedule_id in batch.removed['schedule']:
+            if str(schedule_id) in rows:
+                stale.append(rows[str(schedule_id)])
+        for schedule_id in list(batch.changed['schedule']) + list(batch.added['schedule']):
+            schedule = self.dm.schedules.get(schedule_id)
+            visible = schedule is not None and self.schedule_matches_filter(schedule)
+            row = rows.get(str(schedule_id))
+            if row is None:
+                if visible:
+                    appended.append(schedule)
+            elif visible:
+                self.set_pickup_row(self.pickup_table, row, schedule)
+            else:
+                stale.append(row)
+        for row in sorted(stale, reverse=True):
+            self.pickup_table.removeRow(row)
+        for schedule in appended:
+            row = self.pickup_table.rowCount()
+            self.pickup_table.insertRow(row)
+            self.set_pickup_row(self.pickup_table, row, schedule)
+
+    def report_changed(self, batch):
+        return bool(batch.added['order'] or batch.removed['order'] or
+                    batch.added['schedule'] or batch.removed['schedule'] or
+                    any(fields is None or 'Total' in fields for fields in batch.changed['order'].values()))
+
     def create_view_orders_screen(self):
         container = QWidget()
         layout = QVBoxLayout(container)
@@ -76,15 +134,10 @@ class StaffDashboard(BaseDashboard):
         layout.addWidget(self.create_title_bar("All Laundry Orders", "#b2ff59", "#33691e"))
         layout.addSpacing(15)
 
-        self.order_table = QTableWidget()
-        headers = ["Order ID", "User Email", "Items", "Total", "Status", "Actions"]
-        self.order_table.setColumnCount(len(headers))
-        self.order_table.setHorizontalHeaderLabels(headers)
-        self.order_table.setFont(QFont('Arial', 9))
-        header = self.order_table.horizontalHeader()
-        for i in range(len(headers) - 1):
-            header.setSectionResizeMode(i, QHeaderView.Stretch)
-        header.setSectionResizeMode(len(headers) - 1, QHeaderView.ResizeToContents)
+        self.order_model = OrderTableModel()
+        self.order_model.status_change_requested.connect(self.on_status_changed)
+        self.order_table = OrderTableView(self.order_model)
+        self.order_table.billing_requested.connect(self.open_billing_dialog)
         self.populate_order_table(self.order_table)
         layout.addWidget(self.order_table)
         layout.addStretch()
@@ -92,53 +145,7 @@ class StaffDashboard(BaseDashboard):
 
     def populate_order_table(self, order_table):
         try:
-            order_table.setRowCount(0)
-            if not self.dm.orders:
-                return
-            order_table.setRowCount(len(self.dm.orders))
-            for row, order in enumerate(self.dm.orders):
-                item = QTableWidgetItem(order['Order ID'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                order_table.setItem(row, 0, item)
-                item = QTableWidgetItem(order['User Email'])
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                order_table.setItem(row, 1, item)
-                items_str = ", ".join([i['item'] for i in order['items']])
-                item = QTableWidgetItem(items_str)
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                order_table.setItem(row, 2, item)
-                item = QTableWidgetItem(f"₱{order['Total']:.2f}" if order['Total'] is not None else '-')
-                item.setFont(QFont('Arial', 9))
-                item.setFlags(Qt.NoItemFlags)
-                order_table.setItem(row, 3, item)
-                status_combo = QComboBox()
-                status_combo.setFont(QFont('Arial', 9))
-                status_combo.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
-                status_combo.addItems([
-                    "Pending Pick-up", "Washing", "Drying", "Completed",
-                    "Ready for Pickup", "Ready for Delivery", "Cancelled"
-                ])
-                current_status = order['Status']
-                index = status_combo.findText(current_status)
-                if index >= 0:
-                    status_combo.setCurrentIndex(index)
-                status_combo.currentTextChanged.connect(lambda text, r=row: self.on_status_changed(r, text))
-                order_table.setCellWidget(row, 4, status_combo)
-                action_widget = QWidget()
-                action_layout = QHBoxLayout(action_widget)
-                action_layout.setContentsMargins(2, 2, 2, 2)
-                action_layout.setSpacing(5)
-                edit_btn = QPushButton("Edit Billing")
-                edit_btn.setFont(QFont('Arial', 8))
-                edit_btn.setFixedSize(100, 25)
-                edit_btn.setStyleSheet(
-                    "background-color: #81d4fa; color: #01579b; border-radius: 4px; border: none;")
-                edit_btn.clicked.connect(lambda checked=False, r=row: self.open_billing_dialog(r))
-                action_layout.addWidget(edit_btn)
-                order_table.setCellWidget(row, 5, action_widget)
+            order_table.model().set_orders(self.dm.orders)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to populate orders: {str(e)}")
 
@@ -154,38 +161,29 @@ class StaffDashboard(BaseDashboard):
         }
         item.setBackground(colors.get(status, QColor(255, 255, 255)))
 
-    def on_status_changed(self, row, new_status):
+    def on_status_changed(self, order_id, new_status):
         try:
-            order = self.dm.orders[row]
-            order_id = order['Order ID']
             if self.dm.update_order(order_id, {'Status': new_status}):
-                self.update_order_row(row)
+                self.update_order_row(order_id)
             else:
                 QMessageBox.critical(self, "Error", "Failed to update status")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Status update failed: {str(e)}")
 
-    def update_order_row(self, row):
+    def update_order_row(self, order_id):
         try:
-            if not self.order_table or row >= len(self.dm.orders):
+            if not self.order_table:
                 return
-            order = self.dm.orders[row]
-            total_item = QTableWidgetItem(f"₱{order['Total']:.2f}" if order['Total'] is not None else '-')
-            total_item.setFont(QFont('Arial', 9))
-            total_item.setFlags(Qt.NoItemFlags)
-            self.order_table.setItem(row, 3, total_item)
-            status_combo = self.order_table.cellWidget(row, 4)
-            status_combo.blockSignals(True)
-            index = status_combo.findText(order['Status'])
-            if index >= 0:
-                status_combo.setCurrentIndex(index)
-            status_combo.blockSignals(False)
+            self.order_model.refresh_order(order_id)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update order row: {str(e)}")
 
-    def open_billing_dialog(self, row):
+    def open_billing_dialog(self, order_id):
         try:
-            order = self.dm.orders[row]
+            order = self.dm.get_order(order_id)
+            if order is None:
+                QMessageBox.critical(self, "Error", f"Order {order_id} no longer exists.")
+                return
             dialog = QDialog(self)
             dialog.setWindowTitle(f"Edit Billing for Order {order['Order ID']}")
             dialog.setModal(True)
@@ -218,7 +216,7 @@ class StaffDashboard(BaseDashboard):
             save_btn.setFixedSize(120, 30)
             save_btn.setStyleSheet(
                 "background-color: #4CAF50; color: white; border-radius: 4px; border: none;")
-            save_btn.clicked.connect(lambda: self.save_billing_dialog(row, item_table, dialog))
+            save_btn.clicked.connect(lambda: self.save_billing_dialog(order_id, item_table, dialog))
             layout.addWidget(save_btn)
 
             dialog.exec_()
@@ -233,22 +231,13 @@ class StaffDashboard(BaseDashboard):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to calculate subtotal: {str(e)}")
 
-    def save_billing_dialog(self, row, table, dialog):
+    def save_billing_dialog(self, order_id, table, dialog):
         try:
-            order = self.dm.orders[row]
-            total = 0.0
-            for i in range(table.rowCount()):
-                item = order['items'][i]
-                actual_kg_widget = table.cellWidget(i, 2)
-                actual_kg = actual_kg_widget.value()
-                subtotal = actual_kg * item['price_per_kg']
-                self.dm.update_order_item(item['id'], actual_kg, subtotal)
-                item['actual_kg'] = actual_kg
-                item['subtotal'] = subtotal
-                total += subtotal
-            self.dm.update_order(order['Order ID'], {'Total': total})
-            order['Total'] = total
-            self.update_order_row(row)
+            weights = [table.cellWidget(i, 2).value() for i in range(table.rowCount())]
+            if not self.dm.save_billing(order_id, weights):
+                QMessageBox.critical(self, "Error", "Failed to save billing.")
+                return
+            self.update_order_row(order_id)
             dialog.accept()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save billing: {str(e)}")
@@ -261,19 +250,15 @@ class StaffDashboard(BaseDashboard):
         layout.addSpacing(30)
 
         try:
-            today = QDate.currentDate().toString("yyyy-MM-dd")
-            orders_today = [o for o in self.dm.orders if o['Order Date'] == today]
-            revenue_today = sum(o['Total'] for o in orders_today if o['Total'] is not None)
-            schedules_today = [s for s in self.dm.schedules if s['Date'] == QDate.currentDate().toString("MM/dd/yyyy")]
-
             report_data = {
-                "Orders Today:": len(orders_today),
-                "Revenue Today:": f"₱{revenue_today:.2f}",
-                "Schedules Today:": len(schedules_today)
+                "Orders Today:": "Loading...",
+                "Revenue Today:": "Loading...",
+                "Schedules Today:": "Loading..."
             }
 
             form_layout = QGridLayout()
             form_layout.setVerticalSpacing(20)
+            self.report_fields = {}
 
             for row, (label_text, value) in enumerate(report_data.items()):
                 label = QLabel(label_text)
@@ -285,17 +270,31 @@ class StaffDashboard(BaseDashboard):
                 value_display.setFixedHeight(30)
                 value_display.setReadOnly(True)
                 value_display.setStyleSheet("background-color: #e0e0e0; border: 1px solid #ccc; border-radius: 4px;")
+                self.report_fields[label_text] = value_display
 
                 form_layout.addWidget(label, row, 0)
                 form_layout.addWidget(value_display, row, 1)
 
             layout.addLayout(form_layout)
             layout.addStretch()
+            self.reload_daily_totals()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load report: {str(e)}")
 
         return container
 
+    def reload_daily_totals(self):
+        today = QDate.currentDate()
+        request = self.tasks.get_daily_totals(today.toString("yyyy-MM-dd"), today.toString("MM/dd/yyyy"))
+        self.start_request('report', request).then(
+            self.show_daily_totals,
+            lambda error: QMessageBox.critical(self, "Error", f"Failed to load report: {error}"))
+
+    def show_daily_totals(self, totals):
+        self.report_fields["Orders Today:"].setText(str(totals['orders']))
+        self.report_fields["Revenue Today:"].setText(f"₱{totals['revenue']:.2f}")
+        self.report_fields["Schedules Today:"].setText(str(totals['schedules']))
+
     def create_manage_pickup_screen(self):
         container = QWidget()
         layout = QVBoxLayout(container)
@@ -313,27 +312,27 @@ class StaffDashboard(BaseDashboard):
         filter_layout = QHBoxLayout()
         filter_label = QLabel("Filter by Status:")
         filter_label.setFont(QFont('Arial', 10))
-        pickup_filter_combo = QComboBox()
-        pickup_filter_combo.setFixedHeight(30)
-        pickup_filter_combo.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
-        pickup_filter_combo.addItems(["All", "Scheduled", "In Progress", "Completed", "Cancelled"])
-        pickup_filter_combo.currentIndexChanged.connect(
-            lambda: self.populate_pickup_table(pickup_table, pickup_filter_combo))
+        self.pickup_filter_combo = QComboBox()
+        self.pickup_filter_combo.setFixedHeight(30)
+        self.pickup_filter_combo.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
+        self.pickup_filter_combo.addItems(["All", "Scheduled", "In Progress", "Completed", "Cancelled"])
+        self.pickup_filter_combo.currentIndexChanged.connect(
+            lambda: self.populate_pickup_table(self.pickup_table, self.pickup_filter_combo))
 
         filter_layout.addWidget(filter_label)
-        filter_layout.addWidget(pickup_filter_combo)
+        filter_layout.addWidget(self.pickup_filter_combo)
         filter_layout.addStretch()
         layout.addLayout(filter_layout)
 
-        pickup_table = QTableWidget()
+        self.pickup_table = QTableWidget()
         headers = ["ID", "User Email", "Type", "Date", "Time", "Address", "Email", "Status"]
-        pickup_table.setColumnCount(len(headers))
-        pickup_table.setHorizontalHeaderLabels(headers)
-        pickup_table.setFont(QFont('Arial', 9))
-        header = pickup_table.horizontalHeader()
+        self.pickup_table.setColumnCount(len(headers))
+        self.pickup_table.setHorizontalHeaderLabels(headers)
+        self.pickup_table.setFont(QFont('Arial', 9))
+        header = self.pickup_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
-        self.populate_pickup_table(pickup_table, pickup_filter_combo)
-        layout.addWidget(pickup_table)
+        self.populate_pickup_table(self.pickup_table, self.pickup_filter_combo)
+        layout.addWidget(self.pickup_table)
         layout.addStretch()
 
         return container
@@ -347,20 +346,27 @@ class StaffDashboard(BaseDashboard):
             ]
             pickup_table.setRowCount(len(filtered_schedules))
             for row, schedule in enumerate(filtered_schedules):
-                items = [
-                    str(schedule['ID']),
-                    schedule['User Email'],
-                    schedule['Type'],
-                    schedule['Date'],
-                    schedule['Time'],
-                    schedule['Address'],
-                    schedule['Email'],
-                    schedule['Status']
-                ]
-                for col, item_text in enumerate(items):
-                    item = QTableWidgetItem(item_text)
-                    item.setFont(QFont('Arial', 9))
-                    item.setFlags(Qt.NoItemFlags)
-                    pickup_table.setItem(row, col, item)
+                self.set_pickup_row(pickup_table, row, schedule)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to populate pickup table: {str(e)}")
\ No newline at end of file
+            QMessageBox.critical(self, "Error", f"Failed to populate pickup table: {str(e)}")
+
+    def schedule_matches_filter(self, schedule):
+        selected_filter = self.pickup_filter_combo.currentText()
+        return selected_filter == "All" or schedule['Status'] == selected_filter
+
+    def set_pickup_row(self, pickup_table, row, schedule):
+        items = [
+            str(schedule['ID']),
+            schedule['User Email'],
+            schedule['Type'],
+            schedule['Date'],
+            schedule['Time'],
+            schedule['Address'],
+            schedule['Email'],
+            schedule['Status']
+        ]
+        for col, item_text in enumerate(items):
+            item = QTableWidgetItem(item_text)
+            item.setFont(QFont('Arial', 9))
+            item.setFlags(Qt.NoItemFlags)
+            pickup_table.setItem(row, col, item)
\ No newline at end of file
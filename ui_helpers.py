@@ -1,16 +1,21 @@
 from PyQt5.QtWidgets import (
     QWidget, QMainWindow, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QDialog, QFrame, QGridLayout, QMessageBox,
-    QHeaderView, QTableWidget, QTableWidgetItem, QComboBox
+    QHeaderView, QTableWidget, QTableWidgetItem, QComboBox, QStackedWidget
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
+from change_coalescer import ChangeCoalescer
 import re
 
 
 class BaseDashboard(QMainWindow):
+    closed = pyqtSignal()
+
     def __init__(self, title, parent=None):
         super().__init__(parent)
+        # Deleting the window on close also deletes its change subscriptions.
+        self.setAttribute(Qt.WA_DeleteOnClose)
         self.setWindowTitle(title)
         self.showMaximized()
         self.central_widget = QWidget()
@@ -18,8 +23,14 @@ class BaseDashboard(QMainWindow):
         self.main_h_layout = QHBoxLayout(self.central_widget)
         self.main_h_layout.setContentsMargins(0, 0, 0, 0)
         self.main_h_layout.setSpacing(0)
-        self.current_content = QWidget()
         self.buttons = {}
+        self.requests = {}
+        self.tasks = None
+        self.changes = None
+        # Built screens stay in the stack; stale ones refresh when shown again.
+        self.screens = {}
+        self.stale = set()
+        self.current_key = None
         self.init_content_area()
 
     def create_title_bar(self, title_text, bg_color, text_color):
@@ -48,10 +59,48 @@ class BaseDashboard(QMainWindow):
         self.content_stack = QVBoxLayout(self.content_widget)
         self.content_stack.setContentsMargins(40, 20, 40, 20)
         self.content_stack.setSpacing(15)
-        self.content_stack.addWidget(self.current_content)
+        self.screen_stack = QStackedWidget()
+        self.content_stack.addWidget(self.screen_stack)
         self.main_h_layout.addWidget(self.content_widget)
 
-    def show_screen(self, screen_key, content_creator):
+    def active_screen(self):
+        return self.current_key
+
+    def watch_changes(self, data_manager):
+        self.changes = ChangeCoalescer(data_manager, parent=self)
+        self.changes.changes_ready.connect(self.apply_changes)
+
+    def apply_changes(self, batch):
+        # Called with one merged ChangeBatch per coalescing window, so each
+        # distinct row needs touching only once.
+        pass
+
+    def release_subscriptions(self):
+        self.cancel_requests()
+        if self.tasks:
+            self.tasks.cancel_all()
+        if self.changes:
+            self.changes.close()
+
+    def closeEvent(self, event):
+        self.release_subscriptions()
+        super().closeEvent(event)
+        self.closed.emit()
+
+    def start_request(self, key, request):
+        # A newer request for the same slot replaces the one in flight.
+        previous = self.requests.pop(key, None)
+        if previous:
+            previous.cancel()
+        self.requests[key] = request
+        return request
+
+    def cancel_requests(self):
+        for request in self.requests.values():
+            request.cancel()
+        self.requests.clear()
+
+    def highlight_button(self, screen_key):
         for key, btn in self.buttons.items():
             btn.setStyleSheet(
                 "background-color: #ffcdd2; text-align: left; padding-left: 15px; border: none; border-radius: 4px;"
@@ -59,14 +108,42 @@ class BaseDashboard(QMainWindow):
                 "background-color: #e0e0e0; text-align: left; padding-left: 15px; border: none; border-radius: 4px;"
                 "color: #333333;"
             )
-        if self.current_content:
-            self.current_content.deleteLater()
+
+    def show_screen(self, screen_key, content_creator):
+        screen = self.screens.get(screen_key)
+        if screen is None:
+            try:
+                screen = content_creator()
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to load screen: {str(e)}")
+                return
+            self.screens[screen_key] = screen
+            self.screen_stack.addWidget(screen)
+            self.stale.discard(screen_key)
+        self.current_key = screen_key
+        self.highlight_button(screen_key)
+        self.screen_stack.setCurrentWidget(screen)
+        if screen_key in self.stale:
+            self.stale.discard(screen_key)
+            self.refresh_active_view([screen_key])
+
+    def mark_stale(self, keys):
+        for key in keys:
+            if key in self.screens and key != self.current_key:
+                self.stale.add(key)
+
+    def refresh_active_view(self, keys):
+        # The visible screen refreshes now, hidden cached screens when next shown.
+        self.mark_stale(keys)
+        if self.current_key not in keys:
+            return
         try:
-            new_content = content_creator()
-            self.current_content = new_content
-            self.content_stack.addWidget(self.current_content)
+            self.refresh_screen(self.current_key)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load screen: {str(e)}")
+            QMessageBox.critical(self, "Error", f"Failed to refresh view: {str(e)}")
+
+    def refresh_screen(self, screen_key):
+        pass
 
 
 class RegistrationDialog(QDialog):
@@ -175,10 +252,9 @@ class RegistrationDialog(QDialog):
                 return
 
             # Check for duplicate email
-            for r in self.dm.user_data:
-                if data['email'] in self.dm.user_data[r]:
-                    QMessageBox.critical(self, "Error", f"Email '{data['email']}' already exists.")
-                    return
+            if data['email'] in self.dm.users:
+                QMessageBox.critical(self, "Error", f"Email '{data['email']}' already exists.")
+                return
 
             # Attempt registration
             if self.dm.register_user(role, data):
@@ -0,0 +1,99 @@
+import queue
+import threading
+import time
+
+
+class WriteBehindQueue:
+    # Writes arriving within GROUP_WINDOW seconds of each other share one
+    # transaction, up to GROUP_SIZE writes per commit.
+    GROUP_SIZE = 50
+    GROUP_WINDOW = 0.005
+
+    def __init__(self, engine, on_failure, group_size=GROUP_SIZE, group_window=GROUP_WINDOW):
+        self.engine = engine
+        self.on_failure = on_failure
+        self.group_size = group_size
+        self.group_window = group_window
+        self._jobs = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='WriteBehind', daemon=True)
+        self._thread.start()
+
+    def submit(self, description, write, reconcile=None, committed=None):
+        # reconcile() is handed to on_failure if the write cannot be saved;
+        # committed(result) runs with write's return value once it is.
+        if self._closed:
+            raise RuntimeError("Write queue is closed")
+        self._jobs.put((description, write, reconcile, committed))
+
+    def pending(self):
+        return self._jobs.unfinished_tasks
+
+    def flush(self):
+        self._jobs.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _next_group(self):
+        group = [self._jobs.get()]
+        deadline = time.monotonic() + self.group_window
+        while group[-1] is not None and len(group) < self.group_size:
+            try:
+                group.append(self._jobs.get(timeout=max(0, deadline - time.monotonic())))
+            except queue.Empty:
+                break
+        return group
+
+    def _run(self):
+        while True:
+            group = self._next_group()
+            jobs = [job for job in group if job is not None]
+            try:
+                if jobs:
+                    self._commit(jobs)
+            finally:
+                for _ in group:
+                    self._jobs.task_done()
+            if group[-1] is None:
+                return
+
+    def _commit(self, jobs):
+        try:
+            with self.engine.transaction() as cursor:
+                results = [write(cursor) for description, write, reconcile, committed in jobs]
+        except Exception as err:
+            if len(jobs) == 1:
+                self._report(jobs[0], err)
+                return
+        else:
+            for job, result in zip(jobs, results):
+                self._committed(job, result)
+            return
+        # Replay one by one so a single bad write does not drop the rest.
+        for job in jobs:
+            description, write, reconcile, committed = job
+            try:
+                with self.engine.transaction() as cursor:
+                    result = write(cursor)
+            except Exception as err:
+                self._report(job, err)
+            else:
+                self._committed(job, result)
+
+    def _committed(self, job, result):
+        description, write, reconcile, committed = job
+        if committed:
+            try:
+                committed(result)
+            except Exception as err:
+                print(f"✗ After-commit step failed ({description}): {err}")
+
+    def _report(self, job, err):
+        description, write, reconcile, committed = job
+        print(f"✗ Background write failed ({description}): {err}")
+        self.on_failure(description, str(err), reconcile)